@@ -0,0 +1,231 @@
+"""Benchmark cases covering the ``price`` method of every model.
+
+Each model gets a ``small`` and a ``large`` parameter set.  For the Monte
+Carlo and PDE models these differ in ``n_paths``, ``num_obs``/``n_steps`` or
+``n_time``/``n_space``; for closed-form models the large case prices a batch
+of trades through ``price_batch``.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+import numpy as np
+
+from derivatives import models
+
+#: Number of trades priced by the ``large`` case of closed-form models.
+BATCH_SIZE = 10_000
+
+
+@dataclass
+class Case:
+    """A single benchmark: ``model`` priced with ``params`` under ``size``."""
+
+    model: str
+    size: str
+    params: dict[str, Any]
+    init: dict[str, Any] = field(default_factory=dict)
+    batch: bool = False
+
+    @property
+    def name(self) -> str:
+        return f"{self.model}[{self.size}]"
+
+    def callable(self) -> Callable[[], Any]:
+        """Return a zero-argument function running the benchmark once."""
+
+        model = getattr(models, self.model)(**self.init)
+        if self.batch:
+            return lambda: model.price_batch(self.params)
+        return lambda: model.price(**self.params)
+
+
+def _batch(**columns: Any) -> dict[str, Any]:
+    """Broadcast scalar columns into arrays of ``BATCH_SIZE`` trades."""
+
+    rng = np.random.default_rng(0)
+    jitter = rng.uniform(0.9, 1.1, BATCH_SIZE)
+    return {
+        name: value * jitter if isinstance(value, float) else np.full(BATCH_SIZE, value)
+        for name, value in columns.items()
+    }
+
+
+def _closed_form(model: str, init: dict[str, Any] | None = None, **params: Any) -> list[Case]:
+    init = init or {}
+    return [
+        Case(model, "small", params, init),
+        Case(model, "large", _batch(**params), init, batch=True),
+    ]
+
+
+_OPTION = dict(spot=100.0, strike=100.0, rate=0.05, vol=0.2, maturity=1.0)
+
+CASES: list[Case] = [
+    *_closed_form("ConstantDebtToEquity", equity_price=100.0, debt_to_equity_ratio=0.5),
+    Case(
+        "CreditBasketLinear",
+        "small",
+        dict(
+            notionals=[1e6] * 100,
+            default_probabilities=[0.02] * 100,
+            recovery_rates=[0.4] * 100,
+        ),
+    ),
+    Case(
+        "CreditBasketLinear",
+        "large",
+        dict(
+            notionals=np.full(100_000, 1e6),
+            default_probabilities=np.full(100_000, 0.02),
+            recovery_rates=np.full(100_000, 0.4),
+        ),
+    ),
+    *_closed_form(
+        "HazardCurve",
+        init=dict(times=[1.0, 3.0, 5.0, 7.0, 10.0], hazard_rates=[0.01, 0.015, 0.027, 0.025, 0.024]),
+        time=6.0,
+    ),
+    *_closed_form("ZeroCoupon", face_value=100.0, discount_rate=0.05, maturity=10.0),
+    *_closed_form(
+        "DiscountCurve",
+        init=dict(
+            times=[0.25, 0.5, 1.0, 2.0, 5.0, 10.0, 30.0],
+            rates=[0.030, 0.032, 0.035, 0.037, 0.040, 0.042, 0.045],
+            interpolation="monotone-convex",
+        ),
+        time=7.5,
+    ),
+    *_closed_form(
+        "PriceCurve",
+        init=dict(times=[0.0, 0.5, 1.0, 2.0, 5.0], prices=[80.0, 82.0, 85.0, 86.0, 90.0]),
+        time=1.5,
+    ),
+    Case("CommodityAsianOption", "small", dict(_OPTION, num_obs=252)),
+    Case(
+        "CommodityAsianOption",
+        "large",
+        dict(_OPTION, num_obs=252, n_paths=100_000, seed=1, method="monte-carlo"),
+    ),
+    *_closed_form(
+        "StaticHazardRateModel", notional=1e6, hazard_rate=0.02, maturity=5.0, discount_rate=0.05
+    ),
+    *_closed_form(
+        "SyntheticUnderlyingForward",
+        spot_price=100.0,
+        risk_free_rate=0.05,
+        dividend_yield=0.02,
+        time_to_maturity=1.0,
+    ),
+    Case(
+        "TheoreticalDividendFutures",
+        "small",
+        dict(
+            dividends=[(0.25 * i, 1.0) for i in range(1, 5)],
+            risk_free_rate=0.05,
+            time_to_maturity=1.0,
+        ),
+    ),
+    Case(
+        "TheoreticalDividendFutures",
+        "large",
+        dict(
+            dividends=[(0.01 * i, 1.0) for i in range(1, 1_001)],
+            risk_free_rate=0.05,
+            time_to_maturity=10.0,
+        ),
+    ),
+    *_closed_form("UnderlyingSpot", spot_price=100.0),
+    Case("AsianArithmeticFixMM", "small", dict(_OPTION, num_obs=12, n_paths=10_000, seed=1)),
+    Case("AsianArithmeticFixMM", "large", dict(_OPTION, num_obs=252, n_paths=100_000, seed=1)),
+    *_closed_form(
+        "TheoreticalSimpleDividendOption",
+        expected_dividend=3.0,
+        strike=2.8,
+        rate=0.05,
+        vol=0.3,
+        maturity=2.0,
+    ),
+    *_closed_form(
+        "TotalReturnSwap",
+        spot_price=100.0,
+        expected_terminal_price=105.0,
+        funding_rate=0.05,
+        dividend_yield=0.02,
+        time_to_maturity=1.0,
+    ),
+    *_closed_form(
+        "QEDIVariableStrikeWarrant",
+        spot=100.0,
+        strike_ratio=1.05,
+        rate=0.05,
+        vol=0.25,
+        maturity=1.5,
+    ),
+    Case("BarrierContinuousAnalytic", "small", dict(_OPTION, barrier=90.0)),
+    Case(
+        "BarrierContinuousAnalytic",
+        "large",
+        dict(
+            _OPTION,
+            barrier=90.0,
+            method="monte-carlo",
+            n_steps=20,
+            n_paths=100_000,
+            seed=1,
+        ),
+    ),
+    Case(
+        "DiscretisedBarrier",
+        "small",
+        dict(_OPTION, barrier=90.0, monitoring_times=12, n_paths=10_000, seed=1),
+    ),
+    Case(
+        "DiscretisedBarrier",
+        "large",
+        dict(_OPTION, barrier=90.0, monitoring_times=252, n_paths=100_000, seed=1),
+    ),
+    *_closed_form(
+        "IndexLinkedBondForward", notional=100.0, real_rate=0.02, maturity=5.0, index_ratio=1.2
+    ),
+    *_closed_form("FundInstrument", nav=10.0, units=1_000.0),
+    Case(
+        "CorporateBondModel",
+        "small",
+        dict(face_value=100, coupon_rate=0.05, yield_rate=0.06, maturity=5, frequency=2),
+    ),
+    Case(
+        "CorporateBondModel",
+        "large",
+        _batch(face_value=100.0, coupon_rate=0.05, yield_rate=0.06, maturity=30.0, frequency=12),
+        batch=True,
+    ),
+    *_closed_form(
+        "TheoreticalDividendNeutralFutures",
+        spot_price=100.0,
+        risk_free_rate=0.05,
+        time_to_maturity=1.0,
+    ),
+    Case("UDMCCliquetModel", "small", dict(returns=[0.01] * 12, cap=0.05, floor=-0.05)),
+    Case("UDMCCliquetModel", "large", dict(returns=[0.01] * 10_000, cap=0.05, floor=-0.05)),
+    *_closed_form(
+        "FullyFundedTRS",
+        spot_price=100.0,
+        expected_terminal_price=105.0,
+        funding_rate=0.05,
+        dividend_yield=0.02,
+        time_to_maturity=1.0,
+    ),
+    Case("FiniteDifference", "small", dict(_OPTION, n_time=100, n_space=100)),
+    Case(
+        "FiniteDifference",
+        "large",
+        dict(_OPTION, s_max=400.0, n_time=800, n_space=800, american=True),
+    ),
+    *_closed_form("SimpleTradeableDeposit", principal=100.0, rate=0.05, maturity=1.0),
+]
+
+#: Models that have no pricing logic and are therefore not benchmarked.
+UNIMPLEMENTED = {"DerivativeModel", "ConvexityAdjustedInterestRateFutures"}
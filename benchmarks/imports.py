@@ -0,0 +1,95 @@
+"""Time package imports in fresh interpreters.
+
+Usage::
+
+    python -m benchmarks.imports                   # run and compare
+    python -m benchmarks.imports --save-baseline   # record into the baseline
+
+Every statement is executed in a new ``python`` process so that nothing is
+already cached in ``sys.modules``; the best time over several repeats is
+recorded.  Results share the baseline file and regression threshold of
+:mod:`benchmarks.run`, under names of the form ``import[...]``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from .run import DEFAULT_BASELINE, compare, load_baseline, save_results
+
+#: Statements timed by the benchmark, from the lightest to the heaviest.
+IMPORTS = {
+    "derivatives": "import derivatives",
+    "deposit": "from derivatives.models import SimpleTradeableDeposit",
+    "zero-coupon": "from derivatives.models import ZeroCoupon",
+    "finite-difference": "from derivatives.models import FiniteDifference",
+    "all-models": "from derivatives.models import *",
+}
+
+_TIMER = "import time; start = time.perf_counter(); {statement}; print(time.perf_counter() - start)"
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def time_import(statement: str, repeat: int = 5) -> float:
+    """Return the best wall time in seconds of ``statement`` in a fresh interpreter."""
+
+    path = os.pathsep.join(filter(None, [str(ROOT), os.environ.get("PYTHONPATH")]))
+    env = {**os.environ, "PYTHONPATH": path}
+    times = []
+    for _ in range(repeat):
+        output = subprocess.run(
+            [sys.executable, "-c", _TIMER.format(statement=statement)],
+            env=env,
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        times.append(float(output.split()[-1]))
+    return min(times)
+
+
+def run(repeat: int = 5) -> dict[str, float]:
+    """Time every statement in :data:`IMPORTS` and return seconds per import."""
+
+    results = {}
+    for label, statement in IMPORTS.items():
+        name = f"import[{label}]"
+        results[name] = time_import(statement, repeat)
+        print(f"{name:<50} {results[name] * 1e3:12.4f} ms", flush=True)
+    return results
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--save-baseline", action="store_true", help="update the baseline")
+    parser.add_argument("--threshold", type=float, default=0.25)
+    args = parser.parse_args(argv)
+
+    results = run(args.repeat)
+    if args.save_baseline:
+        baseline = load_baseline(args.baseline) if args.baseline.exists() else {}
+        save_results(args.baseline, {**baseline, **results})
+        print(f"Baseline written to {args.baseline}")
+        return 0
+    if not args.baseline.exists():
+        print(f"No baseline at {args.baseline}; run with --save-baseline first")
+        return 0
+
+    baseline = load_baseline(args.baseline)
+    regressions, improvements = compare(results, baseline, args.threshold)
+    for name in improvements:
+        print(f"IMPROVED   {name}: {baseline[name] * 1e3:.4f} -> {results[name] * 1e3:.4f} ms")
+    for name in regressions:
+        print(f"REGRESSION {name}: {baseline[name] * 1e3:.4f} -> {results[name] * 1e3:.4f} ms")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
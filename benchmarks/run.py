@@ -0,0 +1,140 @@
+"""Time every benchmark case and compare against a stored JSON baseline.
+
+Usage::
+
+    python -m benchmarks.run                       # run and compare
+    python -m benchmarks.run --save-baseline       # record a new baseline
+    python -m benchmarks.run --size small -k Asian # subset of the cases
+
+The best time per call over several repeats is recorded for each case.  A
+case is flagged as a regression when it is slower than the baseline by more
+than ``--threshold`` (a fraction, 0.25 by default) and the command exits
+with status 1.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import sys
+import time
+import timeit
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Iterable
+
+import numpy as np
+
+from .cases import CASES, Case
+
+DEFAULT_BASELINE = Path(__file__).with_name("baseline.json")
+
+
+def time_case(case: Case, repeat: int = 5, min_time: float = 0.2) -> float:
+    """Return the best wall time in seconds of a single call of ``case``."""
+
+    func = case.callable()
+    func()  # warm-up: imports, caches, JIT compilation
+    timer = timeit.Timer(func)
+    number, elapsed = timer.autorange()
+    if elapsed < min_time:
+        number = max(number, int(number * min_time / max(elapsed, 1e-9)))
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def run(cases: Iterable[Case], repeat: int = 5) -> dict[str, float]:
+    """Time ``cases`` and return a mapping of case name to seconds per call."""
+
+    results = {}
+    for case in cases:
+        results[case.name] = time_case(case, repeat)
+        print(f"{case.name:<50} {results[case.name] * 1e3:12.4f} ms", flush=True)
+    return results
+
+
+def compare(
+    results: dict[str, float], baseline: dict[str, float], threshold: float = 0.25
+) -> tuple[list[str], list[str]]:
+    """Return the names of cases that regressed and improved beyond ``threshold``."""
+
+    regressions, improvements = [], []
+    for name, seconds in results.items():
+        reference = baseline.get(name)
+        if reference is None or reference <= 0:
+            continue
+        ratio = seconds / reference
+        if ratio > 1.0 + threshold:
+            regressions.append(name)
+        elif ratio < 1.0 / (1.0 + threshold):
+            improvements.append(name)
+    return regressions, improvements
+
+
+def load_baseline(path: Path) -> dict[str, float]:
+    """Return the per-case timings stored in a baseline file."""
+
+    with open(path) as handle:
+        return json.load(handle)["results"]
+
+
+def save_results(path: Path, results: dict[str, float]) -> None:
+    """Write ``results`` together with environment metadata to ``path``."""
+
+    payload = {
+        "meta": {
+            "created": datetime.now(timezone.utc).isoformat(),
+            "python": sys.version.split()[0],
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "machine": platform.machine(),
+        },
+        "results": results,
+    }
+    with open(path, "w") as handle:
+        json.dump(payload, handle, indent=2, sort_keys=True)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-k", dest="pattern", help="only run cases whose name contains this")
+    parser.add_argument("--size", choices=("small", "large"), help="only run one parameter grid")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--save-baseline", action="store_true", help="overwrite the baseline")
+    parser.add_argument("--output", type=Path, help="also write the results to this file")
+    parser.add_argument("--threshold", type=float, default=0.25)
+    args = parser.parse_args(argv)
+
+    cases = [
+        case
+        for case in CASES
+        if (args.pattern is None or args.pattern in case.name)
+        and (args.size is None or case.size == args.size)
+    ]
+    start = time.perf_counter()
+    results = run(cases, args.repeat)
+    print(f"\n{len(results)} cases in {time.perf_counter() - start:.1f}s")
+
+    if args.output:
+        save_results(args.output, results)
+    if args.save_baseline:
+        baseline = load_baseline(args.baseline) if args.baseline.exists() else {}
+        save_results(args.baseline, {**baseline, **results})
+        print(f"Baseline written to {args.baseline}")
+        return 0
+    if not args.baseline.exists():
+        print(f"No baseline at {args.baseline}; run with --save-baseline first")
+        return 0
+
+    baseline = load_baseline(args.baseline)
+    regressions, improvements = compare(results, baseline, args.threshold)
+    for name in improvements:
+        print(f"IMPROVED   {name}: {baseline[name] * 1e3:.4f} -> {results[name] * 1e3:.4f} ms")
+    for name in regressions:
+        print(f"REGRESSION {name}: {baseline[name] * 1e3:.4f} -> {results[name] * 1e3:.4f} ms")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,3 +1,16 @@
 """Derivative pricing models package."""
 
-from .models import *  # noqa: F401,F403
+from . import models
+from .models import DerivativeModel  # noqa: F401
+
+__all__ = models.__all__
+
+
+def __getattr__(name):
+    if name in models.MODEL_MODULES:
+        return getattr(models, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted({*globals(), *models.MODEL_MODULES})
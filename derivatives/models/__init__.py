@@ -1,45 +1,65 @@
-"""Collection of derivative pricing models."""
+"""Collection of derivative pricing models.
+
+Model classes are imported on first access (PEP 562), so a process that
+only prices deposits does not pay for importing NumPy and SciPy.
+``from derivatives.models import ZeroCoupon`` and ``models.ZeroCoupon``
+behave exactly as with eager imports.
+"""
+
+from importlib import import_module
 
 from .base import DerivativeModel
 
-# flake8: noqa
-
-# Misc utilities
-from .misc.constant_debt_to_equity import ConstantDebtToEquity
-from .misc.price_curve import PriceCurve
-from .misc.underlying_spot import UnderlyingSpot
-
-# Credit models
-from .credit.credit_basket_linear import CreditBasketLinear
-from .credit.static_hazard_rate_model import StaticHazardRateModel
-
-# Bond models
-from .bonds.zero_coupon import ZeroCoupon
-from .bonds.index_linked_bond_forward import IndexLinkedBondForward
-from .bonds.corporate_bond_model import CorporateBondModel
-
-# Futures and forwards
-from .futures.synthetic_underlying_forward import SyntheticUnderlyingForward
-from .futures.theoretical_dividend_futures import TheoreticalDividendFutures
-from .futures.theoretical_dividend_neutral_futures import TheoreticalDividendNeutralFutures
-from .futures.convexity_adjusted_interest_rate_futures import ConvexityAdjustedInterestRateFutures
-
-# Option models
-from .options.asian_arithmetic_fix_mm import AsianArithmeticFixMM
-from .options.commodity_asian_option import CommodityAsianOption
-from .options.barrier_continuous_analytic import BarrierContinuousAnalytic
-from .options.discretised_barrier import DiscretisedBarrier
-from .options.qedi_variable_strike_warrant import QEDIVariableStrikeWarrant
-from .options.theoretical_simple_dividend_option import TheoreticalSimpleDividendOption
-from .options.udmc_cliquet_model import UDMCCliquetModel
-from .options.finite_difference import FiniteDifference
-
-# Swap models
-from .swaps.total_return_swap import TotalReturnSwap
-from .swaps.fully_funded_trs import FullyFundedTRS
-
-# Deposit models
-from .deposits.simple_tradeable_deposit import SimpleTradeableDeposit
-
-# Fund models
-from .funds.fund_instrument import FundInstrument
+#: Module, relative to this package, defining each exported model class.
+MODEL_MODULES = {
+    # Misc utilities
+    "ConstantDebtToEquity": ".misc.constant_debt_to_equity",
+    "DiscountCurve": ".misc.discount_curve",
+    "PriceCurve": ".misc.price_curve",
+    "UnderlyingSpot": ".misc.underlying_spot",
+    # Credit models
+    "CreditBasketLinear": ".credit.credit_basket_linear",
+    "HazardCurve": ".credit.hazard_curve",
+    "StaticHazardRateModel": ".credit.static_hazard_rate_model",
+    # Bond models
+    "ZeroCoupon": ".bonds.zero_coupon",
+    "IndexLinkedBondForward": ".bonds.index_linked_bond_forward",
+    "CorporateBondModel": ".bonds.corporate_bond_model",
+    # Futures and forwards
+    "SyntheticUnderlyingForward": ".futures.synthetic_underlying_forward",
+    "TheoreticalDividendFutures": ".futures.theoretical_dividend_futures",
+    "TheoreticalDividendNeutralFutures": ".futures.theoretical_dividend_neutral_futures",
+    "ConvexityAdjustedInterestRateFutures": ".futures.convexity_adjusted_interest_rate_futures",
+    # Option models
+    "AsianArithmeticFixMM": ".options.asian_arithmetic_fix_mm",
+    "CommodityAsianOption": ".options.commodity_asian_option",
+    "BarrierContinuousAnalytic": ".options.barrier_continuous_analytic",
+    "DiscretisedBarrier": ".options.discretised_barrier",
+    "QEDIVariableStrikeWarrant": ".options.qedi_variable_strike_warrant",
+    "TheoreticalSimpleDividendOption": ".options.theoretical_simple_dividend_option",
+    "UDMCCliquetModel": ".options.udmc_cliquet_model",
+    "FiniteDifference": ".options.finite_difference",
+    # Swap models
+    "TotalReturnSwap": ".swaps.total_return_swap",
+    "FullyFundedTRS": ".swaps.fully_funded_trs",
+    # Deposit models
+    "SimpleTradeableDeposit": ".deposits.simple_tradeable_deposit",
+    # Fund models
+    "FundInstrument": ".funds.fund_instrument",
+}
+
+__all__ = ["DerivativeModel", *MODEL_MODULES]
+
+
+def __getattr__(name):
+    module = MODEL_MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    # Later lookups find the class directly and skip this function.
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted({*globals(), *MODEL_MODULES})
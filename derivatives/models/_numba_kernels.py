@@ -0,0 +1,92 @@
+"""Numba implementations of the kernels in :mod:`~derivatives.models.backends`.
+
+Importing this module fails with ``ImportError`` when Numba is not
+installed, in which case only the NumPy kernels are registered.  Path
+kernels walk every path in a single pass, in parallel across paths, and stop
+as soon as a path is knocked out instead of building the full path matrix.
+"""
+
+from __future__ import annotations
+
+import math
+
+import numba
+import numpy as np
+
+_jit = numba.njit(cache=True, fastmath=False)
+_parallel_jit = numba.njit(parallel=True, cache=True, fastmath=False)
+
+
+@_parallel_jit
+def arithmetic_average(spot, increments):
+    n_paths, n_steps = increments.shape
+    averages = np.empty(n_paths)
+    for i in numba.prange(n_paths):
+        log_price = 0.0
+        total = 0.0
+        for j in range(n_steps):
+            log_price += increments[i, j]
+            total += spot * math.exp(log_price)
+        averages[i] = total / n_steps
+    return averages
+
+
+@_parallel_jit
+def knock_out(spot, increments, barrier, is_down):
+    n_paths, n_steps = increments.shape
+    terminal = np.empty(n_paths)
+    alive = np.ones(n_paths, dtype=np.bool_)
+    for i in numba.prange(n_paths):
+        log_price = 0.0
+        for j in range(n_steps):
+            log_price += increments[i, j]
+            price = spot * math.exp(log_price)
+            if (is_down and price <= barrier) or (not is_down and price >= barrier):
+                alive[i] = False
+                break
+        # The terminal price of a knocked-out path is never paid out.
+        terminal[i] = spot * math.exp(log_price)
+    return terminal, alive
+
+
+@_parallel_jit
+def bridge_survival(spot, increments, barrier, is_down, step_variance):
+    n_paths, n_steps = increments.shape
+    sign = 1.0 if is_down else -1.0
+    start = sign * math.log(spot / barrier)
+    terminal = np.empty(n_paths)
+    survival = np.zeros(n_paths)
+    for i in numba.prange(n_paths):
+        log_price = 0.0
+        previous = start
+        probability = 1.0 if start > 0.0 else 0.0
+        for j in range(n_steps):
+            log_price += increments[i, j]
+            if probability == 0.0:
+                break
+            distance = sign * math.log(spot * math.exp(log_price) / barrier)
+            if distance <= 0.0:
+                probability = 0.0
+                break
+            probability *= 1.0 - math.exp(-2.0 * previous * distance / step_variance)
+            previous = distance
+        terminal[i] = spot * math.exp(log_price)
+        survival[i] = probability
+    return terminal, survival
+
+
+@_jit
+def tridiagonal(lower, diagonal, upper, rhs):
+    # Thomas algorithm; the systems from the PDE schemes are diagonally dominant.
+    n = len(diagonal)
+    scratch = np.empty(n)
+    solution = np.empty(n)
+    pivot = diagonal[0]
+    solution[0] = rhs[0] / pivot
+    for i in range(1, n):
+        scratch[i] = upper[i - 1] / pivot
+        pivot = diagonal[i] - lower[i - 1] * scratch[i]
+        solution[i] = (rhs[i] - lower[i - 1] * solution[i - 1]) / pivot
+    for i in range(n - 2, -1, -1):
+        solution[i] -= scratch[i + 1] * solution[i + 1]
+    return solution
@@ -0,0 +1,148 @@
+"""Pluggable compute kernels for the Monte Carlo and PDE inner loops.
+
+Models look their hot loops up by name with :func:`get_kernel` instead of
+calling a fixed implementation.  Every kernel has a pure NumPy
+implementation; when `Numba <https://numba.pydata.org>`_ is installed the
+same kernels are also available as JIT-compiled functions that run in
+parallel across paths and stop monitoring a path as soon as it is knocked
+out.
+
+The backend is chosen per call through the ``backend`` argument of the
+pricers.  ``None`` selects the default: the ``DERIVATIVES_BACKEND``
+environment variable if set, otherwise ``"numba"`` when it is importable and
+``"numpy"`` if not.  Further backends can be plugged in with
+:func:`register_kernel`.
+
+All kernels take the log-return increments produced by the Monte Carlo
+engine, so that every backend consumes exactly the same random numbers.
+"""
+
+from __future__ import annotations
+
+import os
+from typing import Callable
+
+import numpy as np
+from scipy.linalg import solve_banded
+
+#: Environment variable naming the default backend.
+BACKEND_ENV_VAR = "DERIVATIVES_BACKEND"
+
+_KERNELS: dict[str, dict[str, Callable]] = {}
+
+
+def register_kernel(name: str, backend: str, function: Callable | None = None):
+    """Register ``function`` as the ``backend`` implementation of kernel ``name``.
+
+    Can be used directly or as a decorator.
+    """
+
+    def decorator(func: Callable) -> Callable:
+        _KERNELS.setdefault(name, {})[backend] = func
+        return func
+
+    return decorator if function is None else decorator(function)
+
+
+def available_backends() -> list[str]:
+    """Return the backends that implement at least one kernel."""
+
+    return sorted({backend for kernels in _KERNELS.values() for backend in kernels})
+
+
+def default_backend() -> str:
+    """Return the backend used when a pricer is called with ``backend=None``."""
+
+    configured = os.environ.get(BACKEND_ENV_VAR)
+    if configured:
+        return configured
+    return "numba" if "numba" in available_backends() else "numpy"
+
+
+def get_kernel(name: str, backend: str | None = None) -> Callable:
+    """Return the implementation of kernel ``name`` for ``backend``.
+
+    Kernels missing from the requested backend fall back to NumPy only when
+    the backend was chosen by default; an explicitly requested backend that
+    is unavailable raises ``ValueError``.
+    """
+
+    if name not in _KERNELS:
+        raise KeyError(f"Unknown kernel: {name}")
+    implementations = _KERNELS[name]
+    if backend is None:
+        return implementations.get(default_backend(), implementations["numpy"])
+    if backend not in implementations:
+        raise ValueError(f"Backend {backend!r} is not available for kernel {name!r}")
+    return implementations[backend]
+
+
+# ----------------------------------------------------------------------
+# NumPy kernels
+# ----------------------------------------------------------------------
+@register_kernel("arithmetic_average", "numpy")
+def arithmetic_average(spot: float, increments: np.ndarray) -> np.ndarray:
+    """Return the average price along every path built from ``increments``."""
+
+    return (spot * np.exp(np.cumsum(increments, axis=1))).mean(axis=1)
+
+
+@register_kernel("knock_out", "numpy")
+def knock_out(
+    spot: float, increments: np.ndarray, barrier: float, is_down: bool
+) -> tuple[np.ndarray, np.ndarray]:
+    """Return the terminal price and whether each path stayed on the live side of ``barrier``.
+
+    The barrier is monitored at every step.  The terminal price of a
+    knocked-out path is not meaningful: implementations may stop simulating
+    a path once it has crossed the barrier.
+    """
+
+    paths = spot * np.exp(np.cumsum(increments, axis=1))
+    if is_down:
+        alive = paths.min(axis=1) > barrier
+    else:
+        alive = paths.max(axis=1) < barrier
+    return paths[:, -1], alive
+
+
+@register_kernel("bridge_survival", "numpy")
+def bridge_survival(
+    spot: float, increments: np.ndarray, barrier: float, is_down: bool, step_variance: float
+) -> tuple[np.ndarray, np.ndarray]:
+    """Return the terminal price and the continuous-monitoring survival probability.
+
+    See :func:`~derivatives.models.monte_carlo.barrier_survival`.
+    """
+
+    from .monte_carlo import barrier_survival
+
+    paths = spot * np.exp(np.cumsum(increments, axis=1))
+    return paths[:, -1], barrier_survival(paths, spot, barrier, is_down, step_variance)
+
+
+@register_kernel("tridiagonal", "numpy")
+def tridiagonal(
+    lower: np.ndarray, diagonal: np.ndarray, upper: np.ndarray, rhs: np.ndarray
+) -> np.ndarray:
+    """Solve a tridiagonal system with a banded LAPACK solver.
+
+    ``lower`` and ``upper`` hold the sub- and super-diagonal, one element
+    shorter than ``diagonal``.
+    """
+
+    banded = np.empty((3, len(diagonal)))
+    banded[0, 0] = banded[2, -1] = 0.0
+    banded[0, 1:] = upper
+    banded[1] = diagonal
+    banded[2, :-1] = lower
+    return solve_banded((1, 1), banded, rhs, check_finite=False)
+
+
+try:
+    from . import _numba_kernels
+except ImportError:  # Numba is an optional dependency.
+    _numba_kernels = None
+else:
+    for _name in ("arithmetic_average", "knock_out", "bridge_survival", "tridiagonal"):
+        register_kernel(_name, "numba", getattr(_numba_kernels, _name))
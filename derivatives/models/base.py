@@ -1,7 +1,21 @@
-"""Shared functionality for all derivative pricing models."""
+"""Shared functionality for all derivative pricing models.
 
+NumPy is imported by the helpers that need it rather than at module level,
+so that models which only do scalar arithmetic import quickly.
+"""
+
+from __future__ import annotations
+
+import functools
+import inspect
+import math
 from datetime import date
-from typing import Union
+from typing import TYPE_CHECKING, Any, Mapping, Union
+
+from . import instrumentation
+
+if TYPE_CHECKING:
+    import numpy as np
 
 
 class DerivativeModel:
@@ -13,18 +27,56 @@ class DerivativeModel:
 
     ``year_fraction``
         Compute the year fraction between two ``date`` instances using
-        common day count conventions (``ACT/365``, ``ACT/360`` and ``30/360``).
+        common day count conventions (``ACT/365``, ``ACT/360``, ``30/360``
+        and ``ACT/ACT``).  Arrays of dates are handled in one vectorized call.
 
     ``discount_factor``
         Calculate a simple discount factor from a continuously compounded
         or simple interest rate and two dates.  The helper relies on the
         ``year_fraction`` method for the day count calculation.
 
+    ``discount``
+        Continuously compounded discount factor for a flat rate or for any
+        curve object with a ``df`` method such as ``DiscountCurve``.  Models
+        that accept a rate use it so that a curve can be passed instead.
+
     ``validate_positive``
         Utility to ensure that numeric parameters are non-negative.  Models
         can call this during ``price`` to validate inputs.
+
+    ``price_batch``
+        Price many trades in one call from columnar inputs.  Models with a
+        closed-form price override ``_price_batch`` with a vectorized
+        implementation; all other models fall back to calling ``price`` once
+        per trade.
+
+    ``greeks``
+        Sensitivities of ``price`` by bump-and-reprice.  Every repricing
+        replays the same random numbers so that Monte Carlo Greeks do not
+        pick up simulation noise.  Models override this with analytic or
+        single-pass Monte Carlo estimators where available.
+
+    ``cache``
+        Optional :class:`~derivatives.models.cache.PriceCache`.  When set on
+        an instance, a model class or this base class, ``price`` returns
+        memoized results for repeated inputs.
+
+    Calls of ``price`` are timed while instrumentation is enabled, see
+    :mod:`derivatives.models.instrumentation`.
     """
 
+    #: Price cache consulted by ``price``; ``None`` disables caching.
+    cache = None
+
+    #: Mapping of risk factor to the keyword of ``price`` it is bumped
+    #: through.  Subclasses rename entries to match their signature.
+    GREEK_PARAMETERS = {"spot": "spot", "vol": "vol", "rate": "rate", "maturity": "maturity"}
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        if "price" in cls.__dict__:
+            cls.price = _wrap_price(cls.__dict__["price"])
+
     # ------------------------------------------------------------------
     # Generic helpers
     # ------------------------------------------------------------------
@@ -39,30 +91,22 @@ class DerivativeModel:
         Parameters
         ----------
         start, end
-            ``datetime.date`` objects representing the calculation period.
+            ``datetime.date`` objects representing the calculation period, or
+            ``datetime64`` arrays of them, in which case an array is returned.
         convention
             Day count convention.  Supported values are ``"act/365"`` (the
-            default), ``"act/360"`` and ``"30/360"``.
+            default), ``"act/360"``, ``"30/360"`` and ``"act/act"``.
+
+        Two ``date`` objects are handled in plain Python; arrays are passed
+        to :func:`derivatives.models.schedule.year_fractions`.
         """
 
-        if not isinstance(start, date) or not isinstance(end, date):
-            raise TypeError("start and end must be datetime.date instances")
-        if end < start:
-            raise ValueError("end must not be before start")
-
-        days = (end - start).days
-        if convention.lower() == "act/365":
-            return days / 365.0
-        if convention.lower() == "act/360":
-            return days / 360.0
-        if convention.lower() == "30/360":
-            # 30/360 US convention
-            d1 = min(start.day, 30)
-            d2 = min(end.day, 30)
-            months = (end.year - start.year) * 12 + (end.month - start.month)
-            return ((months * 30) + (d2 - d1)) / 360.0
-
-        raise ValueError(f"Unsupported day count convention: {convention}")
+        if type(start) is date and type(end) is date:
+            return _date_year_fraction(start, end, convention.lower())
+
+        from .schedule import year_fractions
+
+        return year_fractions(start, end, convention)
 
     def discount_factor(
         self,
@@ -82,6 +126,37 @@ class DerivativeModel:
         tau = self.year_fraction(start, end, convention)
         return 1.0 / (1.0 + rate * tau)
 
+    @staticmethod
+    def discount(rate: Any, time: Any) -> Any:
+        """Return the discount factor to ``time`` for a rate or a curve.
+
+        ``rate`` is either a flat continuously compounded rate or an object
+        with a ``df`` method, e.g. :class:`~derivatives.models.DiscountCurve`.
+        Scalars give a float and arrays of rates or times give an array, so
+        the helper serves both ``price`` and vectorized ``_price_batch``
+        implementations.
+        """
+
+        if isinstance(rate, (int, float)) and isinstance(time, (int, float)):
+            return math.exp(-rate * time)
+
+        import numpy as np
+
+        if isinstance(rate, np.ndarray) and rate.dtype == object:
+            if rate.ndim == 0:
+                rate = rate.item()
+            else:
+                # One curve (or rate) per trade.
+                times = np.broadcast_to(np.asarray(time, dtype=float), rate.shape)
+                return np.array(
+                    [DerivativeModel.discount(r, t) for r, t in zip(rate, times)], dtype=float
+                )
+        if hasattr(rate, "df"):
+            return rate.df(time)
+        if np.ndim(rate) == 0 and np.ndim(time) == 0:
+            return math.exp(-rate * time)
+        return np.exp(-np.asarray(rate, dtype=float) * np.asarray(time, dtype=float))
+
     def validate_positive(self, name: str, value: Union[int, float]) -> None:
         """Validate that ``value`` is a non-negative number."""
 
@@ -96,3 +171,242 @@ class DerivativeModel:
     def price(self, *args, **kwargs):
         """Placeholder method for pricing logic."""
         raise NotImplementedError("Pricing logic not implemented")
+
+    def greeks(
+        self,
+        *args: Any,
+        spot_bump: float = 0.01,
+        vol_bump: float = 0.01,
+        rate_bump: float = 1e-4,
+        time_bump: float = 1.0 / 365.0,
+        **kwargs: Any,
+    ) -> dict[str, float]:
+        """Return price and Greeks by bump-and-reprice with common random numbers.
+
+        Models whose ``price`` takes a ``seed`` are repriced with the same
+        seed for every bump.  When no seed is given a fresh one is drawn, and
+        a ``Generator`` is reduced to a fixed seed drawn from it.
+
+        Parameters
+        ----------
+        *args, **kwargs:
+            Arguments of ``price``.
+        spot_bump:
+            Relative spot bump used for the central delta and gamma.
+        vol_bump, rate_bump:
+            Absolute bumps used for the central vega and rho.
+        time_bump:
+            Reduction in maturity used for the one-sided theta.
+
+        Returns
+        -------
+        dict
+            ``price`` plus ``delta``, ``gamma``, ``vega``, ``rho`` and
+            ``theta`` for every risk factor returned by
+            :meth:`_greek_parameters`.  Theta is the derivative with respect
+            to calendar time, ``-dV/dT``.
+        """
+
+        import numpy as np
+
+        signature = inspect.signature(self.price)
+        arguments = dict(signature.bind(*args, **kwargs).arguments)
+        if "seed" in signature.parameters:
+            seed = arguments.get("seed")
+            if seed is None:
+                seed = np.random.SeedSequence().entropy
+            elif isinstance(seed, np.random.Generator):
+                seed = int(seed.integers(2**63))
+            arguments["seed"] = seed
+
+        def reprice(**overrides: float) -> float:
+            return float(self.price(**{**arguments, **overrides}))
+
+        base = reprice()
+        result = {"price": base}
+        names = self._greek_parameters(arguments)
+
+        spot_name = names.get("spot")
+        if spot_name in arguments:
+            spot = arguments[spot_name]
+            h = spot_bump * spot
+            up = reprice(**{spot_name: spot + h})
+            down = reprice(**{spot_name: spot - h})
+            result["delta"] = (up - down) / (2 * h)
+            result["gamma"] = (up - 2 * base + down) / h**2
+
+        for greek, factor, h in (("vega", "vol", vol_bump), ("rho", "rate", rate_bump)):
+            name = names.get(factor)
+            if name in arguments:
+                value = arguments[name]
+                up = reprice(**{name: value + h})
+                down = reprice(**{name: value - h})
+                result[greek] = (up - down) / (2 * h)
+
+        maturity_name = names.get("maturity")
+        if maturity_name in arguments:
+            maturity = arguments[maturity_name]
+            h = min(time_bump, 0.5 * maturity)
+            result["theta"] = (reprice(**{maturity_name: maturity - h}) - base) / h
+
+        return result
+
+    def price_batch(
+        self,
+        data: Union[Mapping[str, Any], np.ndarray, None] = None,
+        **columns: Any,
+    ) -> np.ndarray:
+        """Price a batch of trades supplied as columns.
+
+        Parameters
+        ----------
+        data:
+            Optional mapping of keyword name to array, or a NumPy structured
+            array whose field names match the keywords of ``price``.
+        **columns:
+            Additional columns passed by keyword.  These take precedence over
+            entries of ``data`` with the same name.
+
+        Every column is either a scalar, which is shared by all trades, or an
+        array-like whose first axis has one entry per trade.
+
+        Returns
+        -------
+        numpy.ndarray
+            One price per trade.
+        """
+
+        import numpy as np
+
+        merged: dict[str, Any] = {}
+        if data is not None:
+            if isinstance(data, np.ndarray) and data.dtype.names is not None:
+                merged.update({name: data[name] for name in data.dtype.names})
+            else:
+                merged.update(data)
+        merged.update(columns)
+
+        n_trades = None
+        for name, value in merged.items():
+            value = self._batch_column(value)
+            merged[name] = value
+            if value.ndim == 0:
+                continue
+            if n_trades is None:
+                n_trades = len(value)
+            elif len(value) != n_trades:
+                raise ValueError(f"column {name} has {len(value)} entries, expected {n_trades}")
+        n_trades = 1 if n_trades is None else n_trades
+
+        result = self._price_batch(n_trades, **merged)
+        return np.broadcast_to(np.asarray(result, dtype=float), (n_trades,)).copy()
+
+    def _greek_parameters(self, arguments: Mapping[str, Any]) -> dict[str, str]:
+        """Return the entries of ``GREEK_PARAMETERS`` that :meth:`greeks` bumps.
+
+        Only factors passed as plain numbers are bumped; a factor given as a
+        curve, or left as ``None``, has no Greek.
+        """
+
+        from numbers import Real
+
+        return {
+            factor: name
+            for factor, name in self.GREEK_PARAMETERS.items()
+            if isinstance(arguments.get(name), Real) and not isinstance(arguments[name], bool)
+        }
+
+    def _price_batch(self, n_trades: int, **columns: np.ndarray) -> np.ndarray:
+        """Price ``n_trades`` trades from validated columns.
+
+        The default implementation calls ``price`` once per trade.  Closed-form
+        models override this with a vectorized implementation.
+        """
+
+        import numpy as np
+
+        prices = np.empty(n_trades)
+        for i in range(n_trades):
+            kwargs = {
+                name: (value if value.ndim == 0 else value[i])
+                for name, value in columns.items()
+            }
+            prices[i] = self.price(**{k: self._batch_scalar(v) for k, v in kwargs.items()})
+        return prices
+
+    @staticmethod
+    def _batch_column(value: Any) -> np.ndarray:
+        """Return ``value`` as an array with one entry per trade."""
+
+        import numpy as np
+
+        if isinstance(value, np.ndarray):
+            return value
+        try:
+            return np.asarray(value)
+        except ValueError:
+            # Ragged sequences such as per-trade cash flow lists.
+            column = np.empty(len(value), dtype=object)
+            column[:] = list(value)
+            return column
+
+    @staticmethod
+    def _batch_scalar(value: Any) -> Any:
+        """Convert NumPy scalars to the equivalent Python objects."""
+
+        import numpy as np
+
+        if isinstance(value, np.ndarray):
+            return value.item() if value.ndim == 0 else value.tolist()
+        if isinstance(value, np.generic):
+            return value.item()
+        return value
+
+
+def _date_year_fraction(start: date, end: date, convention: str) -> float:
+    """Scalar counterpart of :func:`~derivatives.models.schedule.year_fractions`."""
+
+    days = (end - start).days
+    if days < 0:
+        raise ValueError("end must not be before start")
+    if convention == "act/365":
+        return days / 365.0
+    if convention == "act/360":
+        return days / 360.0
+    if convention == "30/360":
+        months = (end.year - start.year) * 12 + (end.month - start.month)
+        return (months * 30 + min(end.day, 30) - min(start.day, 30)) / 360.0
+    if convention == "act/act":
+        next_year = date(start.year + 1, 1, 1)
+        this_year = date(end.year, 1, 1)
+        length1 = (next_year - date(start.year, 1, 1)).days
+        length2 = (date(end.year + 1, 1, 1) - this_year).days
+        return (
+            (next_year - start).days / length1
+            + (end.year - start.year - 1)
+            + (end - this_year).days / length2
+        )
+    raise ValueError(f"Unsupported day count convention: {convention}")
+
+
+def _wrap_price(price):
+    """Wrap a ``price`` implementation so that it consults ``self.cache``.
+
+    While an :mod:`~derivatives.models.instrumentation` recorder is active
+    the call, including any cache lookup, is timed.
+    """
+
+    def lookup(self, *args, **kwargs):
+        cache = self.cache
+        if cache is None:
+            return price(self, *args, **kwargs)
+        return cache.call(self, price, args, kwargs)
+
+    @functools.wraps(price)
+    def wrapper(self, *args, **kwargs):
+        recorder = instrumentation._recorder
+        if recorder is not None:
+            return recorder.call(self, lookup, args, kwargs)
+        return lookup(self, *args, **kwargs)
+
+    return wrapper
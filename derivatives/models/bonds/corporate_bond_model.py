@@ -1,12 +1,56 @@
 """Simple corporate bond pricing model."""
 
-from math import exp
+from __future__ import annotations
+
+from typing import Any
+
+import numpy as np
 
 from ..base import DerivativeModel
 
+#: Tolerance used when deciding whether ``maturity * frequency`` is a whole
+#: number of coupon periods.
+PERIOD_TOLERANCE = 1e-9
+
+#: One basis point, the yield shift behind ``dv01``.
+BASIS_POINT = 1e-4
+
+
+def cash_flow_matrix(
+    face_value: Any, coupon_rate: Any, maturity: Any, frequency: Any = 1
+) -> tuple[np.ndarray, np.ndarray]:
+    """Return the cash flow times and amounts of one or many bonds.
+
+    Coupon dates are rolled back from ``maturity`` in steps of
+    ``1 / frequency``, so a maturity that is not a whole number of periods
+    leaves a short first (stub) period; the next coupon is still paid in
+    full.  All arguments broadcast against each other.
+
+    Returns
+    -------
+    times, amounts : numpy.ndarray
+        Arrays of shape ``(n_bonds, n_flows)``.  Bonds with fewer cash flows
+        than the longest one are padded with zero amounts at time zero.
+    """
+
+    columns = (face_value, coupon_rate, maturity, frequency)
+    face_value, coupon_rate, maturity, frequency = np.broadcast_arrays(
+        *(np.atleast_1d(np.asarray(value, dtype=float)) for value in columns)
+    )
+    if np.any(maturity <= 0) or np.any(frequency <= 0):
+        raise ValueError("maturity and frequency must be positive")
+
+    n_coupons = np.ceil(maturity * frequency - PERIOD_TOLERANCE).astype(int)
+    k = np.arange(n_coupons.max())
+    alive = k < n_coupons[:, None]
+    times = np.where(alive, maturity[:, None] - k / frequency[:, None], 0.0)
+    amounts = np.where(alive, (face_value * coupon_rate / frequency)[:, None], 0.0)
+    amounts[:, 0] += face_value
+    return times, amounts
+
 
 class CorporateBondModel(DerivativeModel):
-    """Price a fixed-coupon corporate bond using continuous discounting.
+    r"""Price a fixed-coupon corporate bond using continuous discounting.
 
     Parameters
     ----------
@@ -14,8 +58,9 @@ class CorporateBondModel(DerivativeModel):
         Amount paid at maturity.
     coupon_rate : float
         Annual coupon rate expressed as a decimal.
-    yield_rate : float
-        Continuously compounded yield to maturity.
+    yield_rate : float or DiscountCurve
+        Continuously compounded yield to maturity, or a discount curve whose
+        discount factors replace ``exp(-y t)``.
     maturity : float
         Time to maturity in years.
     frequency : int, optional
@@ -25,10 +70,15 @@ class CorporateBondModel(DerivativeModel):
     -----
     The price is the present value of all coupons and the face value::
 
-        P = \sum_{i=1}^{N} C \* exp(-y t_i) + F \* exp(-y T)
+        P = \sum_{i=1}^{N} C * exp(-y t_i) + F * exp(-y T)
 
     where ``C`` is the coupon payment, ``y`` the yield and ``t_i`` the cash flow
     time.  See any standard fixed income text.
+
+    Cash flows are held as arrays (see :func:`cash_flow_matrix`) so that the
+    price is a dot product with the discount factors, and duration, convexity
+    and DV01 reuse the same arrays.  :meth:`yield_from_price` inverts the
+    price for a whole book of bonds at once.
     """
 
     def price(
@@ -41,11 +91,117 @@ class CorporateBondModel(DerivativeModel):
     ) -> float:
         """Return the price of the bond."""
 
-        periods = int(maturity * frequency)
-        coupon = face_value * coupon_rate / frequency
-        value = 0.0
-        for i in range(1, periods + 1):
-            t = i / frequency
-            value += coupon * exp(-yield_rate * t)
-        value += face_value * exp(-yield_rate * maturity)
-        return value
+        times, amounts = cash_flow_matrix(face_value, coupon_rate, maturity, frequency)
+        return float(amounts[0] @ self.discount(yield_rate, times[0]))
+
+    def _price_batch(self, n_trades, face_value, coupon_rate, yield_rate, maturity, frequency=1):
+        """Vectorized price of ``n_trades`` bonds from a padded cash flow matrix."""
+
+        if yield_rate.dtype == object and yield_rate.ndim:
+            return super()._price_batch(
+                n_trades,
+                face_value=face_value,
+                coupon_rate=coupon_rate,
+                yield_rate=yield_rate,
+                maturity=maturity,
+                frequency=frequency,
+            )
+        times, amounts = cash_flow_matrix(face_value, coupon_rate, maturity, frequency)
+        rates = yield_rate if yield_rate.dtype == object else yield_rate.reshape(-1, 1)
+        return np.sum(amounts * self.discount(rates, times), axis=1)
+
+    def analytics(
+        self,
+        face_value: float,
+        coupon_rate: float,
+        yield_rate: float,
+        maturity: float,
+        frequency: int = 1,
+    ) -> dict[str, Any]:
+        """Return price, duration, convexity and DV01 from one set of cash flows.
+
+        Duration and convexity are with respect to the continuously compounded
+        yield (or a parallel shift of the zero rates of a curve), so
+        Macaulay and modified duration coincide.  ``dv01`` is the price
+        change for a one basis point fall in yield.  Arguments broadcast like
+        :func:`cash_flow_matrix`; scalar inputs give float values.
+        """
+
+        times, amounts = cash_flow_matrix(face_value, coupon_rate, maturity, frequency)
+        rates = yield_rate if hasattr(yield_rate, "df") else np.reshape(yield_rate, (-1, 1))
+        pv = amounts * self.discount(rates, times)
+        price = pv.sum(axis=1)
+        duration = (pv * times).sum(axis=1) / price
+        convexity = (pv * times**2).sum(axis=1) / price
+        result = {
+            "price": price,
+            "duration": duration,
+            "convexity": convexity,
+            "dv01": duration * price * BASIS_POINT,
+        }
+        scalar = all(np.ndim(v) == 0 for v in (face_value, coupon_rate, maturity, frequency)) and (
+            hasattr(yield_rate, "df") or np.ndim(yield_rate) == 0
+        )
+        return {name: float(value[0]) for name, value in result.items()} if scalar else result
+
+    def yield_from_price(
+        self,
+        target_price: Any,
+        face_value: Any,
+        coupon_rate: Any,
+        maturity: Any,
+        frequency: Any = 1,
+        tol: float = 1e-12,
+        max_iter: int = 100,
+    ) -> Any:
+        """Solve for the continuously compounded yield that reproduces ``target_price``.
+
+        All bonds are solved simultaneously: each iteration takes a Newton
+        step for every bond and falls back to bisection of the bracketing
+        interval wherever the Newton step would leave it, so convergence is
+        guaranteed for any positive price.  Prices above the undiscounted sum
+        of the cash flows give negative yields.
+
+        Raises
+        ------
+        ValueError
+            If a price is not positive, or the solver has not converged after
+            ``max_iter`` iterations.
+        """
+
+        times, amounts = cash_flow_matrix(face_value, coupon_rate, maturity, frequency)
+        target = np.broadcast_to(np.asarray(target_price, dtype=float).reshape(-1), len(times))
+        if np.any(target <= 0):
+            raise ValueError("target_price must be positive")
+
+        # Start from the yield of a zero-coupon bond at the cash-flow weighted
+        # mean time, which is exact for single cash flows.
+        total = amounts.sum(axis=1)
+        y = np.log(total / target) / ((amounts * times).sum(axis=1) / total)
+        lo = np.full(len(y), -np.inf)
+        hi = np.full(len(y), np.inf)
+        active = np.arange(len(y))
+        for _ in range(max_iter):
+            pv = amounts[active] * np.exp(-y[active, None] * times[active])
+            f = pv.sum(axis=1) - target[active]
+            slope = -(pv * times[active]).sum(axis=1)
+            # Price falls monotonically with yield, so the sign of the error
+            # tightens the bracket around the root.
+            lo[active] = np.where(f > 0, y[active], lo[active])
+            hi[active] = np.where(f > 0, hi[active], y[active])
+            # Steps are capped while the bracket is still open on one side.
+            with np.errstate(divide="ignore"):
+                step = np.clip(f / slope, -1.0, 1.0)
+            newton = y[active] - step
+            bisect = (newton < lo[active]) | (newton > hi[active])
+            y[active] = np.where(bisect, 0.5 * (lo[active] + hi[active]), newton)
+            active = active[np.abs(step) >= tol]
+            if not len(active):
+                break
+        else:
+            raise ValueError("yield solver did not converge")
+
+        scalar = all(
+            np.ndim(v) == 0 for v in (target_price, face_value, coupon_rate, maturity, frequency)
+        )
+        return float(y[0]) if scalar else y
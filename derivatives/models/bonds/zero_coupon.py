@@ -1,7 +1,5 @@
 """Zero-coupon bond pricing model."""
 
-from math import exp
-
 from ..base import DerivativeModel
 
 
@@ -12,8 +10,8 @@ class ZeroCoupon(DerivativeModel):
     ----------
     face_value : float
         Amount paid at maturity.
-    discount_rate : float
-        Continuously compounded annual interest rate.
+    discount_rate : float or DiscountCurve
+        Continuously compounded annual interest rate, or a discount curve.
     maturity : float
         Time to maturity in years.
 
@@ -25,9 +23,15 @@ class ZeroCoupon(DerivativeModel):
 
     where ``F`` is the face value, ``r`` is the discount rate and ``T`` is the
     time to maturity.  See Hull, *Options, Futures, and Other Derivatives*.
+    With a curve, ``exp(-r * T)`` is replaced by the curve discount factor.
     """
 
     def price(self, face_value: float, discount_rate: float, maturity: float) -> float:
         """Return the present value of the bond."""
 
-        return face_value * exp(-discount_rate * maturity)
+        return face_value * self.discount(discount_rate, maturity)
+
+    def _price_batch(self, n_trades, face_value, discount_rate, maturity):
+        """Vectorized present value of ``n_trades`` bonds."""
+
+        return face_value * self.discount(discount_rate, maturity)
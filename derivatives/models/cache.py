@@ -0,0 +1,288 @@
+"""Opt-in memoization of model prices.
+
+A :class:`PriceCache` is attached to a model through its ``cache``
+attribute, either on one instance, on a model class, or on
+:class:`~derivatives.models.DerivativeModel` itself to cache every model::
+
+    cache = PriceCache(maxsize=10_000, ttl=60.0)
+    ZeroCoupon.cache = cache
+
+``price`` then looks its result up under a key made of the model class, the
+model's own state and the canonicalized arguments (defaults included).
+Floats are rounded to a multiple of ``tolerance`` so that inputs differing
+only by floating-point noise share an entry.  Models with market data as
+state, such as curves, are keyed by value, so a curve updated in place gets
+new entries automatically.  Other objects are keyed by identity; call
+:meth:`PriceCache.invalidate` with such an object after changing it.
+
+Monte Carlo prices are only cached when a fixed seed is supplied: calls with
+``seed=None`` or a ``numpy.random.Generator`` bypass the cache.  Calls with
+``method="analytic"`` are deterministic and cached whatever their seed.
+"""
+
+from __future__ import annotations
+
+import inspect
+import math
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Any, Callable, Hashable
+
+import numpy as np
+
+from .base import DerivativeModel
+
+
+class _Uncacheable(Exception):
+    """Raised while building a key for arguments that cannot be cached."""
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """Counters of a :class:`PriceCache`.
+
+    Attributes
+    ----------
+    hits, misses:
+        Lookups answered from the cache and lookups that priced the trade.
+    bypassed:
+        Calls that could not be cached, e.g. Monte Carlo without a fixed seed.
+    evictions, expirations:
+        Entries dropped by the size bound and by the time-to-live.
+    size:
+        Current number of entries.
+    """
+
+    hits: int
+    misses: int
+    bypassed: int
+    evictions: int
+    expirations: int
+    size: int
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of cacheable lookups answered from the cache."""
+
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+@dataclass
+class _Entry:
+    value: Any
+    expires: float
+    references: frozenset[int]
+
+
+class PriceCache:
+    """Least-recently-used cache of model prices with an optional time-to-live.
+
+    Parameters
+    ----------
+    maxsize:
+        Maximum number of entries; the least recently used entry is evicted
+        beyond it.
+    ttl:
+        Seconds after which an entry expires, ``None`` to keep entries until
+        evicted or invalidated.
+    tolerance:
+        Floats are rounded to a multiple of ``tolerance`` in the key.
+    clock:
+        Time source for ``ttl``, :func:`time.monotonic` by default.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 4096,
+        ttl: float | None = None,
+        tolerance: float = 1e-10,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+        if ttl is not None and ttl <= 0:
+            raise ValueError("ttl must be positive")
+        if tolerance <= 0:
+            raise ValueError("tolerance must be positive")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.tolerance = tolerance
+        self.clock = clock
+        self._entries: OrderedDict[Hashable, _Entry] = OrderedDict()
+        self._lock = threading.Lock()
+        self._signatures: dict[Callable, inspect.Signature] = {}
+        self._hits = self._misses = self._bypassed = self._evictions = self._expirations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    # ------------------------------------------------------------------
+    # Lookup
+    # ------------------------------------------------------------------
+    def call(self, model: Any, price: Callable, args: tuple, kwargs: dict) -> Any:
+        """Return ``price(model, *args, **kwargs)``, from the cache when possible."""
+
+        try:
+            key, references = self._key(model, price, args, kwargs)
+        except _Uncacheable:
+            with self._lock:
+                self._bypassed += 1
+            return price(model, *args, **kwargs)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires <= self.clock():
+                del self._entries[key]
+                self._expirations += 1
+                entry = None
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return _copy(entry.value)
+            self._misses += 1
+
+        value = price(model, *args, **kwargs)
+        expires = math.inf if self.ttl is None else self.clock() + self.ttl
+        with self._lock:
+            self._entries[key] = _Entry(_copy(value), expires, references)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+        return value
+
+    def stats(self) -> CacheStats:
+        """Return the current counters."""
+
+        with self._lock:
+            return CacheStats(
+                self._hits,
+                self._misses,
+                self._bypassed,
+                self._evictions,
+                self._expirations,
+                len(self._entries),
+            )
+
+    # ------------------------------------------------------------------
+    # Invalidation
+    # ------------------------------------------------------------------
+    def invalidate(self, *inputs: Any, model: type | None = None) -> int:
+        """Drop entries and return how many were removed.
+
+        Entries are dropped when they were priced with any of ``inputs``
+        (compared by identity, as arguments or as the model instance itself)
+        or, with ``model``, by that model class or a subclass.  Without
+        arguments the cache is cleared.
+        """
+
+        ids = {id(obj) for obj in inputs}
+        with self._lock:
+            if not ids and model is None:
+                removed = len(self._entries)
+                self._entries.clear()
+                return removed
+            stale = [
+                key
+                for key, entry in self._entries.items()
+                if entry.references & ids or (model is not None and issubclass(key[0], model))
+            ]
+            for key in stale:
+                del self._entries[key]
+        return len(stale)
+
+    def clear(self) -> None:
+        """Drop all entries and reset the counters."""
+
+        with self._lock:
+            self._entries.clear()
+            self._hits = self._misses = self._bypassed = self._evictions = self._expirations = 0
+
+    # ------------------------------------------------------------------
+    # Keys
+    # ------------------------------------------------------------------
+    def _key(self, model: Any, price: Callable, args: tuple, kwargs: dict):
+        signature = self._signatures.get(price)
+        if signature is None:
+            signature = self._signatures[price] = inspect.signature(price)
+        try:
+            bound = signature.bind(model, *args, **kwargs)
+        except TypeError as exc:
+            raise _Uncacheable from exc
+        bound.apply_defaults()
+        arguments = dict(bound.arguments)
+        arguments.pop(next(iter(signature.parameters)))
+        if "seed" in signature.parameters:
+            if arguments.get("method") == "analytic":
+                # Closed-form prices do not depend on the random numbers.
+                del arguments["seed"]
+            else:
+                seed = arguments["seed"]
+                if seed is None or isinstance(seed, np.random.Generator):
+                    raise _Uncacheable
+
+        references: set[int] = {id(model)}
+        key = (
+            type(model),
+            self._state(model, references),
+            tuple((name, self._canonical(value, references)) for name, value in arguments.items()),
+        )
+        return key, frozenset(references)
+
+    def _state(self, model: Any, references: set[int]) -> tuple:
+        """Return the canonical instance state of a model, ignoring its cache."""
+
+        state = getattr(model, "__dict__", {})
+        return tuple(
+            (name, self._canonical(value, references))
+            for name, value in sorted(state.items())
+            if name != "cache"
+        )
+
+    def _canonical(self, value: Any, references: set[int]) -> Hashable:
+        """Return a hashable, rounded representation of ``value``."""
+
+        if value is None or isinstance(value, (bool, np.bool_, str, date, datetime)):
+            return value.item() if isinstance(value, np.bool_) else value
+        if isinstance(value, (int, np.integer)) and abs(value) >= 2**53:
+            # Large integers such as seeds must match exactly.
+            return int(value)
+        if isinstance(value, (int, float, np.integer, np.floating)):
+            value = float(value)
+            return round(value / self.tolerance) if math.isfinite(value) else repr(value)
+        if isinstance(value, np.ndarray):
+            if value.dtype.kind == "f":
+                quantized = np.rint(value / self.tolerance)
+                return ("array", value.shape, quantized.tobytes())
+            if value.dtype.kind in "biuMm":
+                return ("array", value.dtype.str, value.shape, value.tobytes())
+            return ("array", value.shape, tuple(self._canonical(v, references) for v in value.flat))
+        if isinstance(value, (list, tuple)):
+            return (type(value).__name__, tuple(self._canonical(v, references) for v in value))
+        if isinstance(value, dict):
+            return (
+                "dict",
+                tuple(sorted((k, self._canonical(v, references)) for k, v in value.items())),
+            )
+        if isinstance(value, np.random.SeedSequence):
+            return ("seed", value.entropy, value.spawn_key, value.pool_size)
+
+        references.add(id(value))
+        # Models such as curves are compared by their market data.
+        if isinstance(value, DerivativeModel):
+            return (type(value), self._state(value, references))
+        try:
+            hash(value)
+        except TypeError as exc:
+            raise _Uncacheable from exc
+        return ("object", value)
+
+
+def _copy(value: Any) -> Any:
+    """Copy mutable results so that callers cannot alter cached entries."""
+
+    return value.copy() if isinstance(value, np.ndarray) else value
@@ -1,8 +1,18 @@
 from __future__ import annotations
 
-from typing import Iterable, Sequence
+from typing import TYPE_CHECKING, Any, Iterable, Sequence
+
+import numpy as np
 
 from ..base import DerivativeModel
+from ..monte_carlo import MonteCarloResult, Seed
+from . import gaussian_copula
+
+if TYPE_CHECKING:
+    from .hazard_curve import HazardCurve
+
+#: Maximum number of offending indices quoted in validation errors.
+MAX_REPORTED_INDICES = 10
 
 
 class CreditBasketLinear(DerivativeModel):
@@ -15,14 +25,31 @@ class CreditBasketLinear(DerivativeModel):
 
     where ``p_i`` is the probability of default derived from market spreads or
     a hazard rate model and ``recovery_i`` is the fractional recovery rate.
+    Instead of the probabilities a :class:`HazardCurve` may be supplied, either
+    one curve shared by every name or a multi-name curve with one row per
+    name, from which ``p_i`` is read at ``maturity``.
+
+    Inputs are handled as NumPy columns: they are validated with vectorized
+    masks, errors quote the offending indices, and the expected loss is a
+    single dot product of the default probabilities with the loss given
+    default.  A 2-D ``(n_scenarios, n_names)`` array of default
+    probabilities values every scenario in the same call.
+
+    The linear price ignores default correlation.  :meth:`tranche_loss` and
+    :meth:`nth_to_default` correlate the defaults with a one-factor Gaussian
+    copula (see :mod:`~derivatives.models.credit.gaussian_copula`); the
+    expected loss of the ``[0, 1]`` tranche reproduces :meth:`price` for any
+    correlation.
     """
 
     def price(
         self,
         notionals: Sequence[float],
-        default_probabilities: Sequence[float],
+        default_probabilities: Sequence[float] | None = None,
         recovery_rates: Iterable[float] | None = None,
-    ) -> float:
+        hazard_curve: HazardCurve | None = None,
+        maturity: float | None = None,
+    ) -> float | np.ndarray:
         """Compute price using a simple linear credit basket assumption.
 
         Parameters
@@ -30,42 +57,232 @@ class CreditBasketLinear(DerivativeModel):
         notionals:
             Nominal amounts for each credit name in the basket.
         default_probabilities:
-            Corresponding default probabilities for each credit name.
+            Corresponding default probabilities for each credit name, or a
+            ``(n_scenarios, n_names)`` matrix of them.
         recovery_rates:
             Fraction of notional recovered on default (defaults to zero for
             each name if not supplied).
+        hazard_curve:
+            Alternative to ``default_probabilities``: a single- or multi-name
+            hazard curve evaluated at ``maturity``.
+        maturity:
+            Horizon in years, required with ``hazard_curve``.
+
+        Returns
+        -------
+        float or numpy.ndarray
+            Present value of the expected credit losses, one per scenario
+            when a probability matrix is given.
+        """
+
+        _, loss_given_default, probabilities = self._columns(
+            notionals, default_probabilities, recovery_rates, hazard_curve, maturity
+        )
+        total = probabilities @ loss_given_default
+        return float(total) if np.ndim(total) == 0 else total
+
+    def contributions(
+        self,
+        notionals: Sequence[float],
+        default_probabilities: Sequence[float] | None = None,
+        recovery_rates: Iterable[float] | None = None,
+        hazard_curve: HazardCurve | None = None,
+        maturity: float | None = None,
+    ) -> np.ndarray:
+        """Return the expected loss of every name.
+
+        Takes the same arguments as :meth:`price`, whose result is the sum of
+        the contributions over the last axis.
+        """
+
+        _, loss_given_default, probabilities = self._columns(
+            notionals, default_probabilities, recovery_rates, hazard_curve, maturity
+        )
+        return probabilities * loss_given_default
+
+    def expected_loss(
+        self,
+        notionals: Sequence[float],
+        hazard_curve: HazardCurve,
+        horizons: Sequence[float],
+        recovery_rates: Iterable[float] | None = None,
+    ) -> np.ndarray:
+        """Return the undiscounted expected basket loss at each of ``horizons``.
+
+        The default probabilities of all names at all horizons come from a
+        single query of ``hazard_curve`` and are valued as one scenario per
+        horizon.
+        """
+
+        horizons = np.asarray(horizons, dtype=float)
+        probabilities = np.asarray(hazard_curve.default_probability(horizons))
+        if hazard_curve.n_names is None:
+            probabilities = np.broadcast_to(probabilities[:, None], (len(horizons), len(notionals)))
+        else:
+            probabilities = probabilities.T
+        return np.atleast_1d(self.price(notionals, probabilities, recovery_rates))
+
+    def tranche_loss(
+        self,
+        notionals: Sequence[float],
+        default_probabilities: Sequence[float] | None = None,
+        recovery_rates: Iterable[float] | None = None,
+        hazard_curve: HazardCurve | None = None,
+        maturity: float | None = None,
+        correlation: float = 0.0,
+        attachment: float = 0.0,
+        detachment: float = 1.0,
+        method: str = "semi-analytic",
+        n_quadrature: int = 200,
+        n_buckets: int = 512,
+        n_paths: int = 100_000,
+        chunk_size: int | None = None,
+        seed: Seed = None,
+        return_result: bool = False,
+    ) -> float | MonteCarloResult:
+        """Expected loss of a basket tranche under a Gaussian copula.
+
+        The first five arguments are those of :meth:`price`.
+
+        Parameters
+        ----------
+        correlation:
+            Copula correlation ``rho`` with the common factor, in ``[0, 1)``.
+        attachment, detachment:
+            Tranche boundaries as fractions of the total notional.
+        method:
+            ``"semi-analytic"`` (default) integrates the conditional loss
+            distribution over the common factor with ``n_quadrature``
+            Gauss--Legendre nodes on a grid of ``n_buckets`` losses.
+            ``"monte-carlo"`` simulates ``n_paths`` draws in chunks.
+        return_result:
+            Return a :class:`MonteCarloResult`; the semi-analytic method
+            reports a zero standard error.
 
         Returns
         -------
         float
-            Present value of the expected credit losses.
+            Undiscounted expected tranche loss in currency.
         """
 
-        notionals = list(notionals)
-        probabilities = list(default_probabilities)
+        if method not in ("semi-analytic", "monte-carlo"):
+            raise ValueError(f"Unsupported method: {method}")
+        notionals, loss_given_default, probabilities = self._columns(
+            notionals, default_probabilities, recovery_rates, hazard_curve, maturity
+        )
+        if probabilities.ndim != 1:
+            raise ValueError("tranche_loss takes one default probability per name")
+        if not 0.0 <= attachment < detachment <= 1.0:
+            raise ValueError("tranche boundaries must satisfy 0 <= attachment < detachment <= 1")
+        total = float(notionals.sum())
+        low, high = attachment * total, detachment * total
+
+        if method == "semi-analytic":
+            value = gaussian_copula.tranche_loss(
+                loss_given_default, probabilities, correlation, low, high, n_quadrature, n_buckets
+            )
+            return MonteCarloResult(value, 0.0, 0) if return_result else value
+
+        payoff = gaussian_copula.tranche_payoff(loss_given_default, probabilities, low, high)
+        result = gaussian_copula.simulate_defaults(
+            payoff, probabilities, correlation, n_paths, chunk_size, seed
+        )
+        return result if return_result else result.price
+
+    def nth_to_default(
+        self,
+        notionals: Sequence[float],
+        default_probabilities: Sequence[float] | None = None,
+        recovery_rates: Iterable[float] | None = None,
+        hazard_curve: HazardCurve | None = None,
+        maturity: float | None = None,
+        n: int = 1,
+        correlation: float = 0.0,
+        n_paths: int = 100_000,
+        chunk_size: int | None = None,
+        seed: Seed = None,
+        return_result: bool = False,
+    ) -> float | MonteCarloResult:
+        """Expected payout of ``n``-th-to-default protection by Monte Carlo.
+
+        The protection pays the loss given default of the ``n``-th name to
+        default before the horizon.  Defaults are correlated with a one-factor
+        Gaussian copula and ordered assuming a flat hazard rate per name up
+        to the horizon.  Arguments are as for :meth:`tranche_loss`.
+        """
+
+        _, loss_given_default, probabilities = self._columns(
+            notionals, default_probabilities, recovery_rates, hazard_curve, maturity
+        )
+        if probabilities.ndim != 1:
+            raise ValueError("nth_to_default takes one default probability per name")
+        payoff = gaussian_copula.nth_to_default_payoff(loss_given_default, probabilities, n)
+        result = gaussian_copula.simulate_defaults(
+            payoff, probabilities, correlation, n_paths, chunk_size, seed
+        )
+        return result if return_result else result.price
+
+    def _columns(
+        self,
+        notionals: Any,
+        default_probabilities: Any,
+        recovery_rates: Any,
+        hazard_curve: HazardCurve | None,
+        maturity: float | None,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Validate the inputs and return ``(notionals, loss_given_default, probabilities)``."""
+
+        notionals = _numeric_column(notionals, "notional values")
+        n_names = len(notionals)
+        if (default_probabilities is None) == (hazard_curve is None):
+            raise ValueError("Provide exactly one of default_probabilities and hazard_curve")
+        if hazard_curve is not None:
+            if maturity is None:
+                raise ValueError("maturity is required with hazard_curve")
+            default_probabilities = hazard_curve.default_probability(maturity)
+            if hazard_curve.n_names is None:
+                default_probabilities = np.full(n_names, default_probabilities)
+        probabilities = _numeric_column(default_probabilities, "default probabilities", ndim=(1, 2))
         if recovery_rates is None:
-            recoveries = [0.0] * len(notionals)
+            recoveries = np.zeros(n_names)
         else:
-            recoveries = list(recovery_rates)
+            recoveries = _numeric_column(recovery_rates, "recovery rates")
 
-        if not (len(notionals) == len(probabilities) == len(recoveries)):
+        if not (probabilities.shape[-1] == len(recoveries) == n_names):
             raise ValueError("Input sequences must have the same length")
 
-        total = 0.0
-        for n, p, r in zip(notionals, probabilities, recoveries):
-            if not isinstance(n, (int, float)):
-                raise TypeError("notional values must be numeric")
-            if not isinstance(p, (int, float)):
-                raise TypeError("default probabilities must be numeric")
-            if not isinstance(r, (int, float)):
-                raise TypeError("recovery rates must be numeric")
-            if n < 0:
-                raise ValueError("notional cannot be negative")
-            if not 0.0 <= p <= 1.0:
-                raise ValueError("default probability must be between 0 and 1")
-            if not 0.0 <= r <= 1.0:
-                raise ValueError("recovery rate must be between 0 and 1")
-
-            total += n * p * (1.0 - r)
-
-        return total
+        _check(notionals < 0, "notional cannot be negative")
+        _check(
+            ~((probabilities >= 0.0) & (probabilities <= 1.0)),
+            "default probability must be between 0 and 1",
+        )
+        _check(~((recoveries >= 0.0) & (recoveries <= 1.0)), "recovery rate must be between 0 and 1")
+        return notionals, notionals * (1.0 - recoveries), probabilities
+
+
+def _numeric_column(values: Any, name: str, ndim: tuple[int, ...] = (1,)) -> np.ndarray:
+    """Return ``values`` as a float array, raising ``TypeError`` if not numeric."""
+
+    if not isinstance(values, np.ndarray) and not hasattr(values, "__len__"):
+        values = list(values)
+    array = np.asarray(values)
+    if array.dtype.kind not in "biuf":
+        raise TypeError(f"{name} must be numeric")
+    if array.ndim not in ndim:
+        raise ValueError(f"{name} must have {' or '.join(map(str, ndim))} dimension(s)")
+    return array.astype(float, copy=False)
+
+
+def _check(mask: np.ndarray, message: str) -> None:
+    """Raise ``ValueError`` quoting the indices where ``mask`` is set."""
+
+    if not mask.any():
+        return
+    offending = np.argwhere(mask)
+    shown = [
+        tuple(index) if len(index) > 1 else index[0]
+        for index in offending[:MAX_REPORTED_INDICES].tolist()
+    ]
+    more = len(offending) - len(shown)
+    suffix = f" and {more} more" if more else ""
+    raise ValueError(f"{message} (indices {shown}{suffix})")
@@ -0,0 +1,195 @@
+"""Piecewise-constant hazard rate curve."""
+
+from __future__ import annotations
+
+from typing import Any, Sequence
+
+import numpy as np
+from scipy.optimize import brentq
+
+from ..base import DerivativeModel
+
+
+def _cumulative_hazard(
+    knots: np.ndarray, cumulative: np.ndarray, hazards: np.ndarray, t: np.ndarray
+) -> np.ndarray:
+    """Integrate piecewise-constant ``hazards`` from zero to ``t``.
+
+    ``knots`` starts at zero and ``cumulative`` holds the integral at every
+    knot; ``hazards`` has one entry (or one column) fewer.  The last hazard
+    rate is extrapolated flat.  Multi-name curves carry names on the first
+    axis, and the result then has shape ``(n_names,) + t.shape``.
+    """
+
+    if np.any(t < 0):
+        raise ValueError("times must be non-negative")
+    idx = np.clip(np.searchsorted(knots, t, side="left") - 1, 0, hazards.shape[-1] - 1)
+    return cumulative[..., idx] + hazards[..., idx] * (t - knots[idx])
+
+
+class HazardCurve(DerivativeModel):
+    """Piecewise-constant default intensity for one or many credit names.
+
+    Parameters
+    ----------
+    times : sequence of float
+        Right end points of the hazard rate intervals in years.  The first
+        interval starts at zero; the last rate is extrapolated flat.
+    hazard_rates : array-like
+        Default intensity on each interval.  A 2-D array of shape
+        ``(n_names, len(times))`` holds one curve per name on shared knots,
+        so that a whole basket is queried in one call.
+
+    Notes
+    -----
+    The cumulative hazard ``H`` at every knot is computed once at
+    construction.  A survival query ``exp(-H(t))`` is then a single
+    ``np.searchsorted`` over the knots plus one linear term, for any array of
+    times and for all names at once.
+    """
+
+    def __init__(self, times: Sequence[float], hazard_rates: Any):
+        self.times = np.asarray(times, dtype=float)
+        self.hazard_rates = np.asarray(hazard_rates, dtype=float)
+        if self.times.ndim != 1 or not len(self.times):
+            raise ValueError("times must be a non-empty sequence")
+        if np.any(self.times <= 0) or np.any(np.diff(self.times) <= 0):
+            raise ValueError("times must be positive and strictly increasing")
+        if self.hazard_rates.ndim not in (1, 2) or self.hazard_rates.shape[-1] != len(self.times):
+            raise ValueError("hazard_rates must have one entry per time, optionally per name")
+        if np.any(self.hazard_rates < 0):
+            raise ValueError("hazard rates cannot be negative")
+
+        self._knots = np.concatenate(([0.0], self.times))
+        increments = self.hazard_rates * np.diff(self._knots)
+        zeros = np.zeros(self.hazard_rates.shape[:-1] + (1,))
+        self._cumulative = np.concatenate((zeros, np.cumsum(increments, axis=-1)), axis=-1)
+
+    @property
+    def n_names(self) -> int | None:
+        """Number of names for a multi-name curve, ``None`` for a single curve."""
+
+        return self.hazard_rates.shape[0] if self.hazard_rates.ndim == 2 else None
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+    def cumulative_hazard(self, times):
+        """Return the integrated hazard from zero to ``times``."""
+
+        t = np.asarray(times, dtype=float)
+        result = _cumulative_hazard(self._knots, self._cumulative, self.hazard_rates, t)
+        return float(result) if result.ndim == 0 else result
+
+    def survival(self, times):
+        """Return survival probabilities to ``times``."""
+
+        result = np.exp(-np.asarray(self.cumulative_hazard(times)))
+        return float(result) if result.ndim == 0 else result
+
+    def default_probability(self, times):
+        """Return cumulative default probabilities to ``times``."""
+
+        return 1.0 - self.survival(times)
+
+    def hazard_rate(self, times):
+        """Return the instantaneous default intensity at ``times``."""
+
+        t = np.asarray(times, dtype=float)
+        idx = np.clip(np.searchsorted(self._knots, t, side="left") - 1, 0, len(self.times) - 1)
+        result = self.hazard_rates[..., idx]
+        return float(result) if result.ndim == 0 else result
+
+    def price(self, time: float) -> float:
+        """Return the survival probability to ``time``."""
+
+        return self.survival(time)
+
+    def _price_batch(self, n_trades, time):
+        if self.n_names is not None:
+            raise ValueError("price_batch requires a single-name curve")
+        return self.survival(time)
+
+    # ------------------------------------------------------------------
+    # CDS
+    # ------------------------------------------------------------------
+    def cds_spread(
+        self, tenor: float, recovery_rate: float = 0.4, discount_rate: Any = 0.0, frequency: int = 4
+    ):
+        """Return the par spread of a CDS with maturity ``tenor``.
+
+        Premiums are paid ``frequency`` times a year on dates rolled back
+        from ``tenor``, with premium accrued to default approximated by the
+        average of the survival probabilities at the ends of each period.
+        Protection pays ``1 - recovery_rate`` on the same grid.
+        ``discount_rate`` is a flat rate or a discount curve.  Multi-name
+        curves give one spread per name.
+        """
+
+        grid = _premium_grid(tenor, frequency)
+        survival = self.survival(grid)
+        spread = _par_spread(grid, survival, recovery_rate, self.discount(discount_rate, grid))
+        return float(spread) if spread.ndim == 0 else spread
+
+    @classmethod
+    def bootstrap(
+        cls,
+        tenors: Sequence[float],
+        spreads: Sequence[float],
+        recovery_rate: float = 0.4,
+        discount_rate: Any = 0.0,
+        frequency: int = 4,
+    ) -> "HazardCurve":
+        """Build the curve that reprices CDS par ``spreads`` at ``tenors``.
+
+        Hazard rates are solved one interval at a time, each with a single
+        root search, since the survival probabilities before a tenor depend
+        only on the intervals already bootstrapped.  Conventions are those
+        of :meth:`cds_spread`.
+        """
+
+        tenors = np.asarray(tenors, dtype=float)
+        spreads = np.asarray(spreads, dtype=float)
+        if tenors.shape != spreads.shape or not len(tenors):
+            raise ValueError("tenors and spreads must be non-empty and of equal length")
+        if np.any(spreads <= 0):
+            raise ValueError("spreads must be positive")
+
+        hazards: list[float] = []
+        for tenor, spread in zip(tenors, spreads):
+            grid = _premium_grid(tenor, frequency)
+            discount = cls.discount(discount_rate, grid)
+            knots = np.concatenate(([0.0], tenors[: len(hazards) + 1]))
+
+            def mismatch(h: float) -> float:
+                rates = np.array(hazards + [h])
+                cumulative = np.concatenate(([0.0], np.cumsum(rates * np.diff(knots))))
+                survival = np.exp(-_cumulative_hazard(knots, cumulative, rates, grid))
+                return _par_spread(grid, survival, recovery_rate, discount) - spread
+
+            upper = 1.0
+            while mismatch(upper) < 0:
+                upper *= 2.0
+            hazards.append(brentq(mismatch, 0.0, upper, xtol=1e-14))
+        return cls(tenors, hazards)
+
+
+def _premium_grid(tenor: float, frequency: int) -> np.ndarray:
+    """Return premium payment times rolled back from ``tenor``."""
+
+    if tenor <= 0 or frequency <= 0:
+        raise ValueError("tenor and frequency must be positive")
+    n = int(np.ceil(tenor * frequency - 1e-9))
+    return tenor - np.arange(n)[::-1] / frequency
+
+
+def _par_spread(
+    grid: np.ndarray, survival: np.ndarray, recovery_rate: float, discount: np.ndarray
+) -> np.ndarray:
+    """Return the par spread from survival probabilities on the premium grid."""
+
+    previous = np.concatenate((np.ones(survival.shape[:-1] + (1,)), survival[..., :-1]), axis=-1)
+    accrual = np.diff(np.concatenate(([0.0], grid)))
+    premium = np.sum(accrual * discount * 0.5 * (previous + survival), axis=-1)
+    protection = (1.0 - recovery_rate) * np.sum(discount * (previous - survival), axis=-1)
+    return protection / premium
@@ -1,25 +1,33 @@
 from __future__ import annotations
 
 import math
+from typing import TYPE_CHECKING
+
+import numpy as np
 
 from ..base import DerivativeModel
 
+if TYPE_CHECKING:
+    from ..misc.discount_curve import DiscountCurve
+    from .hazard_curve import HazardCurve
+
 
 class StaticHazardRateModel(DerivativeModel):
     """Static hazard rate model for expected default loss valuation.
 
-    This implementation assumes a **constant** default intensity over the
-    life of the exposure. More sophisticated alternatives include
-    stepwise models (where the hazard rate changes at preset intervals) and
-    stochastic models where the intensity follows a random process.
+    By default this model assumes a **constant** default intensity over the
+    life of the exposure.  Passing a :class:`HazardCurve` instead gives a
+    stepwise model, where the hazard rate changes at preset intervals.
+    Stochastic models, where the intensity follows a random process, are not
+    covered.
     """
 
     def price(
         self,
         notional: float,
-        hazard_rate: float,
+        hazard_rate: float | HazardCurve,
         maturity: float,
-        discount_rate: float = 0.0,
+        discount_rate: float | DiscountCurve = 0.0,
     ) -> float:
         """Compute the discounted expected loss using a constant hazard rate.
 
@@ -34,11 +42,13 @@ class StaticHazardRateModel(DerivativeModel):
         notional:
             Exposure at default.
         hazard_rate:
-            Constant hazard (default intensity) per annum.
+            Constant hazard (default intensity) per annum, or a hazard curve
+            whose survival probability replaces ``exp(-hazard_rate * maturity)``.
         maturity:
             Time horizon in years.
         discount_rate:
-            Risk-free discount rate used for present valuing the loss.
+            Risk-free discount rate used for present valuing the loss, or a
+            discount curve.
 
         Returns
         -------
@@ -46,17 +56,40 @@ class StaticHazardRateModel(DerivativeModel):
             Present value of the expected loss.
         """
 
-        for name, value in {
-            "notional": notional,
-            "hazard_rate": hazard_rate,
-            "maturity": maturity,
-            "discount_rate": discount_rate,
-        }.items():
+        numeric = {"notional": notional, "maturity": maturity}
+        if not hasattr(hazard_rate, "survival"):
+            numeric["hazard_rate"] = hazard_rate
+        if not hasattr(discount_rate, "df"):
+            numeric["discount_rate"] = discount_rate
+        for name, value in numeric.items():
             if not isinstance(value, (int, float)):
                 raise TypeError(f"{name} must be numeric")
             if value < 0:
                 raise ValueError(f"{name} cannot be negative")
 
-        survival = math.exp(-hazard_rate * maturity)
+        if hasattr(hazard_rate, "survival"):
+            survival = hazard_rate.survival(maturity)
+        else:
+            survival = math.exp(-hazard_rate * maturity)
         expected_loss = notional * (1.0 - survival)
-        return expected_loss * math.exp(-discount_rate * maturity)
+        return expected_loss * self.discount(discount_rate, maturity)
+
+    def _price_batch(self, n_trades, notional, hazard_rate, maturity, discount_rate=0.0):
+        """Vectorized expected loss of ``n_trades`` exposures with flat hazard rates."""
+
+        if hazard_rate.dtype == object:
+            return super()._price_batch(
+                n_trades,
+                notional=notional,
+                hazard_rate=hazard_rate,
+                maturity=maturity,
+                discount_rate=discount_rate,
+            )
+        numeric = {"notional": notional, "hazard_rate": hazard_rate, "maturity": maturity}
+        if np.asarray(discount_rate).dtype != object:
+            numeric["discount_rate"] = discount_rate
+        for name, value in numeric.items():
+            if np.any(value < 0):
+                raise ValueError(f"{name} cannot be negative")
+        expected_loss = notional * (1.0 - np.exp(-hazard_rate * maturity))
+        return expected_loss * self.discount(discount_rate, maturity)
@@ -2,6 +2,8 @@
 
 from math import exp
 
+import numpy as np
+
 from ..base import DerivativeModel
 
 
@@ -45,3 +47,16 @@ class SyntheticUnderlyingForward(DerivativeModel):
 
         forward_price = spot_price * exp((risk_free_rate - dividend_yield) * time_to_maturity)
         return notional * forward_price
+
+    def _price_batch(
+        self,
+        n_trades,
+        spot_price,
+        risk_free_rate,
+        dividend_yield,
+        time_to_maturity,
+        notional=1.0,
+    ):
+        """Vectorized forward price of ``n_trades`` contracts."""
+
+        return notional * spot_price * np.exp((risk_free_rate - dividend_yield) * time_to_maturity)
@@ -1,8 +1,9 @@
 """Pricing model for theoretical dividend futures."""
 
-from math import exp
 from typing import Iterable, Tuple
 
+import numpy as np
+
 from ..base import DerivativeModel
 
 
@@ -11,7 +12,7 @@ class TheoreticalDividendFutures(DerivativeModel):
 
     Assumptions
     ----------
-    * Constant risk-free rate.
+    * Constant risk-free rate, or a deterministic discount curve.
     * Dividends are paid discretely at known future times.
 
     Payoff
@@ -33,15 +34,16 @@ class TheoreticalDividendFutures(DerivativeModel):
         dividends:
             Iterable of ``(t, amount)`` pairs representing dividend payments.
         risk_free_rate:
-            Continuously compounded risk-free rate ``r``.
+            Continuously compounded risk-free rate ``r``, or a discount curve.
         time_to_maturity:
             Contract maturity ``T`` in years. Payments beyond ``T`` are ignored.
         notional:
             Scaling factor for the dividend stream.
         """
 
-        pv = 0.0
-        for t, amount in dividends:
-            if t <= time_to_maturity:
-                pv += amount * exp(-risk_free_rate * t)
+        flows = np.asarray(list(dividends), dtype=float).reshape(-1, 2)
+        flows = flows[flows[:, 0] <= time_to_maturity]
+        if not len(flows):
+            return 0.0
+        pv = float(np.sum(flows[:, 1] * self.discount(risk_free_rate, flows[:, 0])))
         return notional * pv
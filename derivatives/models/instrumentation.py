@@ -0,0 +1,392 @@
+"""Opt-in timing and profiling of model prices.
+
+While a :class:`Recorder` is active every call of a model's ``price`` is
+timed, and Monte Carlo simulations report the number of paths and path
+steps they generated to the call that started them::
+
+    with instrumentation.profile(slowest=5) as recorder:
+        value_book()
+    recorder.to_json("price_profile.json")
+
+Setting the ``DERIVATIVES_PROFILE`` environment variable enables a recorder
+for the whole process.  A value ending in ``.json`` or ``.csv`` is taken as
+the file the report is written to at exit; ``DERIVATIVES_PROFILE_SLOWEST``
+sets the number of slowest calls to profile.
+
+Timings are inclusive: a model whose ``price`` calls another model's
+``price`` is charged for both.  Calls made in worker processes are recorded
+there and folded into the parent's recorder with :meth:`Recorder.merge`,
+which :func:`derivatives.portfolio.value_portfolio` does automatically.
+When no recorder is active ``price`` only pays for one global lookup.
+"""
+
+from __future__ import annotations
+
+import atexit
+import heapq
+import io
+import itertools
+import os
+import threading
+import time
+from array import array
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, fields
+from typing import Any, Callable, Iterator
+
+#: Environment variable enabling a process-wide recorder.
+ENV_VAR = "DERIVATIVES_PROFILE"
+
+#: Environment variable with the number of slowest calls to profile.
+SLOWEST_ENV_VAR = "DERIVATIVES_PROFILE_SLOWEST"
+
+#: Profilers that can capture the slowest calls.
+PROFILERS = ("cprofile", "pyinstrument")
+
+#: Number of functions listed in a captured cProfile report.
+PROFILE_LINES = 25
+
+# The active recorder, consulted by every ``price`` call.
+_recorder: Recorder | None = None
+
+
+@dataclass(frozen=True)
+class ModelStats:
+    """Timing summary of the ``price`` calls of one model class.
+
+    Times are in seconds.  ``paths`` and ``path_steps`` count the Monte
+    Carlo paths and path steps simulated within those calls.
+    """
+
+    model: str
+    calls: int
+    errors: int
+    total_time: float
+    mean_time: float
+    p50: float
+    p95: float
+    p99: float
+    max_time: float
+    paths: int
+    path_steps: int
+
+
+@dataclass(frozen=True)
+class CallProfile:
+    """Profiler output of one of the slowest ``price`` calls."""
+
+    model: str
+    duration: float
+    profile: str
+
+
+class Recorder:
+    """Collect call counts, latencies and simulation sizes per model.
+
+    Parameters
+    ----------
+    slowest:
+        Number of slowest top-level ``price`` calls whose profile is kept.
+        Every top-level call is profiled while this is positive, which slows
+        pricing down noticeably.
+    profiler:
+        ``"cprofile"`` (the default) or ``"pyinstrument"``, which must be
+        installed.
+    """
+
+    def __init__(self, slowest: int = 0, profiler: str = "cprofile"):
+        if slowest < 0:
+            raise ValueError("slowest must be non-negative")
+        if profiler not in PROFILERS:
+            raise ValueError(f"Unsupported profiler: {profiler}")
+        if profiler == "pyinstrument" and slowest:
+            try:
+                import pyinstrument  # noqa: F401
+            except ImportError as exc:
+                raise ValueError("pyinstrument is not installed") from exc
+        self.slowest = slowest
+        self.profiler = profiler
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._counter = itertools.count()
+        self.reset()
+
+    def reset(self) -> None:
+        """Discard everything recorded so far."""
+
+        with self._lock:
+            self._durations: dict[str, array] = {}
+            self._errors: dict[str, int] = {}
+            self._simulated: dict[str, list[int]] = {}
+            self._profiles: list[tuple[float, int, str, Any]] = []
+
+    # ------------------------------------------------------------------
+    # Recording
+    # ------------------------------------------------------------------
+    def _stack(self) -> list[str]:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def call(self, model: Any, price: Callable[..., Any], args: tuple, kwargs: dict) -> Any:
+        """Return ``price(model, *args, **kwargs)``, recording its duration."""
+
+        name = type(model).__name__
+        stack = self._stack()
+        # Profilers cannot be nested, so only top-level calls are profiled.
+        profiler = self._start_profiler() if self.slowest and not stack else None
+        stack.append(name)
+        failed = True
+        start = time.perf_counter()
+        try:
+            result = price(model, *args, **kwargs)
+            failed = False
+            return result
+        finally:
+            duration = time.perf_counter() - start
+            stack.pop()
+            if profiler is not None:
+                profiler = self._stop_profiler(profiler)
+            with self._lock:
+                self._durations.setdefault(name, array("d")).append(duration)
+                if failed:
+                    self._errors[name] = self._errors.get(name, 0) + 1
+                if profiler is not None:
+                    self._keep_profile(duration, name, profiler)
+
+    def _keep_profile(self, duration: float, name: str, profiler: Any) -> None:
+        """Add a profile to the heap of the slowest calls; the lock must be held."""
+
+        entry = (duration, next(self._counter), name, profiler)
+        if len(self._profiles) < self.slowest:
+            heapq.heappush(self._profiles, entry)
+        else:
+            heapq.heappushpop(self._profiles, entry)
+
+    def record_simulation(self, paths: int, steps: int) -> None:
+        """Charge a simulation of ``paths`` paths of ``steps`` steps to the current call."""
+
+        stack = self._stack()
+        if not stack:
+            return
+        with self._lock:
+            counts = self._simulated.setdefault(stack[-1], [0, 0])
+            counts[0] += int(paths)
+            counts[1] += int(paths) * int(steps)
+
+    def _start_profiler(self) -> Any:
+        if self.profiler == "pyinstrument":
+            from pyinstrument import Profiler
+
+            profiler = Profiler()
+            profiler.start()
+            return profiler
+        import cProfile
+
+        profiler = cProfile.Profile()
+        try:
+            profiler.enable()
+        except ValueError:
+            # Another profiler is already active in this process.
+            return None
+        return profiler
+
+    def _stop_profiler(self, profiler: Any) -> Any:
+        if self.profiler == "pyinstrument":
+            profiler.stop()
+        else:
+            profiler.disable()
+        return profiler
+
+    # ------------------------------------------------------------------
+    # Reporting
+    # ------------------------------------------------------------------
+    def stats(self) -> list[ModelStats]:
+        """Return one summary per model, the most expensive in total first."""
+
+        import numpy as np
+
+        with self._lock:
+            items = [(name, np.array(durations)) for name, durations in self._durations.items()]
+            errors = dict(self._errors)
+            simulated = {name: tuple(counts) for name, counts in self._simulated.items()}
+        summaries = []
+        for name, durations in items:
+            p50, p95, p99 = np.percentile(durations, [50, 95, 99])
+            paths, path_steps = simulated.get(name, (0, 0))
+            summaries.append(
+                ModelStats(
+                    model=name,
+                    calls=len(durations),
+                    errors=errors.get(name, 0),
+                    total_time=float(durations.sum()),
+                    mean_time=float(durations.mean()),
+                    p50=float(p50),
+                    p95=float(p95),
+                    p99=float(p99),
+                    max_time=float(durations.max()),
+                    paths=paths,
+                    path_steps=path_steps,
+                )
+            )
+        summaries.sort(key=lambda summary: summary.total_time, reverse=True)
+        return summaries
+
+    def slowest_calls(self) -> list[CallProfile]:
+        """Return the profiles of the slowest calls, slowest first."""
+
+        with self._lock:
+            entries = sorted(self._profiles, reverse=True)
+        return [
+            CallProfile(name, duration, self._format_profile(profiler))
+            for duration, _, name, profiler in entries
+        ]
+
+    def _format_profile(self, profiler: Any) -> str:
+        if isinstance(profiler, str):
+            # Already formatted in the worker process it was merged from.
+            return profiler
+        if self.profiler == "pyinstrument":
+            return profiler.output_text()
+        import pstats
+
+        stream = io.StringIO()
+        pstats.Stats(profiler, stream=stream).sort_stats("cumulative").print_stats(PROFILE_LINES)
+        return stream.getvalue()
+
+    # ------------------------------------------------------------------
+    # Combining recorders
+    # ------------------------------------------------------------------
+    def snapshot(self) -> dict[str, Any]:
+        """Return everything recorded so far as picklable data for :meth:`merge`."""
+
+        with self._lock:
+            durations = {name: values.tolist() for name, values in self._durations.items()}
+            errors = dict(self._errors)
+            simulated = {name: list(counts) for name, counts in self._simulated.items()}
+            profiles = list(self._profiles)
+        return {
+            "durations": durations,
+            "errors": errors,
+            "simulated": simulated,
+            "profiles": [
+                (duration, name, self._format_profile(profiler))
+                for duration, _, name, profiler in profiles
+            ],
+        }
+
+    def merge(self, snapshot: dict[str, Any]) -> None:
+        """Add the calls of another recorder's :meth:`snapshot` to this one."""
+
+        with self._lock:
+            for name, values in snapshot["durations"].items():
+                self._durations.setdefault(name, array("d")).extend(values)
+            for name, count in snapshot["errors"].items():
+                self._errors[name] = self._errors.get(name, 0) + count
+            for name, (paths, path_steps) in snapshot["simulated"].items():
+                counts = self._simulated.setdefault(name, [0, 0])
+                counts[0] += paths
+                counts[1] += path_steps
+            if self.slowest:
+                for duration, name, text in snapshot["profiles"]:
+                    self._keep_profile(duration, name, text)
+
+    def report(self) -> dict[str, Any]:
+        """Return the model summaries and slowest call profiles as plain data."""
+
+        return {
+            "models": [asdict(summary) for summary in self.stats()],
+            "slowest": [asdict(call) for call in self.slowest_calls()],
+        }
+
+    def to_json(self, path: str | os.PathLike | None = None) -> str:
+        """Return the :meth:`report` as JSON, also writing it to ``path`` if given."""
+
+        import json
+
+        text = json.dumps(self.report(), indent=2)
+        if path is not None:
+            with open(path, "w") as handle:
+                handle.write(text)
+        return text
+
+    def to_csv(self, path: str | os.PathLike | None = None) -> str:
+        """Return the model summaries as CSV, also writing them to ``path`` if given."""
+
+        import csv
+
+        stream = io.StringIO()
+        writer = csv.DictWriter(stream, fieldnames=[field.name for field in fields(ModelStats)])
+        writer.writeheader()
+        writer.writerows(asdict(summary) for summary in self.stats())
+        text = stream.getvalue()
+        if path is not None:
+            with open(path, "w", newline="") as handle:
+                handle.write(text)
+        return text
+
+
+def active() -> Recorder | None:
+    """Return the active recorder, or ``None`` when instrumentation is off."""
+
+    return _recorder
+
+
+def enable(slowest: int = 0, profiler: str = "cprofile") -> Recorder:
+    """Start recording into a new :class:`Recorder` and return it."""
+
+    global _recorder
+    _recorder = Recorder(slowest, profiler)
+    return _recorder
+
+
+def disable() -> Recorder | None:
+    """Stop recording and return the recorder that was active."""
+
+    global _recorder
+    recorder, _recorder = _recorder, None
+    return recorder
+
+
+@contextmanager
+def profile(slowest: int = 0, profiler: str = "cprofile") -> Iterator[Recorder]:
+    """Record the ``price`` calls made inside the ``with`` block.
+
+    The previously active recorder, if any, is restored on exit.
+    """
+
+    global _recorder
+    previous = _recorder
+    recorder = _recorder = Recorder(slowest, profiler)
+    try:
+        yield recorder
+    finally:
+        _recorder = previous
+
+
+def record_simulation(paths: int, steps: int) -> None:
+    """Report a finished simulation to the active recorder, if any."""
+
+    recorder = _recorder
+    if recorder is not None:
+        recorder.record_simulation(paths, steps)
+
+
+def _configure_from_environment() -> None:
+    value = os.environ.get(ENV_VAR, "").strip()
+    if value.lower() in ("", "0", "false", "no", "off"):
+        return
+    import multiprocessing
+
+    if multiprocessing.parent_process() is not None:
+        # Worker processes report to their parent instead of writing the file.
+        return
+    recorder = enable(int(os.environ.get(SLOWEST_ENV_VAR, "0")))
+    if value.endswith(".csv"):
+        atexit.register(recorder.to_csv, value)
+    elif value.endswith(".json"):
+        atexit.register(recorder.to_json, value)
+
+
+_configure_from_environment()
@@ -0,0 +1,203 @@
+"""Discount curve built from zero-rate pillars."""
+
+from __future__ import annotations
+
+from datetime import date
+from typing import Sequence, Union
+
+import numpy as np
+
+from ..base import DerivativeModel
+
+#: Interpolation schemes understood by :class:`DiscountCurve`.
+INTERPOLATIONS = ("log-linear", "monotone-convex")
+
+
+class DiscountCurve(DerivativeModel):
+    """Continuously compounded discount curve.
+
+    Parameters
+    ----------
+    times : sequence of float or datetime.date
+        Pillar maturities, either as year fractions or as dates.  Dates are
+        converted with ``convention`` relative to ``valuation_date``.
+    rates : sequence of float
+        Continuously compounded zero rates at the pillars.
+    interpolation : str, optional
+        ``"log-linear"`` (default) interpolates the log discount factor
+        linearly, i.e. forwards are piecewise constant.  ``"monotone-convex"``
+        uses the Hagan--West scheme, which gives continuous instantaneous
+        forwards.  The positivity amendment of that scheme is not applied,
+        so forwards may turn negative when the discrete forwards are close
+        to zero.
+    valuation_date : datetime.date, optional
+        Required when ``times`` are dates.
+    convention : str, optional
+        Day count convention for date pillars.
+
+    Notes
+    -----
+    The node data (pillar times, log discount factors, discrete forwards
+    and the monotone-convex boundary forwards) is computed once at
+    construction.  ``df`` then answers an array of query times with a single
+    ``np.searchsorted`` call.  Beyond the last pillar the last forward rate
+    is extrapolated flat.
+    """
+
+    def __init__(
+        self,
+        times: Sequence[Union[float, date]],
+        rates: Sequence[float],
+        interpolation: str = "log-linear",
+        valuation_date: date | None = None,
+        convention: str = "act/365",
+    ):
+        if interpolation not in INTERPOLATIONS:
+            raise ValueError(f"Unsupported interpolation: {interpolation}")
+        if len(times) != len(rates) or not len(times):
+            raise ValueError("times and rates must be non-empty and of equal length")
+        if isinstance(times[0], date):
+            if valuation_date is None:
+                raise ValueError("valuation_date is required for date pillars")
+            times = self.year_fraction(valuation_date, list(times), convention)
+
+        self.interpolation = interpolation
+        self.times = np.asarray(times, dtype=float)
+        self.rates = np.asarray(rates, dtype=float)
+        if np.any(self.times <= 0) or np.any(np.diff(self.times) <= 0):
+            raise ValueError("pillar times must be positive and strictly increasing")
+
+        # Node data including the origin, where the discount factor is one.
+        self._nodes = np.concatenate(([0.0], self.times))
+        self._log_df = np.concatenate(([0.0], -self.rates * self.times))
+        widths = np.diff(self._nodes)
+        self._forwards = -np.diff(self._log_df) / widths
+
+        if interpolation == "monotone-convex":
+            fd = self._forwards
+            node_forwards = np.empty(len(self._nodes))
+            if len(fd) > 1:
+                node_forwards[1:-1] = (widths[:-1] * fd[1:] + widths[1:] * fd[:-1]) / (
+                    widths[:-1] + widths[1:]
+                )
+                node_forwards[0] = fd[0] - 0.5 * (node_forwards[1] - fd[0])
+                node_forwards[-1] = fd[-1] - 0.5 * (node_forwards[-2] - fd[-1])
+            else:
+                node_forwards[:] = fd[0]
+            self._g0 = node_forwards[:-1] - fd
+            self._g1 = node_forwards[1:] - fd
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+    def df(self, times):
+        """Return discount factors for a scalar or an array of ``times``."""
+
+        t = np.asarray(times, dtype=float)
+        result = np.exp(self._log_discount(t))
+        return float(result) if result.ndim == 0 else result
+
+    def zero_rate(self, times):
+        """Return continuously compounded zero rates for ``times``."""
+
+        t = np.asarray(times, dtype=float)
+        safe = np.where(t > 0, t, self._nodes[1])
+        rates = -self._log_discount(safe) / safe
+        rates = np.where(t > 0, rates, self.rates[0])
+        return float(rates) if rates.ndim == 0 else rates
+
+    def forward_rate(self, start, end):
+        """Return the continuously compounded forward rate between ``start`` and ``end``."""
+
+        start = np.asarray(start, dtype=float)
+        end = np.asarray(end, dtype=float)
+        forward = (self._log_discount(start) - self._log_discount(end)) / (end - start)
+        return float(forward) if forward.ndim == 0 else forward
+
+    def price(self, time: float) -> float:
+        """Return the discount factor at ``time``."""
+
+        return self.df(time)
+
+    def _price_batch(self, n_trades, time):
+        return self.df(time)
+
+    # ------------------------------------------------------------------
+    # Interpolation
+    # ------------------------------------------------------------------
+    def _log_discount(self, t: np.ndarray) -> np.ndarray:
+        """Return ``log(df(t))`` for an array of non-negative times."""
+
+        if np.any(t < 0):
+            raise ValueError("times must be non-negative")
+        last = len(self._forwards) - 1
+        idx = np.clip(np.searchsorted(self._nodes, t, side="left") - 1, 0, last)
+        left = self._nodes[idx]
+        width = self._nodes[idx + 1] - left
+        beyond = t > self._nodes[-1]
+
+        if self.interpolation == "log-linear":
+            log_df = self._log_df[idx] - self._forwards[idx] * (t - left)
+        else:
+            x = np.clip((t - left) / width, 0.0, 1.0)
+            integral = _monotone_convex_integral(self._g0[idx], self._g1[idx], x)
+            log_df = self._log_df[idx] - width * (self._forwards[idx] * x + integral)
+
+        # Flat extrapolation of the last forward beyond the final pillar.
+        tail = self._log_df[-1] - self._forwards[-1] * (t - self._nodes[-1])
+        return np.where(beyond, tail, log_df)
+
+
+def _monotone_convex_integral(g0: np.ndarray, g1: np.ndarray, x: np.ndarray) -> np.ndarray:
+    """Integral over ``[0, x]`` of the Hagan--West forward adjustment ``g``.
+
+    ``g0`` and ``g1`` are the deviations of the instantaneous forward from the
+    discrete forward at the left and right end of the interval, and ``x`` is
+    the position within the interval scaled to ``[0, 1]``.
+    """
+
+    g0, g1, x = np.broadcast_arrays(
+        np.asarray(g0, dtype=float), np.asarray(g1, dtype=float), np.asarray(x, dtype=float)
+    )
+    result = np.zeros(x.shape)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # Region (i): quadratic g, no extra turning point needed.
+        region1 = ((g0 < 0) & (-0.5 * g0 <= g1) & (g1 <= -2 * g0)) | (
+            (g0 > 0) & (-0.5 * g0 >= g1) & (g1 >= -2 * g0)
+        )
+        # Region (ii): g flat at g0, then rising quadratically to g1.
+        region2 = ~region1 & (((g0 < 0) & (g1 > -2 * g0)) | ((g0 > 0) & (g1 < -2 * g0)))
+        # Region (iii): g falls quadratically from g0 to g1, then flat.
+        region3 = ~region1 & ~region2 & (
+            ((g0 > 0) & (g1 < 0) & (g1 > -0.5 * g0)) | ((g0 < 0) & (g1 > 0) & (g1 < -0.5 * g0))
+        )
+        # Region (iv): both ends on the same side, g has a turning point.
+        region4 = ~region1 & ~region2 & ~region3 & ((g0 != 0) | (g1 != 0))
+
+        r1 = g0 * (x - 2 * x**2 + x**3) + g1 * (x**3 - x**2)
+
+        eta2 = (g1 + 2 * g0) / (g1 - g0)
+        r2 = g0 * x + np.where(
+            x > eta2, (g1 - g0) * (x - eta2) ** 3 / (3 * (1 - eta2) ** 2), 0.0
+        )
+
+        eta3 = 3 * g1 / (g1 - g0)
+        r3 = np.where(
+            x < eta3,
+            g1 * x + (g0 - g1) * (eta3**3 - (eta3 - x) ** 3) / (3 * eta3**2),
+            g1 * x + (g0 - g1) * eta3 / 3,
+        )
+
+        eta4 = g1 / (g1 + g0)
+        a = -g0 * g1 / (g0 + g1)
+        r4 = np.where(
+            x <= eta4,
+            np.where(eta4 > 0, a * x + (g0 - a) * (eta4**3 - (eta4 - x) ** 3) / (3 * eta4**2), 0.0),
+            a * x + (g0 - a) * eta4 / 3 + (g1 - a) * (x - eta4) ** 3 / (3 * (1 - eta4) ** 2),
+        )
+
+    result = np.where(region1, r1, result)
+    result = np.where(region2, r2, result)
+    result = np.where(region3, r3, result)
+    result = np.where(region4, r4, result)
+    return result
@@ -1,43 +1,179 @@
-"""Simple price curve model using linear interpolation."""
+"""Price curve interpolated between node prices."""
 
-from bisect import bisect_left
+from __future__ import annotations
+
+from typing import Any, Sequence
+
+import numpy as np
 
 from ..base import DerivativeModel
 
+#: Interpolation schemes understood by :class:`PriceCurve`.
+INTERPOLATIONS = ("linear", "log-linear", "monotone-cubic")
+
 
 class PriceCurve(DerivativeModel):
-    """Linearly interpolated price curve.
+    """Interpolated price curve, e.g. of commodity forwards.
 
     Parameters
     ----------
-    times : list[float]
-        Ordered time points in years.
-    prices : list[float]
-        Price at each time point.
+    times : sequence of float
+        Strictly increasing node times in years.
+    prices : sequence of float
+        Price at each node.
+    interpolation : str, optional
+        ``"linear"`` (default) interpolates prices linearly, ``"log-linear"``
+        interpolates their logarithms (prices must be positive) and
+        ``"monotone-cubic"`` uses the Fritsch--Carlson monotone piecewise
+        cubic Hermite scheme, which is smooth and does not overshoot the
+        node prices.
 
     Notes
     -----
-    Prices for intermediate times are obtained via linear interpolation between
-    the two surrounding known points.
+    Every segment between two nodes stores the coefficients of a cubic in
+    the time since its left node (linear schemes have zero higher
+    coefficients).  ``price`` answers an array of times with a single
+    ``np.searchsorted`` call followed by a Horner evaluation.  Before the
+    first and after the last node the price is extrapolated flat.
+    :meth:`update` changes node prices in place and refits only the
+    segments they affect.
     """
 
-    def __init__(self, times: list[float], prices: list[float]):
-        self.times = times
-        self.prices = prices
+    def __init__(
+        self, times: Sequence[float], prices: Sequence[float], interpolation: str = "linear"
+    ):
+        if interpolation not in INTERPOLATIONS:
+            raise ValueError(f"Unsupported interpolation: {interpolation}")
+        self.interpolation = interpolation
+        self.times = np.array(times, dtype=float)
+        self.prices = np.array(prices, dtype=float)
+        if self.times.ndim != 1 or self.times.shape != self.prices.shape:
+            raise ValueError("times and prices must be sequences of equal length")
+        if not len(self.times):
+            raise ValueError("Price curve has no data")
+        if np.any(np.diff(self.times) <= 0):
+            raise ValueError("times must be strictly increasing")
+        self._check_prices(self.prices)
 
-    def price(self, time: float) -> float:
-        """Return the interpolated price at ``time``."""
+        self._values = self._transform(self.prices)
+        self._coefficients = np.zeros((max(len(self.times) - 1, 0), 4))
+        self._fit(np.arange(len(self._coefficients)))
 
-        if not self.times:
-            raise ValueError("Price curve has no data")
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+    def price(self, time: Any) -> Any:
+        """Return the interpolated price at ``time``, a float or an array of times."""
+
+        t = np.asarray(time, dtype=float)
+        result = self._interpolate(t)
+        return float(result) if result.ndim == 0 else result
+
+    def _price_batch(self, n_trades, time):
+        return self._interpolate(np.asarray(time, dtype=float))
+
+    def _interpolate(self, t: np.ndarray) -> np.ndarray:
+        if len(self.times) == 1:
+            return np.full(t.shape, self.prices[0])
+        last = len(self.times) - 2
+        idx = np.clip(np.searchsorted(self.times, t, side="right") - 1, 0, last)
+        dx = np.clip(t, self.times[0], self.times[-1]) - self.times[idx]
+        a, b, c, d = self._coefficients[idx].T
+        values = a + dx * (b + dx * (c + dx * d))
+        return np.exp(values) if self.interpolation == "log-linear" else values
+
+    # ------------------------------------------------------------------
+    # Updates
+    # ------------------------------------------------------------------
+    def update(self, indices: Any, prices: Any) -> None:
+        """Set the prices of the nodes at ``indices`` and refit the affected segments.
+
+        A node price enters the two adjacent segments, and with the
+        monotone-cubic scheme also the slopes of its neighbours, so at most
+        four segments per node are refitted.
+        """
+
+        indices = np.atleast_1d(np.asarray(indices))
+        if indices.dtype.kind not in "iu":
+            raise TypeError("indices must be integers")
+        n_nodes = len(self.times)
+        if np.any((indices < -n_nodes) | (indices >= n_nodes)):
+            raise IndexError("node index out of range")
+        indices = indices % n_nodes
+        prices = np.broadcast_to(np.asarray(prices, dtype=float), indices.shape)
+        self._check_prices(prices)
+
+        self.prices[indices] = prices
+        self._values[indices] = self._transform(prices)
+        reach = 2 if self.interpolation == "monotone-cubic" else 1
+        segments = (indices[:, None] + np.arange(-reach, reach)).ravel()
+        segments = np.unique(segments[(segments >= 0) & (segments < len(self._coefficients))])
+        self._fit(segments)
+
+    # ------------------------------------------------------------------
+    # Fitting
+    # ------------------------------------------------------------------
+    def _check_prices(self, prices: np.ndarray) -> None:
+        if self.interpolation == "log-linear" and np.any(prices <= 0):
+            raise ValueError("log-linear interpolation requires positive prices")
+
+    def _transform(self, prices: np.ndarray) -> np.ndarray:
+        return np.log(prices) if self.interpolation == "log-linear" else prices.astype(float)
+
+    def _secants(self, segments: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Return the widths and slopes of ``segments``."""
+
+        widths = self.times[segments + 1] - self.times[segments]
+        return widths, (self._values[segments + 1] - self._values[segments]) / widths
+
+    def _fit(self, segments: np.ndarray) -> None:
+        """Recompute the coefficients of ``segments`` from the node values."""
+
+        if not len(segments):
+            return
+        widths, slopes = self._secants(segments)
+        coefficients = self._coefficients
+        coefficients[segments, 0] = self._values[segments]
+        if self.interpolation != "monotone-cubic":
+            coefficients[segments, 1] = slopes
+            return
+        left = self._node_slopes(segments)
+        right = self._node_slopes(segments + 1)
+        coefficients[segments, 1] = left
+        coefficients[segments, 2] = (3.0 * slopes - 2.0 * left - right) / widths
+        coefficients[segments, 3] = (left + right - 2.0 * slopes) / widths**2
+
+    def _node_slopes(self, nodes: np.ndarray) -> np.ndarray:
+        """Return the Fritsch--Carlson derivatives at ``nodes``.
+
+        Interior derivatives are the weighted harmonic mean of the adjacent
+        secants (zero at local extrema); the end points use a one-sided
+        three-point estimate limited to preserve monotonicity.
+        """
+
+        n_segments = len(self._coefficients)
+        if n_segments == 1:
+            return np.broadcast_to(self._secants(np.array([0]))[1], nodes.shape).copy()
+        derivatives = np.empty(len(nodes))
 
-        if time <= self.times[0]:
-            return self.prices[0]
-        if time >= self.times[-1]:
-            return self.prices[-1]
+        interior = (nodes > 0) & (nodes < n_segments)
+        j = nodes[interior]
+        h0, d0 = self._secants(j - 1)
+        h1, d1 = self._secants(j)
+        w0, w1 = 2.0 * h1 + h0, h1 + 2.0 * h0
+        with np.errstate(divide="ignore", invalid="ignore"):
+            harmonic = (w0 + w1) / (w0 / d0 + w1 / d1)
+        derivatives[interior] = np.where(d0 * d1 > 0, harmonic, 0.0)
 
-        idx = bisect_left(self.times, time)
-        t0, t1 = self.times[idx - 1], self.times[idx]
-        p0, p1 = self.prices[idx - 1], self.prices[idx]
-        weight = (time - t0) / (t1 - t0)
-        return p0 + weight * (p1 - p0)
+        for end, near, far in ((0, 0, 1), (n_segments, n_segments - 1, n_segments - 2)):
+            mask = nodes == end
+            if not mask.any():
+                continue
+            (h0, h1), (d0, d1) = self._secants(np.array([near, far]))
+            slope = ((2.0 * h0 + h1) * d0 - h0 * d1) / (h0 + h1)
+            if np.sign(slope) != np.sign(d0):
+                slope = 0.0
+            elif np.sign(d0) != np.sign(d1) and abs(slope) > 3.0 * abs(d0):
+                slope = 3.0 * d0
+            derivatives[mask] = slope
+        return derivatives
@@ -0,0 +1,610 @@
+"""Shared Monte Carlo path-generation engine.
+
+The helpers in this module generate geometric Brownian motion paths for a
+whole block of Monte Carlo paths at once.  Rather than stepping every path in
+Python, a ``(paths x observations)`` matrix of log-returns is drawn in a single
+call, accumulated with ``np.cumsum`` and exponentiated.  Paths are produced in
+chunks so that memory usage stays bounded irrespective of ``n_paths``.
+
+Random numbers never come from NumPy's global state.  Every pricer accepts a
+``seed`` which may be an integer, a :class:`numpy.random.SeedSequence` or a
+:class:`numpy.random.Generator`.  Integer and ``SeedSequence`` seeds are
+spawned into one independent child stream per chunk, so a rerun with the
+same seed is bit-identical.  To shard a valuation across processes, split it
+with :func:`spawn_seeds` and give every worker its own child seed; the
+combined result is reproducible regardless of where each shard runs.
+
+As an alternative to pseudo-random numbers, ``qmc=True`` draws scrambled
+Sobol points and maps them onto the time grid with a Brownian-bridge
+construction, so that the leading (best distributed) Sobol coordinates drive
+the coarse shape of every path.  Independent scramblings provide randomized
+QMC replications from which the standard error is estimated.
+
+Statistics are accumulated online, chunk by chunk, so that memory does not
+grow with the number of paths.  Given an absolute or relative tolerance on
+the standard error, :func:`simulate` stops as soon as the tolerance is met
+and treats ``n_paths`` as a cap.
+"""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass, replace
+from typing import Callable, Iterator, Union
+
+import numpy as np
+from scipy.special import ndtri
+from scipy.stats import qmc as scipy_qmc
+
+from . import instrumentation
+
+#: Accepted types for the ``seed`` argument of the Monte Carlo pricers.
+Seed = Union[None, int, np.random.SeedSequence, np.random.Generator]
+
+#: Upper bound on the number of matrix elements held in memory per chunk.
+MAX_CHUNK_ELEMENTS = 2_000_000
+
+#: Default number of paths per chunk when stopping on a tolerance.
+STOPPING_CHUNK_PATHS = 8_192
+
+#: Minimum number of samples before a tolerance is trusted to be met.
+MIN_STOPPING_PATHS = 1_000
+
+
+def chunk_sizes(n_paths: int, n_steps: int, chunk_size: int | None = None) -> Iterator[int]:
+    """Yield the number of paths in each chunk.
+
+    Parameters
+    ----------
+    n_paths:
+        Total number of Monte Carlo paths.
+    n_steps:
+        Number of time steps per path.
+    chunk_size:
+        Maximum number of paths per chunk.  Defaults to as many paths as fit
+        into :data:`MAX_CHUNK_ELEMENTS`.
+    """
+
+    if n_paths <= 0:
+        raise ValueError("n_paths must be positive")
+    if n_steps <= 0:
+        raise ValueError("n_steps must be positive")
+    if chunk_size is None:
+        chunk_size = max(1, MAX_CHUNK_ELEMENTS // n_steps)
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive")
+
+    remaining = n_paths
+    while remaining > 0:
+        size = min(chunk_size, remaining)
+        yield size
+        remaining -= size
+
+
+@dataclass(frozen=True)
+class MonteCarloResult:
+    """Monte Carlo estimate together with its sampling error.
+
+    Attributes
+    ----------
+    price:
+        Present value estimate.
+    std_error:
+        Standard error of ``price``.
+    n_paths:
+        Number of paths actually simulated.
+    variance_reduction:
+        Variance of the plain Monte Carlo estimator with the same number of
+        paths divided by the variance achieved, ``1.0`` without variance
+        reduction.
+    wall_time:
+        Seconds spent in the simulation.
+    converged:
+        Whether the requested tolerance was met before the path cap, ``None``
+        when no tolerance was requested.
+
+    Estimators with several outputs carry arrays in ``price`` and
+    ``std_error``.
+    """
+
+    price: float
+    std_error: float
+    n_paths: int
+    variance_reduction: float = 1.0
+    wall_time: float = 0.0
+    converged: bool | None = None
+
+    def __float__(self) -> float:
+        return float(self.price)
+
+    def confidence_interval(self, level: float = 0.95) -> tuple[float, float]:
+        """Return the normal-approximation confidence interval for ``price``."""
+
+        if not 0.0 < level < 1.0:
+            raise ValueError("level must be in (0, 1)")
+        half_width = ndtri(0.5 + 0.5 * level) * np.asarray(self.std_error)
+        return self.price - half_width, self.price + half_width
+
+    def scaled(self, factor: float) -> "MonteCarloResult":
+        """Return the result with price and error multiplied by ``factor``."""
+
+        return replace(self, price=self.price * factor, std_error=self.std_error * factor)
+
+
+def spawn_seeds(seed: Seed, n: int) -> list[np.random.SeedSequence]:
+    """Return ``n`` independent child seeds derived from ``seed``.
+
+    A ``Generator`` seed contributes fresh entropy drawn from the generator,
+    which keeps the children reproducible whenever the generator itself is.
+    """
+
+    if isinstance(seed, np.random.Generator):
+        seed = np.random.SeedSequence(seed.integers(2**63))
+    elif not isinstance(seed, np.random.SeedSequence):
+        seed = np.random.SeedSequence(seed)
+    return seed.spawn(n)
+
+
+def chunk_generators(seed: Seed, n_chunks: int) -> Iterator[np.random.Generator]:
+    """Yield one random number generator per chunk.
+
+    A ``Generator`` is used as-is for every chunk.  Otherwise each chunk
+    draws from its own child of ``seed`` so that results do not depend on
+    the order in which chunks are evaluated.
+    """
+
+    if isinstance(seed, np.random.Generator):
+        for _ in range(n_chunks):
+            yield seed
+        return
+    for child in spawn_seeds(seed, n_chunks):
+        yield np.random.default_rng(child)
+
+
+def log_returns(
+    n_paths: int,
+    n_steps: int,
+    drift: float,
+    diffusion: float,
+    rng: np.random.Generator,
+) -> np.ndarray:
+    """Return a ``(n_paths, n_steps)`` matrix of GBM log-returns.
+
+    ``drift`` and ``diffusion`` are the per-step mean and standard deviation
+    of the log-return, i.e. ``(r - q - 0.5 * vol**2) * dt`` and
+    ``vol * sqrt(dt)``.
+    """
+
+    return drift + diffusion * rng.standard_normal((n_paths, n_steps))
+
+
+def _bridge_plan(n_steps: int) -> list[tuple[int, int, int, float, float, float]]:
+    """Return the construction order of a Brownian bridge on ``n_steps`` points.
+
+    Each entry ``(target, left, right, left_weight, right_weight, scale)``
+    fills ``W[target]`` from the already known ``W[left]`` and ``W[right]``
+    with a standard normal scaled by ``scale``.  Index ``0`` is time zero and
+    time is measured in steps.  The terminal point comes first, followed by
+    successive midpoints, so that early dimensions carry most variance.
+    """
+
+    plan = [(n_steps, 0, 0, 0.0, 0.0, float(np.sqrt(n_steps)))]
+    intervals = [(0, n_steps)]
+    while intervals:
+        next_intervals = []
+        for left, right in intervals:
+            if right - left < 2:
+                continue
+            mid = (left + right) // 2
+            plan.append(
+                (
+                    mid,
+                    left,
+                    right,
+                    (right - mid) / (right - left),
+                    (mid - left) / (right - left),
+                    float(np.sqrt((mid - left) * (right - mid) / (right - left))),
+                )
+            )
+            next_intervals.extend(((left, mid), (mid, right)))
+        intervals = next_intervals
+    return plan
+
+
+def brownian_bridge(normals: np.ndarray) -> np.ndarray:
+    """Map standard normals onto Brownian increments via a Brownian bridge.
+
+    Column ``k`` of ``normals`` drives the ``k``-th point of the bridge
+    construction.  The result has the same shape and contains independent
+    standard normal increments per unit time step, ready for
+    :func:`log_returns`-style scaling.
+    """
+
+    n_paths, n_steps = normals.shape
+    brownian = np.zeros((n_paths, n_steps + 1))
+    for k, (target, left, right, wl, wr, scale) in enumerate(_bridge_plan(n_steps)):
+        brownian[:, target] = wl * brownian[:, left] + wr * brownian[:, right] + scale * normals[:, k]
+    return np.diff(brownian, axis=1)
+
+
+def sobol_normals(
+    n_paths: int,
+    n_steps: int,
+    chunk_size: int | None,
+    seed: Seed,
+) -> Iterator[np.ndarray]:
+    """Yield chunks of Brownian-bridge increments driven by scrambled Sobol points.
+
+    ``n_paths`` should be a power of two to preserve the balance properties
+    of the sequence; chunks are rounded down to a power of two as well.
+    """
+
+    sampler = scipy_qmc.Sobol(d=n_steps, scramble=True, seed=np.random.default_rng(seed))
+    if chunk_size is None:
+        chunk_size = max(1, MAX_CHUNK_ELEMENTS // n_steps)
+    chunk_size = 1 << (chunk_size.bit_length() - 1)
+    for size in chunk_sizes(n_paths, n_steps, chunk_size):
+        uniforms = np.clip(sampler.random(size), 1e-16, 1.0 - 1e-16)
+        yield brownian_bridge(ndtri(uniforms))
+
+
+def gbm_paths(spot: float, increments: np.ndarray) -> np.ndarray:
+    """Return price paths from a matrix of log-return ``increments``.
+
+    The log-returns are accumulated along the time axis with ``np.cumsum`` so
+    that column ``j`` holds the price at observation ``j + 1``.
+    """
+
+    return spot * np.exp(np.cumsum(increments, axis=1))
+
+
+def running_average(paths: np.ndarray) -> np.ndarray:
+    """Return the running arithmetic average of every path.
+
+    Column ``j`` of the result is the average of the first ``j + 1``
+    observations, obtained from a cumulative sum along the time axis.
+    """
+
+    counts = np.arange(1, paths.shape[1] + 1)
+    return np.cumsum(paths, axis=1) / counts
+
+
+class _Moments:
+    """Running mean and centred second moments of per-path estimator values.
+
+    Blocks of samples are folded in with the pairwise form of Welford's
+    update, which avoids the cancellation of raw power sums when the mean is
+    large compared with the spread.  Besides the variance of every estimator
+    the co-moment of the first and last estimator (target and control) is
+    kept, and separately the moments of the raw, unpaired path values.
+    """
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.center = 0.0
+        self.m2 = 0.0
+        self.cross = 0.0
+        self.raw_count = 0
+        self.raw_center = 0.0
+        self.raw_m2 = 0.0
+
+    def add(self, values: np.ndarray, raw: np.ndarray) -> None:
+        """Add a ``(k, chunk)`` block of samples and the raw path values behind them."""
+
+        block = _Moments()
+        block.count = values.shape[-1]
+        block.center = values.mean(axis=-1)
+        deviations = values - block.center[:, None]
+        block.m2 = (deviations * deviations).sum(axis=-1)
+        block.cross = (deviations[0] * deviations[-1]).sum()
+        block.raw_count = raw.shape[-1]
+        block.raw_center = raw[0].mean()
+        block.raw_m2 = ((raw[0] - block.raw_center) ** 2).sum()
+        self.merge(block)
+
+    def merge(self, other: "_Moments") -> None:
+        """Combine the moments of ``other`` into these."""
+
+        if other.count:
+            count = self.count + other.count
+            delta = other.center - self.center
+            weight = self.count * other.count / count
+            self.m2 = self.m2 + other.m2 + delta * delta * weight
+            self.cross = self.cross + other.cross + delta[0] * delta[-1] * weight
+            self.center = self.center + delta * other.count / count
+            self.count = count
+        if other.raw_count:
+            count = self.raw_count + other.raw_count
+            delta = other.raw_center - self.raw_center
+            weight = self.raw_count * other.raw_count / count
+            self.raw_m2 = self.raw_m2 + other.raw_m2 + delta * delta * weight
+            self.raw_center = self.raw_center + delta * other.raw_count / count
+            self.raw_count = count
+
+    def mean(self) -> np.ndarray:
+        return np.asarray(self.center)
+
+    def variance(self) -> np.ndarray:
+        return np.asarray(self.m2) / max(1, self.count - 1)
+
+    def covariance(self) -> float:
+        return self.cross / max(1, self.count - 1)
+
+    def raw_variance(self) -> float:
+        return self.raw_m2 / max(1, self.raw_count - 1)
+
+    def estimate(self, control_mean: float | None) -> tuple[np.ndarray, np.ndarray]:
+        """Return the mean and standard error, adjusted with a control variate if given."""
+
+        mean = self.mean()
+        variance = self.variance()
+        if control_mean is not None:
+            beta = self.covariance() / variance[-1] if variance[-1] > 0 else 0.0
+            mean = mean[:1] - beta * (mean[-1] - control_mean)
+            variance = variance[:1] - beta * self.covariance()
+        return mean, np.sqrt(np.maximum(variance, 0.0) / self.count)
+
+
+def simulate(
+    payoff: Callable[[np.ndarray], np.ndarray],
+    n_paths: int,
+    n_steps: int,
+    drift: float,
+    diffusion: float,
+    chunk_size: int | None = None,
+    seed: Seed = None,
+    qmc: bool = False,
+    n_replications: int = 8,
+    antithetic: bool = False,
+    control_mean: float | None = None,
+    abs_tol: float | None = None,
+    rel_tol: float | None = None,
+) -> MonteCarloResult:
+    """Return the Monte Carlo mean of ``payoff`` with its standard error.
+
+    Parameters
+    ----------
+    payoff:
+        Callable mapping a chunk of log-return increments of shape
+        ``(chunk, n_steps)`` to an array of per-path payoffs.  The payoff may
+        also return several estimators at once as an array of shape
+        ``(k, chunk)``.
+    n_paths:
+        Total number of Monte Carlo paths.
+    n_steps:
+        Number of time steps per path.
+    drift, diffusion:
+        Per-step mean and standard deviation of the log-return.
+    chunk_size:
+        Maximum number of paths simulated at once.
+    seed:
+        Seed or generator for the random numbers, see the module notes.
+    qmc:
+        Use scrambled Sobol points with Brownian-bridge construction.
+    n_replications:
+        Number of independently scrambled QMC replications.  The paths of
+        each replication are rounded up to a power of two.
+    antithetic:
+        Pair every path with its mirror image, driven by the negated normals.
+        Half of ``n_paths`` are drawn and the pair averages are the samples.
+    control_mean:
+        Known expectation of a control variate.  ``payoff`` must then return
+        a ``(2, chunk)`` array of target and control values, and the target
+        mean is adjusted with the optimal regression coefficient.
+    abs_tol, rel_tol:
+        Stop once the standard error is at most ``abs_tol``, or at most
+        ``rel_tol`` times the absolute mean, checked after every chunk of at
+        least :data:`MIN_STOPPING_PATHS` samples.  ``n_paths`` is then the
+        cap on the number of paths, and ``chunk_size`` defaults to
+        :data:`STOPPING_CHUNK_PATHS`.  Not available with ``qmc``.
+
+    Returns
+    -------
+    MonteCarloResult
+        Undiscounted mean, standard error, number of paths simulated,
+        variance reduction relative to plain Monte Carlo and wall time.
+    """
+
+    start = time.perf_counter()
+    stopping = abs_tol is not None or rel_tol is not None
+    if stopping:
+        if qmc:
+            raise ValueError("abs_tol and rel_tol are not supported with qmc")
+        if chunk_size is None:
+            chunk_size = min(STOPPING_CHUNK_PATHS, max(1, MAX_CHUNK_ELEMENTS // n_steps))
+
+    draws = (n_paths + 1) // 2 if antithetic else n_paths
+    if qmc:
+        per_replication = 1 << max(0, int(np.ceil(np.log2(max(1, draws / n_replications)))))
+        streams = [
+            sobol_normals(per_replication, n_steps, chunk_size, rep_seed)
+            for rep_seed in spawn_seeds(seed, n_replications)
+        ]
+    else:
+        sizes = list(chunk_sizes(draws, n_steps, chunk_size))
+        generators = chunk_generators(seed, len(sizes))
+        streams = [(rng.standard_normal((size, n_steps)) for size, rng in zip(sizes, generators))]
+
+    converged = False if stopping else None
+    replications = []
+    for stream in streams:
+        moments = _Moments()
+        for normals in stream:
+            if antithetic:
+                raw = np.atleast_2d(payoff(drift + diffusion * np.concatenate((normals, -normals))))
+                half = len(normals)
+                values = 0.5 * (raw[:, :half] + raw[:, half:])
+            else:
+                raw = values = np.atleast_2d(payoff(drift + diffusion * normals))
+            moments.add(values, raw)
+            if stopping and moments.count >= MIN_STOPPING_PATHS:
+                mean, std_error = moments.estimate(control_mean)
+                if _tolerance_met(mean, std_error, abs_tol, rel_tol):
+                    converged = True
+                    break
+        replications.append(moments)
+
+    pooled = _Moments()
+    for moments in replications:
+        pooled.merge(moments)
+
+    if qmc:
+        # All replications share the control coefficient of the pooled sample.
+        beta = 0.0
+        if control_mean is not None:
+            control_variance = pooled.variance()[-1]
+            beta = pooled.covariance() / control_variance if control_variance > 0 else 0.0
+            estimates = np.array(
+                [m.mean()[:1] - beta * (m.mean()[-1] - control_mean) for m in replications]
+            )
+        else:
+            estimates = np.array([m.mean() for m in replications])
+        mean = estimates.mean(axis=0)
+        std_error = estimates.std(axis=0, ddof=1) / np.sqrt(n_replications)
+    else:
+        mean, std_error = pooled.estimate(control_mean)
+
+    plain_error_sq = float(pooled.raw_variance()) / pooled.raw_count
+    achieved = float(std_error[0]) ** 2
+    reduction = plain_error_sq / achieved if achieved > 0 else float("inf")
+
+    if mean.shape == (1,):
+        mean, std_error = float(mean[0]), float(std_error[0])
+    wall_time = time.perf_counter() - start
+    instrumentation.record_simulation(pooled.raw_count, n_steps)
+    return MonteCarloResult(mean, std_error, pooled.raw_count, reduction, wall_time, converged)
+
+
+def _tolerance_met(
+    mean: np.ndarray, std_error: np.ndarray, abs_tol: float | None, rel_tol: float | None
+) -> bool:
+    """Return whether every standard error is within the absolute or relative tolerance."""
+
+    limit = np.zeros_like(std_error)
+    if abs_tol is not None:
+        limit = np.maximum(limit, abs_tol)
+    if rel_tol is not None:
+        limit = np.maximum(limit, rel_tol * np.abs(mean))
+    return bool(np.all(std_error <= limit))
+
+
+def simulate_mean(
+    payoff: Callable[[np.ndarray], np.ndarray],
+    n_paths: int,
+    n_steps: int,
+    drift: float,
+    diffusion: float,
+    chunk_size: int | None = None,
+    seed: Seed = None,
+) -> float | np.ndarray:
+    """Return only the Monte Carlo mean of ``payoff``, see :func:`simulate`."""
+
+    return simulate(payoff, n_paths, n_steps, drift, diffusion, chunk_size, seed).price
+
+
+def gbm_greeks(
+    payoff: Callable[[np.ndarray], tuple[np.ndarray, np.ndarray]],
+    spot: float,
+    rate: float,
+    carry: float,
+    vol: float,
+    maturity: float,
+    n_steps: int,
+    n_paths: int,
+    chunk_size: int | None = None,
+    seed: Seed = None,
+) -> dict[str, float]:
+    """Return price and Greeks of a path-dependent GBM payoff in one pass.
+
+    ``payoff`` maps a chunk of price paths to the per-path payoff and its
+    gradient with respect to every observation.  Delta, vega, rho and theta
+    use the pathwise estimator, which requires the payoff to be Lipschitz in
+    the path.  Gamma uses the mixed pathwise/likelihood-ratio estimator: the
+    pathwise delta is differentiated through the density of the first step.
+
+    Parameters
+    ----------
+    payoff:
+        Callable returning ``(values, gradient)`` for a ``(chunk, n_steps)``
+        matrix of prices, with ``values`` of shape ``(chunk,)`` and
+        ``gradient`` of shape ``(chunk, n_steps)``.
+    spot, rate, vol, maturity:
+        Black--Scholes inputs.  Observations are equally spaced on
+        ``(0, maturity]``.
+    carry:
+        Continuous yield subtracted from ``rate`` in the drift (dividend or
+        convenience yield).
+    n_steps, n_paths, chunk_size, seed:
+        Simulation settings, see :func:`simulate_mean`.
+
+    Returns
+    -------
+    dict
+        ``price``, ``delta``, ``gamma``, ``vega``, ``rho`` and ``theta``.
+        Theta is the derivative with respect to calendar time, ``-dV/dT``.
+    """
+
+    dt = maturity / n_steps
+    mu = rate - carry - 0.5 * vol ** 2
+    drift = mu * dt
+    diffusion = vol * np.sqrt(dt)
+    times = dt * np.arange(1, n_steps + 1)
+
+    def estimators(increments: np.ndarray) -> np.ndarray:
+        log_paths = np.cumsum(increments, axis=1)
+        paths = spot * np.exp(log_paths)
+        brownian = (log_paths - mu * times) / vol
+        values, gradient = payoff(paths)
+        weighted = gradient * paths
+
+        delta = weighted.sum(axis=1) / spot
+        score = brownian[:, 0] / (vol * dt)
+        gamma = delta * (score - 1.0) / spot
+        vega = (weighted * (brownian - vol * times)).sum(axis=1)
+        rho = (weighted * times).sum(axis=1)
+        dtime = (weighted * (mu * times + 0.5 * vol * brownian) / maturity).sum(axis=1)
+        return np.stack((values, delta, gamma, vega, rho, dtime))
+
+    value, delta, gamma, vega, rho, dtime = simulate_mean(
+        estimators, n_paths, n_steps, drift, diffusion, chunk_size, seed
+    )
+    df = np.exp(-rate * maturity)
+    return {
+        "price": float(df * value),
+        "delta": float(df * delta),
+        "gamma": float(df * gamma),
+        "vega": float(df * vega),
+        "rho": float(df * (rho - maturity * value)),
+        "theta": float(df * (rate * value - dtime)),
+    }
+
+
+def barrier_survival(
+    paths: np.ndarray,
+    spot: float,
+    barrier: float,
+    is_down: bool,
+    step_variance: float,
+) -> np.ndarray:
+    """Return the probability that each path never touched ``barrier``.
+
+    Between two consecutive grid points the log-price is a Brownian bridge,
+    so the probability of crossing the barrier within the step is::
+
+        p = exp(-2 * ln(S_i / H) * ln(S_{i+1} / H) / (vol**2 * dt))
+
+    Paths observed beyond the barrier at a grid point survive with probability
+    zero; otherwise the survival probability is the product of ``1 - p`` over
+    all steps.  ``step_variance`` is ``vol**2 * dt``.
+    """
+
+    distance = np.log(paths / barrier)
+    start = np.log(spot / barrier)
+    if not is_down:
+        distance = -distance
+        start = -start
+    previous = np.concatenate((np.full((paths.shape[0], 1), start), distance[:, :-1]), axis=1)
+
+    alive = (start > 0) & np.all(distance > 0, axis=1)
+    crossing = np.exp(-2.0 * np.clip(previous, 0.0, None) * np.clip(distance, 0.0, None) / step_variance)
+    return np.where(alive, np.prod(1.0 - crossing, axis=1), 0.0)
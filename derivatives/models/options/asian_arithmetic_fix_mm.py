@@ -1,10 +1,49 @@
 """Arithmetic Asian option model with fixed monitoring dates."""
 
-from math import exp
+from math import exp, log, sqrt
 
 import numpy as np
+from scipy.stats import norm
 
+from ..backends import get_kernel
 from ..base import DerivativeModel
+from ..monte_carlo import (
+    MonteCarloResult,
+    Seed,
+    gbm_greeks,
+    simulate,
+)
+
+def geometric_asian_price(
+    spot: float,
+    strike: float,
+    rate: float,
+    carry: float,
+    vol: float,
+    maturity: float,
+    num_obs: int,
+    is_call: bool = True,
+) -> float:
+    """Closed-form value of a discretely monitored geometric-average Asian option.
+
+    The fixings are equally spaced on ``(0, maturity]``.  The log of the
+    geometric average is normally distributed with mean
+    ``log(spot) + (rate - carry - vol**2 / 2) * maturity * (n + 1) / (2 n)``
+    and variance ``vol**2 * maturity * (n + 1) * (2 n + 1) / (6 n**2)``.
+    """
+
+    n = num_obs
+    mean = log(spot) + (rate - carry - 0.5 * vol ** 2) * maturity * (n + 1) / (2 * n)
+    variance = vol ** 2 * maturity * (n + 1) * (2 * n + 1) / (6 * n ** 2)
+    forward = exp(mean + 0.5 * variance)
+    d1 = (mean - log(strike) + variance) / sqrt(variance)
+    d2 = d1 - sqrt(variance)
+    if is_call:
+        value = forward * norm.cdf(d1) - strike * norm.cdf(d2)
+    else:
+        value = strike * norm.cdf(-d2) - forward * norm.cdf(-d1)
+    return float(exp(-rate * maturity) * value)
+
 
 class AsianArithmeticFixMM(DerivativeModel):
     """Monte Carlo pricer for arithmetic-average Asian options.
@@ -23,7 +62,17 @@ class AsianArithmeticFixMM(DerivativeModel):
         num_obs: int,
         is_call: bool = True,
         n_paths: int = 10_000,
-    ) -> float:
+        chunk_size: int | None = None,
+        seed: Seed = None,
+        qmc: bool = False,
+        n_replications: int = 8,
+        return_result: bool = False,
+        control_variate: bool = False,
+        antithetic: bool = False,
+        abs_tol: float | None = None,
+        rel_tol: float | None = None,
+        backend: str | None = None,
+    ) -> float | MonteCarloResult:
         """Return the value of the Asian option.
 
         Parameters
@@ -44,10 +93,38 @@ class AsianArithmeticFixMM(DerivativeModel):
             ``True`` for a call option, ``False`` for a put.
         n_paths:
             Number of Monte Carlo paths to simulate.
+        chunk_size:
+            Maximum number of paths simulated at once.  Bounds the memory
+            used by the path matrix.
+        seed:
+            Integer, ``SeedSequence`` or ``Generator`` for the random numbers.
+        qmc:
+            ``True`` to use scrambled Sobol points with Brownian-bridge path
+            construction instead of pseudo-random numbers.
+        n_replications:
+            Number of independently scrambled replications when ``qmc`` is
+            set.  Their spread provides the standard error.
+        return_result:
+            ``True`` to return a :class:`~derivatives.models.monte_carlo.MonteCarloResult`
+            carrying the standard error and variance reduction instead of a
+            plain price.
+        control_variate:
+            ``True`` to use the geometric-average Asian option, which has a
+            closed form, as a control variate.
+        antithetic:
+            ``True`` to pair every path with its antithetic counterpart.
+        abs_tol, rel_tol:
+            Absolute and relative tolerance on the standard error.  When
+            either is given, paths are simulated in chunks until it is met,
+            with ``n_paths`` as the cap.
+        backend:
+            Compute backend for the path kernel, see
+            :mod:`~derivatives.models.backends`.  ``None`` selects the
+            default backend.
 
         Returns
         -------
-        float
+        float or MonteCarloResult
             Present value of the Asian option.
         """
 
@@ -55,17 +132,60 @@ class AsianArithmeticFixMM(DerivativeModel):
         drift = (rate - 0.5 * vol ** 2) * dt
         diffusion = vol * np.sqrt(dt)
 
-        payoffs = np.zeros(n_paths)
-        for p in range(n_paths):
-            price_path = spot
-            running_sum = 0.0
-            for _ in range(num_obs):
-                price_path *= np.exp(drift + diffusion * np.random.normal())
-                running_sum += price_path
-            average_price = running_sum / num_obs
-            if is_call:
-                payoffs[p] = max(average_price - strike, 0.0)
-            else:
-                payoffs[p] = max(strike - average_price, 0.0)
-
-        return float(exp(-rate * maturity) * payoffs.mean())
+        phi = 1.0 if is_call else -1.0
+        control_mean = None
+        if control_variate:
+            control_mean = exp(rate * maturity) * geometric_asian_price(
+                spot, strike, rate, 0.0, vol, maturity, num_obs, is_call
+            )
+
+        average = get_kernel("arithmetic_average", backend)
+
+        def payoff(increments: np.ndarray) -> np.ndarray:
+            average_price = average(spot, increments)
+            values = np.maximum(phi * (average_price - strike), 0.0)
+            if not control_variate:
+                return values
+            geometric = spot * np.exp(np.cumsum(increments, axis=1).mean(axis=1))
+            return np.stack((values, np.maximum(phi * (geometric - strike), 0.0)))
+
+        df = exp(-rate * maturity)
+        result = simulate(
+            payoff, n_paths, num_obs, drift, diffusion, chunk_size, seed, qmc, n_replications,
+            antithetic, control_mean,
+            abs_tol=None if abs_tol is None else abs_tol / df, rel_tol=rel_tol,
+        ).scaled(df)
+        return result if return_result else result.price
+
+    def greeks(
+        self,
+        spot: float,
+        strike: float,
+        rate: float,
+        vol: float,
+        maturity: float,
+        num_obs: int,
+        is_call: bool = True,
+        n_paths: int = 10_000,
+        chunk_size: int | None = None,
+        seed: Seed = None,
+    ) -> dict[str, float]:
+        """Return price and Greeks from a single simulation pass.
+
+        Delta, vega, rho and theta use pathwise estimators and gamma the
+        mixed pathwise/likelihood-ratio estimator, see
+        :func:`~derivatives.models.monte_carlo.gbm_greeks`.  Arguments are
+        those of :meth:`price`.
+        """
+
+        phi = 1.0 if is_call else -1.0
+
+        def payoff(paths: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+            average_price = paths.mean(axis=1)
+            values = np.maximum(phi * (average_price - strike), 0.0)
+            in_the_money = phi * (values > 0.0)
+            return values, np.repeat(in_the_money[:, None] / num_obs, num_obs, axis=1)
+
+        return gbm_greeks(
+            payoff, spot, rate, 0.0, vol, maturity, num_obs, n_paths, chunk_size, seed
+        )
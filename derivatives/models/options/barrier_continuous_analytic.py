@@ -1,13 +1,22 @@
-"""Continuously monitored barrier option priced via Monte Carlo."""
+"""Continuously monitored barrier option priced analytically or via Monte Carlo."""
 
 from math import exp
 
 import numpy as np
+from scipy.stats import norm
 
+from ..backends import get_kernel
 from ..base import DerivativeModel
+from ..monte_carlo import MonteCarloResult, Seed, simulate
 
 class BarrierContinuousAnalytic(DerivativeModel):
-    """Approximate pricer for continuously monitored barrier options."""
+    """Pricer for continuously monitored knock-out barrier options.
+
+    By default the Reiner--Rubinstein closed form is used.  The Monte Carlo
+    method simulates a coarse grid and applies the Brownian-bridge crossing
+    probability between grid points, so that ``n_steps`` of 10--20 already
+    reproduces continuous monitoring.
+    """
 
     def price(
         self,
@@ -19,10 +28,19 @@ class BarrierContinuousAnalytic(DerivativeModel):
         maturity: float,
         is_call: bool = True,
         barrier_type: str = "down-and-out",
-        n_steps: int = 200,
+        n_steps: int = 20,
         n_paths: int = 10_000,
-    ) -> float:
-        """Return the value of the barrier option using simulation.
+        method: str = "analytic",
+        chunk_size: int | None = None,
+        seed: Seed = None,
+        qmc: bool = False,
+        n_replications: int = 8,
+        return_result: bool = False,
+        abs_tol: float | None = None,
+        rel_tol: float | None = None,
+        backend: str | None = None,
+    ) -> float | MonteCarloResult:
+        """Return the value of the barrier option.
 
         Parameters
         ----------
@@ -43,38 +61,129 @@ class BarrierContinuousAnalytic(DerivativeModel):
         barrier_type:
             Either ``"down-and-out"`` or ``"up-and-out"``.
         n_steps:
-            Number of monitoring steps used to approximate the continuous
-            barrier.
+            Number of simulation steps.  Crossings between steps are
+            accounted for with the Brownian-bridge correction.
         n_paths:
             Number of Monte Carlo paths.
+        method:
+            ``"analytic"`` for the closed form or ``"monte-carlo"`` for
+            simulation.
+        chunk_size:
+            Maximum number of paths simulated at once.
+        seed:
+            Integer, ``SeedSequence`` or ``Generator`` for the random numbers.
+        qmc:
+            ``True`` to use scrambled Sobol points with Brownian-bridge path
+            construction instead of pseudo-random numbers.
+        n_replications:
+            Number of independently scrambled replications when ``qmc`` is
+            set.  Their spread provides the standard error.
+        return_result:
+            ``True`` to return a :class:`~derivatives.models.monte_carlo.MonteCarloResult`
+            carrying the standard error instead of a plain price.
+        abs_tol, rel_tol:
+            Absolute and relative tolerance on the standard error.  When
+            either is given, paths are simulated in chunks until it is met,
+            with ``n_paths`` as the cap.
+        backend:
+            Compute backend for the path kernel, see
+            :mod:`~derivatives.models.backends`.  ``None`` selects the
+            default backend.
 
         Returns
         -------
-        float
+        float or MonteCarloResult
             Present value of the barrier option.
         """
 
+        if barrier_type not in ("down-and-out", "up-and-out"):
+            raise ValueError(f"Unsupported barrier type: {barrier_type}")
+        is_down = barrier_type == "down-and-out"
+        if (is_down and spot <= barrier) or (not is_down and spot >= barrier):
+            return MonteCarloResult(0.0, 0.0, 0) if return_result else 0.0
+
+        if method == "analytic":
+            value = float(self._analytic(spot, strike, barrier, rate, vol, maturity, is_call, is_down))
+            return MonteCarloResult(value, 0.0, 0) if return_result else value
+        if method != "monte-carlo":
+            raise ValueError(f"Unsupported method: {method}")
+
         dt = maturity / n_steps
         drift = (rate - 0.5 * vol ** 2) * dt
         diffusion = vol * np.sqrt(dt)
 
-        payoffs = np.zeros(n_paths)
-        for p in range(n_paths):
-            price_path = spot
-            knocked_out = False
-            for _ in range(n_steps):
-                price_path *= np.exp(drift + diffusion * np.random.normal())
-                if barrier_type == "down-and-out" and price_path <= barrier:
-                    knocked_out = True
-                    break
-                if barrier_type == "up-and-out" and price_path >= barrier:
-                    knocked_out = True
-                    break
-
-            if not knocked_out:
-                if is_call:
-                    payoffs[p] = max(price_path - strike, 0.0)
-                else:
-                    payoffs[p] = max(strike - price_path, 0.0)
-
-        return float(exp(-rate * maturity) * payoffs.mean())
+        bridge_survival = get_kernel("bridge_survival", backend)
+
+        def payoff(increments: np.ndarray) -> np.ndarray:
+            terminal, survival = bridge_survival(spot, increments, barrier, is_down, vol ** 2 * dt)
+            if is_call:
+                return survival * np.maximum(terminal - strike, 0.0)
+            return survival * np.maximum(strike - terminal, 0.0)
+
+        df = exp(-rate * maturity)
+        result = simulate(
+            payoff, n_paths, n_steps, drift, diffusion, chunk_size, seed, qmc, n_replications,
+            abs_tol=None if abs_tol is None else abs_tol / df, rel_tol=rel_tol,
+        ).scaled(df)
+        return result if return_result else result.price
+
+    def _price_batch(
+        self, n_trades, spot, strike, barrier, rate, vol, maturity,
+        is_call=True, barrier_type="down-and-out", method="analytic", **columns,
+    ):
+        """Vectorized closed-form value of ``n_trades`` barrier options."""
+
+        if np.any(method != "analytic") or np.any(columns.get("return_result", False)):
+            return super()._price_batch(
+                n_trades, spot=spot, strike=strike, barrier=barrier, rate=rate, vol=vol,
+                maturity=maturity, is_call=is_call, barrier_type=barrier_type, method=method,
+                **columns,
+            )
+        if not np.all(np.isin(barrier_type, ("down-and-out", "up-and-out"))):
+            raise ValueError("Unsupported barrier type")
+        is_down = np.asarray(barrier_type == "down-and-out")
+        value = self._analytic(spot, strike, barrier, rate, vol, maturity, is_call, is_down)
+        knocked = np.where(is_down, spot <= barrier, spot >= barrier)
+        return np.where(knocked, 0.0, value)
+
+    @staticmethod
+    def _analytic(spot, strike, barrier, rate, vol, maturity, is_call, is_down):
+        """Reiner--Rubinstein value of a knock-out option without rebate.
+
+        Arguments may be arrays, which are broadcast against each other.
+        """
+
+        is_call = np.asarray(is_call, dtype=bool)
+        is_down = np.asarray(is_down, dtype=bool)
+        phi = np.where(is_call, 1.0, -1.0)
+        eta = np.where(is_down, 1.0, -1.0)
+        sigma_t = vol * np.sqrt(maturity)
+        mu = (rate - 0.5 * vol ** 2) / vol ** 2
+        df = np.exp(-rate * maturity)
+        ratio = barrier / spot
+
+        x1 = np.log(spot / strike) / sigma_t + (1 + mu) * sigma_t
+        x2 = np.log(spot / barrier) / sigma_t + (1 + mu) * sigma_t
+        y1 = np.log(barrier ** 2 / (spot * strike)) / sigma_t + (1 + mu) * sigma_t
+        y2 = np.log(barrier / spot) / sigma_t + (1 + mu) * sigma_t
+
+        a = phi * spot * norm.cdf(phi * x1) - phi * strike * df * norm.cdf(phi * (x1 - sigma_t))
+        b = phi * spot * norm.cdf(phi * x2) - phi * strike * df * norm.cdf(phi * (x2 - sigma_t))
+        c = phi * spot * ratio ** (2 * (mu + 1)) * norm.cdf(eta * y1) - phi * strike * df * ratio ** (
+            2 * mu
+        ) * norm.cdf(eta * (y1 - sigma_t))
+        d = phi * spot * ratio ** (2 * (mu + 1)) * norm.cdf(eta * y2) - phi * strike * df * ratio ** (
+            2 * mu
+        ) * norm.cdf(eta * (y2 - sigma_t))
+
+        above = strike > barrier
+        value = np.select(
+            [is_call & is_down, is_call, is_down],
+            [
+                np.where(above, a - c, b - d),
+                np.where(above, 0.0, a - b + c - d),
+                np.where(above, a - b + c - d, 0.0),
+            ],
+            np.where(above, b - d, a - c),
+        )
+        return np.maximum(value, 0.0)
@@ -1,70 +1,318 @@
 """Arithmetic Asian option pricer for commodity underlyings."""
 
-from math import exp
+from __future__ import annotations
+
+import inspect
+from datetime import date
+from math import exp, log, sqrt
+from numbers import Real
+from typing import TYPE_CHECKING, Any, Mapping, Sequence
 
 import numpy as np
+from scipy.special import ndtr
 
+from ..backends import get_kernel
 from ..base import DerivativeModel
+from ..monte_carlo import (
+    MonteCarloResult,
+    Seed,
+    gbm_greeks,
+    simulate,
+)
+
+if TYPE_CHECKING:
+    from ..misc.price_curve import PriceCurve
+
+#: Pricing methods understood by :meth:`CommodityAsianOption.price`.
+METHODS = ("analytic", "monte-carlo")
+
+
+def _black(forward: float, strike: float, variance: float, is_call: bool) -> float:
+    """Undiscounted Black value of an option on a lognormal ``forward``."""
+
+    phi = 1.0 if is_call else -1.0
+    if variance <= 0.0 or strike <= 0.0:
+        return max(phi * (forward - strike), 0.0)
+    stdev = sqrt(variance)
+    d1 = (log(forward / strike) + 0.5 * variance) / stdev
+    d2 = d1 - stdev
+    return float(phi * (forward * ndtr(phi * d1) - strike * ndtr(phi * d2)))
+
+
+def _average_covariance(weights: np.ndarray, variances: np.ndarray, scale: np.ndarray) -> float:
+    """Return ``sum_ij w_i w_j s_i s_j v_min(i, j)`` for fixings in time order.
+
+    The double sum is accumulated in linear time from suffix sums of the
+    weights, since the covariance of two fixings is the variance of the
+    earlier one.
+    """
+
+    weighted = weights * scale
+    later = np.cumsum(weighted[::-1])[::-1] - weighted
+    return float(np.sum(weighted * variances * (weighted + 2.0 * later)))
+
 
 class CommodityAsianOption(DerivativeModel):
-    """Monte Carlo pricer for arithmetic-average Asian options on commodities."""
+    """Arithmetic-average Asian option on a commodity.
+
+    The underlying is described either by a spot price with flat rate and
+    convenience yield, or by a :class:`~derivatives.models.PriceCurve` of
+    forward prices read at the fixing dates.  Fixings are either
+    ``num_obs`` equally spaced dates up to ``maturity`` or explicit
+    ``fixing_times``.  The volatility may be flat, one value per fixing, or
+    a term structure object with a ``price(times)`` method (for example a
+    ``PriceCurve`` of implied volatilities).
+
+    Every fixing is lognormal around its forward with total variance
+    ``vol(t)**2 * t``, and two fixings are correlated through the variance
+    of the earlier one.  The default ``"analytic"`` method matches the first
+    two moments of the average to a lognormal (Turnbull--Wakeman, Levy) and
+    prices with Black's formula; ``"monte-carlo"`` simulates the fixings.
+    """
 
     def price(
         self,
-        spot: float,
+        spot: float | None,
         strike: float,
-        rate: float,
-        vol: float,
-        maturity: float,
-        num_obs: int,
+        rate: Any,
+        vol: Any,
+        maturity: float | None = None,
+        num_obs: int | None = None,
         convenience_yield: float = 0.0,
         is_call: bool = True,
         n_paths: int = 10_000,
-    ) -> float:
+        chunk_size: int | None = None,
+        seed: Seed = None,
+        qmc: bool = False,
+        n_replications: int = 8,
+        return_result: bool = False,
+        control_variate: bool = False,
+        antithetic: bool = False,
+        abs_tol: float | None = None,
+        rel_tol: float | None = None,
+        backend: str | None = None,
+        forward_curve: PriceCurve | None = None,
+        fixing_times: Sequence[float | date] | None = None,
+        valuation_date: date | None = None,
+        method: str = "analytic",
+    ) -> float | MonteCarloResult:
         """Return the option value.
 
         Parameters
         ----------
         spot:
-            Current spot price of the commodity.
+            Current spot price of the commodity, ``None`` with
+            ``forward_curve``.
         strike:
             Option strike level.
         rate:
-            Continuously compounded risk free rate.
+            Continuously compounded risk free rate, or a discount curve.
         vol:
-            Annualised volatility of the underlying.
+            Annualised volatility: a float, one value per fixing, or an
+            object whose ``price(times)`` returns the volatility to each
+            fixing.
         maturity:
-            Time to maturity in years.
+            Payment time in years, not before the last fixing.  Defaults to
+            the last fixing.
         num_obs:
-            Number of equally spaced observation dates.
+            Number of equally spaced observation dates up to ``maturity``,
+            used when ``fixing_times`` is not given.
         convenience_yield:
-            Convenience yield of the commodity.
+            Convenience yield of the commodity, used with ``spot``.
         is_call:
             ``True`` for a call option, ``False`` for a put.
         n_paths:
             Number of Monte Carlo paths.
+        chunk_size:
+            Maximum number of paths simulated at once.
+        seed:
+            Integer, ``SeedSequence`` or ``Generator`` for the random numbers.
+        qmc:
+            ``True`` to use scrambled Sobol points with Brownian-bridge path
+            construction instead of pseudo-random numbers.
+        n_replications:
+            Number of independently scrambled replications when ``qmc`` is
+            set.  Their spread provides the standard error.
+        return_result:
+            ``True`` to return a :class:`~derivatives.models.monte_carlo.MonteCarloResult`
+            carrying the standard error and variance reduction instead of a
+            plain price.  The analytic method reports a zero standard error.
+        control_variate:
+            ``True`` to use the geometric-average Asian option, which has a
+            closed form, as a control variate.
+        antithetic:
+            ``True`` to pair every path with its antithetic counterpart.
+        abs_tol, rel_tol:
+            Absolute and relative tolerance on the standard error.  When
+            either is given, paths are simulated in chunks until it is met,
+            with ``n_paths`` as the cap.
+        backend:
+            Compute backend for the path kernel, see
+            :mod:`~derivatives.models.backends`.  ``None`` selects the
+            default backend.
+        forward_curve:
+            Curve of forward prices by delivery time, replacing ``spot`` and
+            ``convenience_yield``.
+        fixing_times:
+            Explicit fixing times in years, or dates together with
+            ``valuation_date``.
+        valuation_date:
+            Date from which date fixings are measured (ACT/365).
+        method:
+            ``"analytic"`` (default) for the moment-matching approximation or
+            ``"monte-carlo"`` for simulation; the simulation arguments above
+            only apply to the latter.
 
         Returns
         -------
-        float
+        float or MonteCarloResult
             Present value of the Asian option.
         """
 
-        dt = maturity / num_obs
-        drift = (rate - convenience_yield - 0.5 * vol ** 2) * dt
-        diffusion = vol * np.sqrt(dt)
-
-        payoffs = np.zeros(n_paths)
-        for p in range(n_paths):
-            price_path = spot
-            running_sum = 0.0
-            for _ in range(num_obs):
-                price_path *= np.exp(drift + diffusion * np.random.normal())
-                running_sum += price_path
-            avg_price = running_sum / num_obs
-            if is_call:
-                payoffs[p] = max(avg_price - strike, 0.0)
-            else:
-                payoffs[p] = max(strike - avg_price, 0.0)
-
-        return float(exp(-rate * maturity) * payoffs.mean())
+        if method not in METHODS:
+            raise ValueError(f"Unsupported method: {method}")
+        times = self._fixing_times(fixing_times, valuation_date, maturity, num_obs)
+        if maturity is None:
+            maturity = times[-1]
+        elif maturity < times[-1]:
+            raise ValueError("maturity must not precede the last fixing")
+        if forward_curve is not None:
+            forwards = np.asarray(forward_curve.price(times), dtype=float)
+        elif spot is not None:
+            forwards = spot * np.exp(-convenience_yield * times) / self.discount(rate, times)
+        else:
+            raise ValueError("Provide spot or forward_curve")
+        variances = self._variances(vol, times)
+        df = self.discount(rate, maturity)
+        weights = np.full(len(times), 1.0 / len(times))
+
+        if method == "analytic":
+            first = float(weights @ forwards)
+            second = _average_covariance(weights, np.expm1(variances), forwards) + first**2
+            value = df * _black(first, strike, log(second / first**2), is_call)
+            return MonteCarloResult(value, 0.0, 0) if return_result else value
+
+        # Simulate the fixings themselves: log X_i = log F_i - v_i / 2 + W(v_i).
+        log_fixings = np.log(forwards) - 0.5 * variances
+        drift = np.diff(log_fixings, prepend=0.0)
+        diffusion = np.sqrt(np.diff(variances, prepend=0.0))
+
+        phi = 1.0 if is_call else -1.0
+        control_mean = None
+        if control_variate:
+            geometric_variance = _average_covariance(weights, variances, np.ones(len(times)))
+            geometric_forward = exp(weights @ log_fixings + 0.5 * geometric_variance)
+            control_mean = _black(geometric_forward, strike, geometric_variance, is_call)
+
+        average = get_kernel("arithmetic_average", backend)
+
+        def payoff(increments: np.ndarray) -> np.ndarray:
+            avg_price = average(1.0, increments)
+            values = np.maximum(phi * (avg_price - strike), 0.0)
+            if not control_variate:
+                return values
+            geometric = np.exp(np.cumsum(increments, axis=1).mean(axis=1))
+            return np.stack((values, np.maximum(phi * (geometric - strike), 0.0)))
+
+        result = simulate(
+            payoff, n_paths, len(times), drift, diffusion, chunk_size, seed, qmc, n_replications,
+            antithetic, control_mean,
+            abs_tol=None if abs_tol is None else abs_tol / df, rel_tol=rel_tol,
+        ).scaled(df)
+        return result if return_result else result.price
+
+    def _fixing_times(self, fixing_times, valuation_date, maturity, num_obs) -> np.ndarray:
+        """Return the fixing times in years, validated to be positive and increasing."""
+
+        if fixing_times is not None:
+            if len(fixing_times) and isinstance(fixing_times[0], date):
+                if valuation_date is None:
+                    raise ValueError("valuation_date is required for fixing dates")
+                fixing_times = self.year_fraction(valuation_date, list(fixing_times))
+            times = np.asarray(fixing_times, dtype=float)
+        elif maturity is not None and num_obs is not None:
+            times = maturity * np.arange(1, num_obs + 1) / num_obs
+        else:
+            raise ValueError("Provide fixing_times or maturity and num_obs")
+        if times.ndim != 1 or not len(times):
+            raise ValueError("at least one fixing is required")
+        if times[0] <= 0 or (times[1:] <= times[:-1]).any():
+            raise ValueError("fixing times must be positive and strictly increasing")
+        return times
+
+    @staticmethod
+    def _variances(vol: Any, times: np.ndarray) -> np.ndarray:
+        """Return the total variance ``vol(t)**2 * t`` to every fixing."""
+
+        vols = np.asarray(vol.price(times) if hasattr(vol, "price") else vol, dtype=float)
+        if (vols < 0).any():
+            raise ValueError("vol cannot be negative")
+        variances = vols**2 * times
+        if variances.shape != times.shape:
+            raise ValueError("vol must be a scalar or have one entry per fixing")
+        if (variances[1:] < variances[:-1]).any():
+            raise ValueError("vol term structure implies negative forward variance")
+        return variances
+
+    def greeks(self, *args: Any, **kwargs: Any) -> dict[str, float]:
+        """Return price and Greeks consistent with :meth:`price`.
+
+        Arguments are those of :meth:`price` plus the bump sizes of
+        :meth:`DerivativeModel.greeks`.  Greeks are computed by bump-and-reprice
+        with the chosen ``method``.  Spot, vol and rate are only bumped when
+        given as numbers, so a trade on a ``forward_curve`` has no delta or
+        gamma, and theta is left out when ``fixing_times`` are given because
+        the fixings do not move with the maturity.
+
+        Flat Monte Carlo trades (``method="monte-carlo"`` without curves,
+        explicit fixings or variance reduction) are instead valued in a single
+        simulation pass: delta, vega, rho and theta use pathwise estimators
+        and gamma the mixed pathwise/likelihood-ratio estimator, see
+        :func:`~derivatives.models.monte_carlo.gbm_greeks`.
+        """
+
+        price_kwargs = {name: value for name, value in kwargs.items() if not name.endswith("_bump")}
+        bound = inspect.signature(self.price).bind(*args, **price_kwargs)
+        bound.apply_defaults()
+        values = bound.arguments
+        single_pass = (
+            values["method"] == "monte-carlo"
+            and values["forward_curve"] is None
+            and values["fixing_times"] is None
+            and values["maturity"] is not None
+            and values["num_obs"] is not None
+            and isinstance(values["vol"], Real)
+            and not any(values[name] for name in ("qmc", "control_variate", "antithetic", "return_result"))
+            and values["abs_tol"] is None
+            and values["rel_tol"] is None
+        )
+        if not single_pass:
+            return super().greeks(*args, **kwargs)
+
+        strike, num_obs = values["strike"], values["num_obs"]
+        phi = 1.0 if values["is_call"] else -1.0
+
+        def payoff(paths: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+            avg_price = paths.mean(axis=1)
+            payoffs = np.maximum(phi * (avg_price - strike), 0.0)
+            in_the_money = phi * (payoffs > 0.0)
+            return payoffs, np.repeat(in_the_money[:, None] / num_obs, num_obs, axis=1)
+
+        return gbm_greeks(
+            payoff,
+            values["spot"],
+            values["rate"],
+            values["convenience_yield"],
+            values["vol"],
+            values["maturity"],
+            num_obs,
+            values["n_paths"],
+            values["chunk_size"],
+            values["seed"],
+        )
+
+    def _greek_parameters(self, arguments: Mapping[str, Any]) -> dict[str, str]:
+        names = super()._greek_parameters(arguments)
+        if arguments.get("fixing_times") is not None:
+            names.pop("maturity", None)
+        return names
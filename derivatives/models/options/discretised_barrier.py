@@ -4,10 +4,36 @@ from math import exp
 
 import numpy as np
 
+from ..backends import get_kernel
 from ..base import DerivativeModel
+from ..monte_carlo import MonteCarloResult, Seed, gbm_paths, simulate
+
+#: Arguments of ``price`` that define the simulated paths.  Trades that agree
+#: on all of them are priced from a single path matrix by ``price_batch``.
+PATH_ARGUMENTS = (
+    "spot",
+    "rate",
+    "vol",
+    "maturity",
+    "monitoring_times",
+    "n_paths",
+    "chunk_size",
+    "seed",
+    "qmc",
+    "n_replications",
+)
+
+#: Arguments only supported by ``price``.  Batches using them are priced
+#: trade by trade.
+PER_TRADE_ARGUMENTS = ("abs_tol", "rel_tol", "backend")
 
 class DiscretisedBarrier(DerivativeModel):
-    """Monte Carlo pricer for discretely monitored barrier options."""
+    """Monte Carlo pricer for discretely monitored barrier options.
+
+    ``price_shared_paths`` values many strike/barrier/type variants on the
+    same underlying and schedule from one set of simulated paths, and
+    ``price_batch`` groups trades by underlying and schedule to use it.
+    """
 
     def price(
         self,
@@ -21,7 +47,15 @@ class DiscretisedBarrier(DerivativeModel):
         is_call: bool = True,
         barrier_type: str = "down-and-out",
         n_paths: int = 10_000,
-    ) -> float:
+        chunk_size: int | None = None,
+        seed: Seed = None,
+        qmc: bool = False,
+        n_replications: int = 8,
+        return_result: bool = False,
+        abs_tol: float | None = None,
+        rel_tol: float | None = None,
+        backend: str | None = None,
+    ) -> float | MonteCarloResult:
         """Return the value of the discretely monitored barrier option.
 
         Parameters
@@ -46,10 +80,31 @@ class DiscretisedBarrier(DerivativeModel):
             Either ``"down-and-out"`` or ``"up-and-out"``.
         n_paths:
             Number of Monte Carlo paths.
+        chunk_size:
+            Maximum number of paths simulated at once.
+        seed:
+            Integer, ``SeedSequence`` or ``Generator`` for the random numbers.
+        qmc:
+            ``True`` to use scrambled Sobol points with Brownian-bridge path
+            construction instead of pseudo-random numbers.
+        n_replications:
+            Number of independently scrambled replications when ``qmc`` is
+            set.  Their spread provides the standard error.
+        return_result:
+            ``True`` to return a :class:`~derivatives.models.monte_carlo.MonteCarloResult`
+            carrying the standard error instead of a plain price.
+        abs_tol, rel_tol:
+            Absolute and relative tolerance on the standard error.  When
+            either is given, paths are simulated in chunks until it is met,
+            with ``n_paths`` as the cap.
+        backend:
+            Compute backend for the path kernel, see
+            :mod:`~derivatives.models.backends`.  ``None`` selects the
+            default backend.
 
         Returns
         -------
-        float
+        float or MonteCarloResult
             Present value of the option.
         """
 
@@ -57,23 +112,140 @@ class DiscretisedBarrier(DerivativeModel):
         drift = (rate - 0.5 * vol ** 2) * dt
         diffusion = vol * np.sqrt(dt)
 
-        payoffs = np.zeros(n_paths)
-        for p in range(n_paths):
-            price_path = spot
-            knocked_out = False
-            for _ in range(monitoring_times):
-                price_path *= np.exp(drift + diffusion * np.random.normal())
-                if barrier_type == "down-and-out" and price_path <= barrier:
-                    knocked_out = True
-                    break
-                if barrier_type == "up-and-out" and price_path >= barrier:
-                    knocked_out = True
-                    break
-
-            if not knocked_out:
-                if is_call:
-                    payoffs[p] = max(price_path - strike, 0.0)
-                else:
-                    payoffs[p] = max(strike - price_path, 0.0)
-
-        return float(exp(-rate * maturity) * payoffs.mean())
+        if barrier_type not in ("down-and-out", "up-and-out"):
+            raise ValueError(f"Unsupported barrier type: {barrier_type}")
+
+        knock_out = get_kernel("knock_out", backend)
+        is_down = barrier_type == "down-and-out"
+
+        def payoff(increments: np.ndarray) -> np.ndarray:
+            terminal, alive = knock_out(spot, increments, barrier, is_down)
+            if is_call:
+                return alive * np.maximum(terminal - strike, 0.0)
+            return alive * np.maximum(strike - terminal, 0.0)
+
+        df = exp(-rate * maturity)
+        result = simulate(
+            payoff, n_paths, monitoring_times, drift, diffusion, chunk_size, seed, qmc, n_replications,
+            abs_tol=None if abs_tol is None else abs_tol / df, rel_tol=rel_tol,
+        ).scaled(df)
+        return result if return_result else result.price
+
+    def price_shared_paths(
+        self,
+        spot: float,
+        strikes,
+        barriers,
+        rate: float,
+        vol: float,
+        maturity: float,
+        monitoring_times: int,
+        is_call=True,
+        barrier_types="down-and-out",
+        n_paths: int = 10_000,
+        chunk_size: int | None = None,
+        seed: Seed = None,
+        qmc: bool = False,
+        n_replications: int = 8,
+        return_result: bool = False,
+    ) -> np.ndarray | MonteCarloResult:
+        """Value many barrier options on one underlying from shared paths.
+
+        The path matrix is simulated once.  Only the running minimum, the
+        running maximum and the terminal value of each path are kept, and all
+        trades are evaluated against them in a single vectorized pass.
+
+        Parameters
+        ----------
+        strikes, barriers, is_call, barrier_types:
+            Per-trade arrays (or scalars shared by all trades).
+        Other parameters:
+            As for :meth:`price`.  Paths are simulated in the same chunks as
+            :meth:`price`, so with the same ``seed`` and ``chunk_size`` every
+            trade reproduces its own :meth:`price`.  The payoff matrix holds
+            one row per trade for each chunk; pass a smaller ``chunk_size``
+            to bound its memory for large books.
+
+        Returns
+        -------
+        numpy.ndarray or MonteCarloResult
+            One present value per trade.
+        """
+
+        strikes, barriers, is_call, barrier_types = np.broadcast_arrays(
+            np.asarray(strikes, dtype=float),
+            np.asarray(barriers, dtype=float),
+            np.asarray(is_call, dtype=bool),
+            np.asarray(barrier_types),
+        )
+        strikes, barriers, is_call, barrier_types = (
+            a.ravel() for a in (strikes, barriers, is_call, barrier_types)
+        )
+        unknown = ~np.isin(barrier_types, ("down-and-out", "up-and-out"))
+        if unknown.any():
+            raise ValueError(f"Unsupported barrier type: {barrier_types[unknown][0]}")
+        is_down = (barrier_types == "down-and-out")[:, None]
+        phi = np.where(is_call, 1.0, -1.0)[:, None]
+        strikes, barriers = strikes[:, None], barriers[:, None]
+
+        dt = maturity / monitoring_times
+        drift = (rate - 0.5 * vol ** 2) * dt
+        diffusion = vol * np.sqrt(dt)
+
+        def payoff(increments: np.ndarray) -> np.ndarray:
+            paths = gbm_paths(spot, increments)
+            low, high, terminal = paths.min(axis=1), paths.max(axis=1), paths[:, -1]
+            alive = np.where(is_down, low > barriers, high < barriers)
+            return alive * np.maximum(phi * (terminal - strikes), 0.0)
+
+        result = simulate(
+            payoff, n_paths, monitoring_times, drift, diffusion, chunk_size, seed, qmc, n_replications
+        ).scaled(exp(-rate * maturity))
+        if return_result:
+            return result
+        return np.atleast_1d(result.price)
+
+    def _price_batch(self, n_trades, **columns):
+        """Price trades sharing an underlying and schedule from common paths."""
+
+        if columns.get("return_result") is not None and np.any(columns["return_result"]):
+            return super()._price_batch(n_trades, **columns)
+        if any(name in columns for name in PER_TRADE_ARGUMENTS):
+            return super()._price_batch(n_trades, **columns)
+
+        columns.pop("return_result", None)
+        trade_columns = {
+            name: columns.pop(name, default)
+            for name, default in (
+                ("strike", None),
+                ("barrier", None),
+                ("is_call", True),
+                ("barrier_type", "down-and-out"),
+            )
+        }
+        missing = [name for name in ("strike", "barrier") if trade_columns[name] is None]
+        if missing:
+            raise TypeError(f"missing required columns: {', '.join(missing)}")
+
+        def entry(value, i):
+            return self._batch_scalar(value if np.ndim(value) == 0 else value[i])
+
+        groups: dict[tuple, list[int]] = {}
+        for i in range(n_trades):
+            key = tuple((name, entry(value, i)) for name, value in sorted(columns.items()))
+            groups.setdefault(key, []).append(i)
+
+        prices = np.empty(n_trades)
+        for key, indices in groups.items():
+            trades = {
+                name: np.broadcast_to(np.asarray(value), (n_trades,))[indices]
+                for name, value in trade_columns.items()
+            }
+            prices[indices] = self.price_shared_paths(
+                strikes=trades["strike"],
+                barriers=trades["barrier"],
+                is_call=trades["is_call"],
+                barrier_types=trades["barrier_type"],
+                **dict(key),
+            )
+        return prices
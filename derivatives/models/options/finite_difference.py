@@ -1,13 +1,33 @@
-"""Simple finite-difference solver for the Black--Scholes PDE."""
+"""Finite-difference solver for the Black--Scholes PDE."""
 
 from math import exp
 
 import numpy as np
 
+from ..backends import get_kernel
 from ..base import DerivativeModel
 
+#: Weight of the implicit part of the time step for each supported scheme.
+SCHEMES = {"explicit": 0.0, "implicit": 1.0, "crank-nicolson": 0.5}
+
+#: Number of fully implicit steps used to damp Crank--Nicolson oscillations
+#: caused by the non-smooth payoff (Rannacher start-up).
+RANNACHER_STEPS = 2
+
+
 class FiniteDifference(DerivativeModel):
-    """Explicit finite-difference pricer for European options."""
+    """Theta-scheme finite-difference pricer for vanilla and barrier options.
+
+    The PDE is discretised on a uniform spot grid and stepped backwards from
+    maturity.  The ``"explicit"`` scheme applies the spatial operator directly
+    and is only stable for small time steps.  The ``"implicit"`` and
+    ``"crank-nicolson"`` schemes solve a tridiagonal system per time step
+    with a banded LAPACK (Thomas) solver and are stable on fine grids.
+
+    Early exercise is handled by projecting the solution onto the exercise
+    value after every time step.  Knock-out barriers are imposed as zero
+    Dirichlet boundaries at the barrier level.
+    """
 
     def price(
         self,
@@ -20,6 +40,11 @@ class FiniteDifference(DerivativeModel):
         s_max: float | None = None,
         n_time: int = 200,
         n_space: int = 200,
+        scheme: str = "crank-nicolson",
+        american: bool = False,
+        barrier: float | None = None,
+        barrier_type: str = "down-and-out",
+        backend: str | None = None,
     ) -> float:
         """Solve the Black--Scholes PDE on a finite grid.
 
@@ -38,11 +63,25 @@ class FiniteDifference(DerivativeModel):
         is_call:
             ``True`` for a call, ``False`` for a put.
         s_max:
-            Maximum spot value considered in the grid. Defaults to ``2 * strike``.
+            Maximum spot value considered in the grid. Defaults to ``2 * strike``,
+            or to the barrier level for up-and-out options.
         n_time:
             Number of time steps in the grid.
         n_space:
             Number of price steps in the grid.
+        scheme:
+            ``"crank-nicolson"`` (the default), ``"implicit"`` or
+            ``"explicit"``.
+        american:
+            ``True`` to allow early exercise at any time step.
+        barrier:
+            Optional knock-out barrier level.
+        barrier_type:
+            Either ``"down-and-out"`` or ``"up-and-out"``.
+        backend:
+            Compute backend for the tridiagonal solves, see
+            :mod:`~derivatives.models.backends`.  ``None`` selects the
+            default backend.
 
         Returns
         -------
@@ -50,37 +89,92 @@ class FiniteDifference(DerivativeModel):
             Approximation of the option price.
         """
 
-        s_max = 2 * strike if s_max is None else s_max
+        if scheme not in SCHEMES:
+            raise ValueError(f"Unsupported scheme: {scheme}")
+        if barrier_type not in ("down-and-out", "up-and-out"):
+            raise ValueError(f"Unsupported barrier type: {barrier_type}")
 
-        dt = maturity / n_time
-        ds = s_max / n_space
+        s_min = 0.0
+        if s_max is None:
+            s_max = 2 * strike
+        if barrier is not None:
+            if barrier_type == "down-and-out":
+                if spot <= barrier:
+                    return 0.0
+                s_min = barrier
+            else:
+                if spot >= barrier:
+                    return 0.0
+                s_max = barrier
+        if not s_min <= spot <= s_max:
+            raise ValueError("spot must lie inside the grid")
 
-        grid = np.zeros(n_space + 1)
-        s_values = np.linspace(0, s_max, n_space + 1)
+        dt = maturity / n_time
+        ds = (s_max - s_min) / n_space
+        s_values = np.linspace(s_min, s_max, n_space + 1)
 
         if is_call:
-            grid = np.maximum(s_values - strike, 0)
+            payoff = np.maximum(s_values - strike, 0.0)
         else:
-            grid = np.maximum(strike - s_values, 0)
-
-        for _ in range(n_time):
-            new_grid = grid.copy()
-            for i in range(1, n_space):
-                s = i * ds
-                delta = (grid[i + 1] - grid[i - 1]) / (2 * ds)
-                gamma = (grid[i + 1] - 2 * grid[i] + grid[i - 1]) / (ds**2)
-                theta = (
-                    -0.5 * vol**2 * s**2 * gamma
-                    - rate * s * delta
-                    + rate * grid[i]
+            payoff = np.maximum(strike - s_values, 0.0)
+        grid = payoff.copy()
+
+        # Coefficients of the spatial operator L V_i = a V_{i-1} + b V_i + c V_{i+1}.
+        s_inner = s_values[1:-1]
+        diffusion = 0.5 * vol**2 * s_inner**2 / ds**2
+        convection = 0.5 * rate * s_inner / ds
+        lower = diffusion - convection
+        centre = -2.0 * diffusion - rate
+        upper = diffusion + convection
+        solve = get_kernel("tridiagonal", backend)
+
+        for step in range(n_time):
+            tau = (step + 1) * dt
+            theta = SCHEMES[scheme]
+            if scheme == "crank-nicolson" and step < RANNACHER_STEPS:
+                theta = 1.0
+
+            low_bc, high_bc = self._boundaries(
+                s_min, s_max, strike, rate, tau, is_call, american, barrier, barrier_type
+            )
+
+            explicit_part = grid[1:-1] + (1.0 - theta) * dt * (
+                lower * grid[:-2] + centre * grid[1:-1] + upper * grid[2:]
+            )
+            if theta == 0.0:
+                inner = explicit_part
+            else:
+                explicit_part[0] += theta * dt * lower[0] * low_bc
+                explicit_part[-1] += theta * dt * upper[-1] * high_bc
+                inner = solve(
+                    -theta * dt * lower[1:],
+                    1.0 - theta * dt * centre,
+                    -theta * dt * upper[:-1],
+                    explicit_part,
                 )
-                new_grid[i] = grid[i] - dt * theta
 
-            new_grid[0] = 0 if is_call else strike * exp(-rate * (_ * dt))
-            new_grid[-1] = s_max - strike * exp(-rate * (_ * dt)) if is_call else 0
-            grid = new_grid
+            grid = np.concatenate(([low_bc], inner, [high_bc]))
+            if american:
+                grid[1:-1] = np.maximum(grid[1:-1], payoff[1:-1])
 
-        i = int(spot / ds)
-        weight = (spot - i * ds) / ds
+        i = min(int((spot - s_min) / ds), n_space - 1)
+        weight = (spot - s_values[i]) / ds
         price = grid[i] * (1 - weight) + grid[i + 1] * weight
         return float(price)
+
+    @staticmethod
+    def _boundaries(s_min, s_max, strike, rate, tau, is_call, american, barrier, barrier_type):
+        """Return the Dirichlet values at ``s_min`` and ``s_max`` for time to expiry ``tau``."""
+
+        discounted_strike = strike if american and not is_call else strike * exp(-rate * tau)
+        if is_call:
+            low, high = 0.0, max(s_max - discounted_strike, 0.0)
+        else:
+            low, high = max(discounted_strike - s_min, 0.0), 0.0
+
+        if barrier is not None:
+            if barrier_type == "down-and-out":
+                low = 0.0
+            else:
+                high = 0.0
+        return low, high
@@ -2,6 +2,7 @@
 
 from math import exp, log, sqrt
 
+import numpy as np
 from scipy.stats import norm
 
 from ..base import DerivativeModel
@@ -53,3 +54,55 @@ class QEDIVariableStrikeWarrant(DerivativeModel):
             price = strike * df * norm.cdf(-d2) - spot * norm.cdf(-d1)
 
         return float(price)
+
+    def greeks(
+        self,
+        spot: float,
+        strike_ratio: float,
+        rate: float,
+        vol: float,
+        maturity: float,
+        is_call: bool = True,
+    ) -> dict[str, float]:
+        """Return the analytic Black--Scholes Greeks of the warrant.
+
+        The strike moves with the spot, so the value is homogeneous of degree
+        one in ``spot``: delta equals ``price / spot`` and gamma is zero.
+        """
+
+        strike = strike_ratio * spot
+        sqrt_t = sqrt(maturity)
+        d1 = (log(spot / strike) + (rate + 0.5 * vol ** 2) * maturity) / (vol * sqrt_t)
+        d2 = d1 - vol * sqrt_t
+
+        df = exp(-rate * maturity)
+        value = self.price(spot, strike_ratio, rate, vol, maturity, is_call)
+        decay = -spot * norm.pdf(d1) * vol / (2 * sqrt_t)
+        if is_call:
+            rho = strike * maturity * df * norm.cdf(d2)
+            theta = decay - rate * strike * df * norm.cdf(d2)
+        else:
+            rho = -strike * maturity * df * norm.cdf(-d2)
+            theta = decay + rate * strike * df * norm.cdf(-d2)
+
+        return {
+            "price": value,
+            "delta": value / spot,
+            "gamma": 0.0,
+            "vega": float(spot * norm.pdf(d1) * sqrt_t),
+            "rho": float(rho),
+            "theta": float(theta),
+        }
+
+    def _price_batch(self, n_trades, spot, strike_ratio, rate, vol, maturity, is_call=True):
+        """Vectorized Black--Scholes value of ``n_trades`` warrants."""
+
+        strike = strike_ratio * spot
+        sqrt_t = np.sqrt(maturity)
+        d1 = (np.log(spot / strike) + (rate + 0.5 * vol ** 2) * maturity) / (vol * sqrt_t)
+        d2 = d1 - vol * sqrt_t
+
+        df = np.exp(-rate * maturity)
+        call = spot * norm.cdf(d1) - strike * df * norm.cdf(d2)
+        put = strike * df * norm.cdf(-d2) - spot * norm.cdf(-d1)
+        return np.where(is_call, call, put)
@@ -2,6 +2,7 @@
 
 from math import exp, log, sqrt
 
+import numpy as np
 from scipy.stats import norm
 
 from ..base import DerivativeModel
@@ -9,6 +10,13 @@ from ..base import DerivativeModel
 class TheoreticalSimpleDividendOption(DerivativeModel):
     """Black--Scholes style option on an anticipated dividend payment."""
 
+    GREEK_PARAMETERS = {
+        "spot": "expected_dividend",
+        "vol": "vol",
+        "rate": "rate",
+        "maturity": "maturity",
+    }
+
     def price(
         self,
         expected_dividend: float,
@@ -60,3 +68,61 @@ class TheoreticalSimpleDividendOption(DerivativeModel):
             price = strike * norm.cdf(-d2) - expected_dividend * norm.cdf(-d1)
 
         return float(df * price)
+
+    def greeks(
+        self,
+        expected_dividend: float,
+        strike: float,
+        rate: float,
+        vol: float,
+        maturity: float,
+        is_call: bool = True,
+    ) -> dict[str, float]:
+        """Return the analytic Greeks of the dividend option.
+
+        Delta and gamma are taken with respect to ``expected_dividend``.
+        """
+
+        if vol <= 0 or maturity <= 0:
+            return super().greeks(expected_dividend, strike, rate, vol, maturity, is_call)
+        value = self.price(expected_dividend, strike, rate, vol, maturity, is_call)
+
+        sqrt_t = sqrt(maturity)
+        d1 = (log(expected_dividend / strike) + 0.5 * vol ** 2 * maturity) / (vol * sqrt_t)
+        df = exp(-rate * maturity)
+        delta = df * norm.cdf(d1) if is_call else -df * norm.cdf(-d1)
+        vega = df * expected_dividend * norm.pdf(d1) * sqrt_t
+
+        return {
+            "price": value,
+            "delta": float(delta),
+            "gamma": float(df * norm.pdf(d1) / (expected_dividend * vol * sqrt_t)),
+            "vega": float(vega),
+            "rho": -maturity * value,
+            "theta": float(rate * value - 0.5 * vega * vol / maturity),
+        }
+
+    def _price_batch(self, n_trades, expected_dividend, strike, rate, vol, maturity, is_call=True):
+        """Vectorized present value of ``n_trades`` dividend options."""
+
+        expected_dividend, strike, rate, vol, maturity, is_call = np.broadcast_arrays(
+            expected_dividend, strike, rate, vol, maturity, is_call
+        )
+        degenerate = (vol <= 0) | (maturity <= 0)
+        sigma_t = np.where(degenerate, 1.0, vol * np.sqrt(np.where(degenerate, 1.0, maturity)))
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            d1 = np.log(expected_dividend / strike) / sigma_t + 0.5 * sigma_t
+        d2 = d1 - sigma_t
+
+        call = np.where(
+            degenerate,
+            np.maximum(expected_dividend - strike, 0.0),
+            expected_dividend * norm.cdf(d1) - strike * norm.cdf(d2),
+        )
+        put = np.where(
+            degenerate,
+            np.maximum(strike - expected_dividend, 0.0),
+            strike * norm.cdf(-d2) - expected_dividend * norm.cdf(-d1),
+        )
+        return np.exp(-rate * maturity) * np.where(is_call, call, put)
@@ -0,0 +1,228 @@
+"""Vectorized day counts and coupon schedules on ``datetime64`` arrays.
+
+Every function in this module accepts ``datetime.date`` objects, NumPy
+``datetime64`` values or arrays of either, and works on whole arrays at once.
+A book of cash flows is therefore measured with a single call to
+:func:`year_fractions` instead of one :meth:`DerivativeModel.year_fraction`
+call per period.  Dates are handled at day resolution (``datetime64[D]``).
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date
+from typing import Any, Sequence
+
+import numpy as np
+
+#: Supported day count conventions.
+DAY_COUNTS = ("act/365", "act/360", "30/360", "act/act")
+
+#: Business day conventions mapped onto the ``roll`` argument of
+#: :func:`numpy.busday_offset`.
+BUSINESS_DAY_CONVENTIONS = {
+    "unadjusted": None,
+    "following": "following",
+    "preceding": "preceding",
+    "modified following": "modifiedfollowing",
+    "modified preceding": "modifiedpreceding",
+}
+
+
+def as_dates(values: Any) -> np.ndarray:
+    """Return ``values`` as a ``datetime64[D]`` array.
+
+    Raises ``TypeError`` for anything that is not a date, a ``datetime64`` or
+    an array of those.
+    """
+
+    if isinstance(values, np.ndarray) and np.issubdtype(values.dtype, np.datetime64):
+        return values.astype("datetime64[D]")
+    if isinstance(values, (date, np.datetime64)):
+        return np.datetime64(values, "D")
+    if isinstance(values, (list, tuple, np.ndarray)):
+        items = list(values)
+        if all(isinstance(item, (date, np.datetime64)) for item in items):
+            return np.array(items, dtype="datetime64[D]")
+    raise TypeError("dates must be datetime.date or numpy.datetime64 values")
+
+
+def _components(dates: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Return ``(year, month, day)`` integer arrays of ``dates``."""
+
+    months = dates.astype("datetime64[M]")
+    year = dates.astype("datetime64[Y]").astype(np.int64) + 1970
+    month = months.astype(np.int64) % 12 + 1
+    day = (dates - months.astype("datetime64[D]")).astype(np.int64) + 1
+    return year, month, day
+
+
+def _year_start(year: np.ndarray) -> np.ndarray:
+    return (year - 1970).astype("datetime64[Y]").astype("datetime64[D]")
+
+
+def year_fractions(start: Any, end: Any, convention: str = "act/365") -> Any:
+    """Return the day count fractions between ``start`` and ``end``.
+
+    Parameters
+    ----------
+    start, end
+        Dates or arrays of dates.  Arrays are broadcast against each other.
+    convention
+        ``"act/365"`` (the default), ``"act/360"``, ``"30/360"`` or
+        ``"act/act"`` (ISDA: days in each calendar year over that year's
+        length).
+
+    Returns
+    -------
+    float or numpy.ndarray
+        A float when both ``start`` and ``end`` are single dates.
+    """
+
+    convention = convention.lower()
+    if convention not in DAY_COUNTS:
+        raise ValueError(f"Unsupported day count convention: {convention}")
+    start, end = np.broadcast_arrays(as_dates(start), as_dates(end))
+    days = (end - start).astype(np.int64)
+    if np.any(days < 0):
+        raise ValueError("end must not be before start")
+
+    if convention == "act/365":
+        result = days / 365.0
+    elif convention == "act/360":
+        result = days / 360.0
+    elif convention == "30/360":
+        y1, m1, d1 = _components(start)
+        y2, m2, d2 = _components(end)
+        months = (y2 - y1) * 12 + (m2 - m1)
+        result = (months * 30 + np.minimum(d2, 30) - np.minimum(d1, 30)) / 360.0
+    else:
+        y1 = _components(start)[0]
+        y2 = _components(end)[0]
+        next_year = _year_start(y1 + 1)
+        this_year = _year_start(y2)
+        length1 = (next_year - _year_start(y1)).astype(np.int64)
+        length2 = (_year_start(y2 + 1) - this_year).astype(np.int64)
+        result = (
+            (next_year - start).astype(np.int64) / length1
+            + (y2 - y1 - 1)
+            + (end - this_year).astype(np.int64) / length2
+        )
+
+    return float(result) if result.ndim == 0 else result
+
+
+def add_months(dates: Any, months: Any) -> np.ndarray:
+    """Shift ``dates`` by whole ``months``, clipping to the end of the month.
+
+    ``dates`` and ``months`` are broadcast against each other, so a single
+    call rolls one date through a whole schedule or a whole book of dates by
+    the same tenor.
+    """
+
+    dates = as_dates(dates)
+    day = _components(dates)[2]
+    target = dates.astype("datetime64[M]") + np.asarray(months, dtype=np.int64)
+    month_length = ((target + 1).astype("datetime64[D]") - target.astype("datetime64[D]")).astype(
+        np.int64
+    )
+    return target.astype("datetime64[D]") + (np.minimum(day, month_length) - 1)
+
+
+def adjust(
+    dates: Any,
+    convention: str = "modified following",
+    holidays: Sequence[Any] | None = None,
+) -> np.ndarray:
+    """Roll ``dates`` that fall on weekends or ``holidays`` to business days.
+
+    ``convention`` is one of :data:`BUSINESS_DAY_CONVENTIONS`.
+    """
+
+    convention = convention.lower()
+    if convention not in BUSINESS_DAY_CONVENTIONS:
+        raise ValueError(f"Unsupported business day convention: {convention}")
+    dates = as_dates(dates)
+    roll = BUSINESS_DAY_CONVENTIONS[convention]
+    if roll is None:
+        return dates
+    holidays = as_dates(list(holidays)) if holidays is not None and len(holidays) else None
+    if holidays is None:
+        return np.busday_offset(dates, 0, roll=roll)
+    return np.busday_offset(dates, 0, roll=roll, holidays=holidays)
+
+
+@dataclass(frozen=True)
+class Schedule:
+    """Accrual periods of a coupon schedule.
+
+    All attributes are arrays with one entry per period.
+    """
+
+    accrual_start: np.ndarray
+    accrual_end: np.ndarray
+    payment_dates: np.ndarray
+    year_fractions: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.payment_dates)
+
+
+def generate_schedule(
+    effective: Any,
+    maturity: Any,
+    frequency: int = 1,
+    stub: str = "front",
+    business_day: str = "modified following",
+    day_count: str = "act/365",
+    holidays: Sequence[Any] | None = None,
+) -> Schedule:
+    """Generate the coupon periods between ``effective`` and ``maturity``.
+
+    Parameters
+    ----------
+    effective, maturity
+        Start of the first and end of the last accrual period.
+    frequency
+        Number of regular periods per year; ``12`` must be divisible by it.
+    stub
+        ``"front"`` rolls regular periods back from ``maturity`` so that any
+        short stub is the first period; ``"back"`` rolls forward from
+        ``effective`` and leaves the stub at the end.
+    business_day
+        Business day convention applied to the accrual and payment dates.
+        The effective and maturity dates themselves are adjusted as well.
+    day_count
+        Convention for the accrual year fractions.
+    holidays
+        Optional holiday dates in addition to weekends.
+    """
+
+    if frequency <= 0 or 12 % frequency:
+        raise ValueError("frequency must be a positive divisor of 12")
+    if stub not in ("front", "back"):
+        raise ValueError(f"Unsupported stub: {stub}")
+    effective = as_dates(effective)
+    maturity = as_dates(maturity)
+    if maturity <= effective:
+        raise ValueError("maturity must be after effective")
+
+    tenor = 12 // frequency
+    span = (maturity.astype("datetime64[M]") - effective.astype("datetime64[M]")).astype(int)
+    steps = np.arange(span // tenor + 2)
+    if stub == "front":
+        rolled = add_months(maturity, -tenor * steps)[::-1]
+        rolled = rolled[rolled > effective]
+        dates = np.concatenate(([effective], rolled))
+    else:
+        rolled = add_months(effective, tenor * steps)
+        rolled = rolled[rolled < maturity]
+        dates = np.concatenate((rolled, [maturity]))
+
+    adjusted = adjust(dates, business_day, holidays)
+    return Schedule(
+        accrual_start=adjusted[:-1],
+        accrual_end=adjusted[1:],
+        payment_dates=adjusted[1:],
+        year_fractions=np.asarray(year_fractions(adjusted[:-1], adjusted[1:], day_count)),
+    )
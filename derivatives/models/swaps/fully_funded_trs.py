@@ -10,7 +10,7 @@ class FullyFundedTRS(DerivativeModel):
 
     Assumptions
     ----------
-    * Funding and discounting use the same constant rate.
+    * Funding and discounting use the same constant rate or discount curve.
     * Dividends accrue continuously at a known yield.
 
     Payoff
@@ -30,7 +30,8 @@ class FullyFundedTRS(DerivativeModel):
     ) -> float:
         """Return the present value of the fully funded TRS."""
 
-        funded_amount = spot_price * exp(funding_rate * time_to_maturity)
+        discount = self.discount(funding_rate, time_to_maturity)
+        funded_amount = spot_price / discount
         expected_asset = expected_terminal_price * exp(-dividend_yield * time_to_maturity)
         payoff = expected_asset - funded_amount
-        return notional * payoff * exp(-funding_rate * time_to_maturity)
+        return notional * payoff * discount
@@ -1,6 +1,6 @@
 """Pricing model for a simple total return swap."""
 
-from math import exp
+import numpy as np
 
 from ..base import DerivativeModel
 
@@ -10,7 +10,9 @@ class TotalReturnSwap(DerivativeModel):
 
     Assumptions
     ----------
-    * Constant funding rate and dividend yield.
+    * Constant dividend yield.  The funding rate is either constant or given
+      by a discount curve, in which case ``exp(-funding_rate * T)`` is the
+      curve discount factor.
     * The expected terminal price is provided and discounted at the funding
       rate.
 
@@ -31,6 +33,24 @@ class TotalReturnSwap(DerivativeModel):
     ) -> float:
         """Return the present value of the total return swap."""
 
-        initial_forward = spot_price * exp((funding_rate - dividend_yield) * time_to_maturity)
+        discount = self.discount(funding_rate, time_to_maturity)
+        initial_forward = spot_price * self.discount(dividend_yield, time_to_maturity) / discount
         payoff = expected_terminal_price - initial_forward
-        return notional * payoff * exp(-funding_rate * time_to_maturity)
+        return notional * payoff * discount
+
+    def _price_batch(
+        self,
+        n_trades,
+        spot_price,
+        expected_terminal_price,
+        funding_rate,
+        dividend_yield,
+        time_to_maturity,
+        notional=1.0,
+    ):
+        """Vectorized present value of ``n_trades`` swaps."""
+
+        discount = self.discount(funding_rate, time_to_maturity)
+        initial_forward = spot_price * np.exp(-dividend_yield * time_to_maturity) / discount
+        payoff = expected_terminal_price - initial_forward
+        return notional * payoff * discount
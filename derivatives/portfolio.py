@@ -0,0 +1,220 @@
+"""Portfolio valuation across a pool of worker processes."""
+
+from __future__ import annotations
+
+import inspect
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Iterable, Mapping, Sequence
+
+from . import models
+from .models import instrumentation
+
+#: Keyword arguments whose product estimates the work in a single valuation.
+COST_PARAMETERS = (
+    ("n_paths", "num_obs"),
+    ("n_paths", "n_steps"),
+    ("n_paths", "monitoring_times"),
+    ("n_time", "n_space"),
+)
+
+#: Start method of the worker processes.  Forking a parent that has already
+#: started threads (for example the parallel Numba backend's threading layer)
+#: can leave the parent unable to exit, so workers are spawned afresh.
+WORKER_START_METHOD = "spawn"
+
+#: Number of chunks scheduled per worker, so that expensive chunks can be
+#: balanced against cheap ones.
+CHUNKS_PER_WORKER = 4
+
+
+@dataclass
+class TradeResult:
+    """Outcome of valuing a single trade.
+
+    Exactly one of ``value`` and ``error`` is set.
+    """
+
+    index: int
+    model: str
+    value: float | None = None
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        """``True`` when the trade was valued without error."""
+
+        return self.error is None
+
+
+def resolve_model(name: str) -> type[models.DerivativeModel]:
+    """Return the model class registered under ``name``."""
+
+    model_cls = getattr(models, name, None)
+    if not (isinstance(model_cls, type) and issubclass(model_cls, models.DerivativeModel)):
+        raise KeyError(f"Unknown model: {name}")
+    return model_cls
+
+
+def estimate_cost(model_cls: type[models.DerivativeModel], params: Mapping[str, Any]) -> float:
+    """Return a relative cost estimate for valuing one trade.
+
+    Monte Carlo and PDE trades cost roughly ``n_paths * n_steps`` or
+    ``n_time * n_space`` units; defaults of ``price`` are used where the trade
+    does not set them.  Closed-form trades, including those of models that
+    also simulate but are valued with ``method="analytic"``, cost one unit.
+    """
+
+    defaults = {
+        name: parameter.default
+        for name, parameter in inspect.signature(model_cls.price).parameters.items()
+        if parameter.default is not inspect.Parameter.empty
+    }
+    values = {**defaults, **params}
+    if values.get("method") == "analytic":
+        return 1.0
+    for first, second in COST_PARAMETERS:
+        if isinstance(values.get(first), (int, float)) and isinstance(values.get(second), (int, float)):
+            return max(float(values[first] * values[second]), 1.0)
+    return 1.0
+
+
+def _normalise(trade: Any) -> tuple[str, dict[str, Any], dict[str, Any]]:
+    """Return ``(model, init, params)`` for a trade record."""
+
+    if isinstance(trade, Mapping):
+        return trade["model"], dict(trade.get("init", {})), dict(trade.get("params", {}))
+    name, params = trade
+    return name, {}, dict(params)
+
+
+def _value_chunk(
+    name: str, items: Sequence[tuple[int, dict[str, Any], dict[str, Any]]]
+) -> list[TradeResult]:
+    """Value a chunk of trades of the same model, capturing per-trade errors."""
+
+    model_cls = resolve_model(name)
+    results = []
+    for index, init, params in items:
+        try:
+            value = float(model_cls(**init).price(**params))
+        except Exception as exc:  # noqa: BLE001 - reported per trade
+            results.append(TradeResult(index, name, error=f"{type(exc).__name__}: {exc}"))
+        else:
+            results.append(TradeResult(index, name, value=value))
+    return results
+
+
+def _value_chunk_recorded(
+    name: str,
+    items: Sequence[tuple[int, dict[str, Any], dict[str, Any]]],
+    slowest: int,
+    profiler: str,
+) -> tuple[list[TradeResult], dict[str, Any]]:
+    """Value a chunk in a worker while recording its ``price`` calls."""
+
+    with instrumentation.profile(slowest, profiler) as recorder:
+        results = _value_chunk(name, items)
+    return results, recorder.snapshot()
+
+
+def plan_chunks(
+    trades: Iterable[Any], n_workers: int
+) -> tuple[list[tuple[str, list[tuple[int, dict, dict]]]], list[TradeResult]]:
+    """Group trades by model and split the groups into cost-balanced chunks.
+
+    Returns the chunks, most expensive first, together with results for
+    trades that could not be scheduled (for example an unknown model name).
+    """
+
+    groups: dict[str, list[tuple[float, tuple[int, dict, dict]]]] = {}
+    rejected = []
+    for index, trade in enumerate(trades):
+        try:
+            name, init, params = _normalise(trade)
+            cost = estimate_cost(resolve_model(name), params)
+        except Exception as exc:  # noqa: BLE001 - reported per trade
+            model = trade.get("model", "") if isinstance(trade, Mapping) else ""
+            rejected.append(TradeResult(index, str(model), error=f"{type(exc).__name__}: {exc}"))
+            continue
+        groups.setdefault(name, []).append((cost, (index, init, params)))
+
+    total_cost = sum(cost for group in groups.values() for cost, _ in group)
+    target = total_cost / max(1, n_workers * CHUNKS_PER_WORKER)
+
+    chunks = []
+    for name, group in groups.items():
+        group.sort(key=lambda entry: entry[0], reverse=True)
+        chunk, chunk_cost = [], 0.0
+        for cost, item in group:
+            chunk.append(item)
+            chunk_cost += cost
+            if chunk_cost >= target:
+                chunks.append((chunk_cost, name, chunk))
+                chunk, chunk_cost = [], 0.0
+        if chunk:
+            chunks.append((chunk_cost, name, chunk))
+
+    # Longest-processing-time first keeps the tail of the schedule short.
+    chunks.sort(key=lambda entry: entry[0], reverse=True)
+    return [(name, chunk) for _, name, chunk in chunks], rejected
+
+
+def value_portfolio(trades: Sequence[Any], max_workers: int | None = None) -> list[TradeResult]:
+    """Value a list of trades, dispatching model groups across processes.
+
+    Parameters
+    ----------
+    trades:
+        Trade records.  Each record is either a mapping with a ``"model"``
+        name, a ``"params"`` mapping of ``price`` keywords and an optional
+        ``"init"`` mapping of constructor keywords, or a ``(model, params)``
+        tuple.
+    max_workers:
+        Number of worker processes.  Defaults to the CPU count; ``1`` values
+        the portfolio in the current process.
+
+    Returns
+    -------
+    list[TradeResult]
+        One result per trade, in input order.  Failures are reported in the
+        ``error`` field instead of being raised.
+
+    While an :mod:`~derivatives.models.instrumentation` recorder is active,
+    the ``price`` calls made in worker processes are merged into it.
+    """
+
+    n_workers = max_workers or os.cpu_count() or 1
+    chunks, results = plan_chunks(trades, n_workers)
+
+    if n_workers == 1 or len(chunks) <= 1:
+        for name, chunk in chunks:
+            results.extend(_value_chunk(name, chunk))
+    else:
+        # Workers record into their own recorder, merged into the active one.
+        recorder = instrumentation.active()
+        context = multiprocessing.get_context(WORKER_START_METHOD)
+        with ProcessPoolExecutor(max_workers=n_workers, mp_context=context) as pool:
+            if recorder is None:
+                futures = [pool.submit(_value_chunk, name, chunk) for name, chunk in chunks]
+            else:
+                futures = [
+                    pool.submit(_value_chunk_recorded, name, chunk, recorder.slowest, recorder.profiler)
+                    for name, chunk in chunks
+                ]
+            for (name, chunk), future in zip(chunks, futures):
+                try:
+                    if recorder is None:
+                        results.extend(future.result())
+                    else:
+                        chunk_results, snapshot = future.result()
+                        recorder.merge(snapshot)
+                        results.extend(chunk_results)
+                except Exception as exc:  # noqa: BLE001 - e.g. a crashed worker
+                    error = f"{type(exc).__name__}: {exc}"
+                    results.extend(TradeResult(index, name, error=error) for index, _, _ in chunk)
+
+    results.sort(key=lambda result: result.index)
+    return results
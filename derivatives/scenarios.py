@@ -0,0 +1,240 @@
+"""Revaluation of a book of trades under market-data scenarios."""
+
+from __future__ import annotations
+
+import inspect
+import os
+from dataclasses import dataclass, field
+from typing import Any, Collection, Iterable, Mapping, Sequence
+
+import numpy as np
+
+from .portfolio import _normalise, resolve_model
+
+#: Keywords of ``price`` that a risk factor is applied to when a trade does
+#: not map its factors explicitly, in order of preference.  A model's
+#: ``GREEK_PARAMETERS`` entry for the factor is tried first.
+FACTOR_KEYWORDS = {
+    "spot": ("spot", "spot_price", "equity_price", "underlying_price"),
+    "vol": ("vol",),
+    "rate": ("rate", "discount_rate", "yield_rate"),
+    "hazard": ("hazard_rate",),
+}
+
+#: Number of scenarios priced per ``price_batch`` call.
+SCENARIO_CHUNK = 4_096
+
+
+@dataclass
+class ScenarioCube:
+    """Shocks to a set of risk factors, one row per scenario.
+
+    Parameters
+    ----------
+    factors:
+        Risk factor names, e.g. ``"spot"``, ``"vol"``, ``"rate"`` and
+        ``"hazard"``, or names of individual underlyings that trades map
+        onto their own keywords.
+    shocks:
+        Array of shape ``(n_scenarios, n_factors)``.
+    relative:
+        Factors whose shocks are relative (``value * (1 + shock)``); all
+        other shocks are absolute shifts (``value + shock``).
+    """
+
+    factors: Sequence[str]
+    shocks: Any
+    relative: Collection[str] = field(default_factory=lambda: frozenset({"spot"}))
+
+    def __post_init__(self) -> None:
+        self.factors = tuple(self.factors)
+        self.shocks = np.array(self.shocks, dtype=float, ndmin=2)
+        self.relative = frozenset(self.relative)
+        if len(set(self.factors)) != len(self.factors):
+            raise ValueError("factor names must be unique")
+        if self.shocks.ndim != 2 or self.shocks.shape[1] != len(self.factors):
+            raise ValueError("shocks must have shape (n_scenarios, n_factors)")
+
+    @property
+    def n_scenarios(self) -> int:
+        """Number of scenarios in the cube."""
+
+        return len(self.shocks)
+
+    def apply(self, factor: str, value: float, rows: slice = slice(None)) -> np.ndarray:
+        """Return ``value`` shocked by ``factor`` in the scenarios ``rows``."""
+
+        shocks = self.shocks[rows, self.factors.index(factor)]
+        if factor in self.relative:
+            return value * (1.0 + shocks)
+        return value + shocks
+
+
+@dataclass
+class ScenarioResult:
+    """Base values and scenario P&L of a book.
+
+    ``pnl`` has one row per trade and one column per scenario.  When the
+    P&L was streamed to disk it is a read-only memory map of the ``.npy``
+    file.  Rows of trades that could not be valued are ``nan`` and the
+    reason is recorded in ``errors``.
+    """
+
+    base: np.ndarray
+    pnl: np.ndarray
+    errors: list[str | None]
+
+    def total(self) -> np.ndarray:
+        """Return the book P&L in every scenario, ignoring failed trades."""
+
+        total = np.zeros(self.pnl.shape[1])
+        for row, error in zip(self.pnl, self.errors):
+            if error is None:
+                total += row
+        return total
+
+    def value_at_risk(self, level: float = 0.99) -> float:
+        """Return the loss not exceeded in a fraction ``level`` of scenarios."""
+
+        if not 0.0 < level < 1.0:
+            raise ValueError("level must be between 0 and 1")
+        return float(-np.quantile(self.total(), 1.0 - level))
+
+
+def factor_keywords(
+    model_cls: type, params: Mapping[str, Any], factors: Iterable[str]
+) -> dict[str, str]:
+    """Return the mapping of risk factor to the ``price`` keyword it shocks.
+
+    Only factors with a matching keyword among ``params`` are returned, so a
+    cube can be applied to a mixed book: a ``"vol"`` shock leaves trades
+    without a volatility untouched.
+    """
+
+    parameters = inspect.signature(model_cls.price).parameters
+    mapping = {}
+    for factor in factors:
+        candidates = (model_cls.GREEK_PARAMETERS.get(factor), *FACTOR_KEYWORDS.get(factor, ()), factor)
+        for keyword in candidates:
+            if keyword in parameters and keyword in params:
+                mapping[factor] = keyword
+                break
+    return mapping
+
+
+def _trade_seed(entropy: Any, index: int) -> int:
+    """Return a fixed seed for trade ``index`` derived from ``entropy``."""
+
+    sequence = np.random.SeedSequence(entropy, spawn_key=(index,))
+    return int(sequence.generate_state(1, np.uint64)[0] >> np.uint64(1))
+
+
+def _revalue(
+    model: Any,
+    params: dict[str, Any],
+    mapping: Mapping[str, str],
+    cube: ScenarioCube,
+    out: np.ndarray,
+    chunk_size: int,
+) -> float:
+    """Write the scenario P&L of one trade into ``out`` and return its base value."""
+
+    for factor, keyword in mapping.items():
+        value = params[keyword]
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            raise TypeError(f"cannot apply {factor} shock to non-numeric argument {keyword}")
+
+    base = float(model.price_batch(params)[0])
+    for start in range(0, cube.n_scenarios, chunk_size):
+        rows = slice(start, start + chunk_size)
+        columns = dict(params)
+        for factor, keyword in mapping.items():
+            columns[keyword] = cube.apply(factor, columns[keyword], rows)
+        out[rows] = model.price_batch(columns) - base
+    return base
+
+
+def reprice_scenarios(
+    trades: Sequence[Any],
+    cube: ScenarioCube,
+    path: str | os.PathLike | None = None,
+    seed: Any = None,
+    chunk_size: int = SCENARIO_CHUNK,
+) -> ScenarioResult:
+    """Revalue every trade in every scenario of ``cube``.
+
+    Parameters
+    ----------
+    trades:
+        Trade records as accepted by
+        :func:`~derivatives.portfolio.value_portfolio`.  A mapping record may
+        also carry a ``"factors"`` mapping of cube factor to ``price``
+        keyword; otherwise factors are matched to keywords by
+        :func:`factor_keywords`.
+    cube:
+        Scenario shocks.  Shocked arguments must be numbers.
+    path:
+        Optional ``.npy`` file the P&L matrix is streamed into, one trade
+        at a time, so that memory use does not grow with the size of the
+        book.
+    seed:
+        Entropy from which a fixed seed is derived for every Monte Carlo
+        trade that does not set its own.  The base value and all scenarios
+        of a trade use the same seed, so its P&L is free of simulation noise
+        between scenarios.
+    chunk_size:
+        Number of scenarios priced per ``price_batch`` call.
+
+    Returns
+    -------
+    ScenarioResult
+        Base values and P&L in input order.  Per-trade failures are recorded
+        in ``errors`` instead of being raised.
+
+    Notes
+    -----
+    Scenarios are priced through ``price_batch``, so closed-form models are
+    evaluated vectorized across the scenario axis, while Monte Carlo and PDE
+    models reprice once per scenario with common random numbers.
+    """
+
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be positive")
+    if seed is None:
+        seed = np.random.SeedSequence().entropy
+    shape = (len(trades), cube.n_scenarios)
+    if path is None:
+        pnl = np.empty(shape)
+    else:
+        pnl = np.lib.format.open_memmap(os.fspath(path), mode="w+", dtype=float, shape=shape)
+    base = np.full(len(trades), np.nan)
+    errors: list[str | None] = []
+
+    for index, trade in enumerate(trades):
+        try:
+            name, init, params = _normalise(trade)
+            model_cls = resolve_model(name)
+            factors = trade.get("factors") if isinstance(trade, Mapping) else None
+            if factors is None:
+                mapping = factor_keywords(model_cls, params, cube.factors)
+            else:
+                unknown = set(factors) - set(cube.factors)
+                if unknown:
+                    raise KeyError(f"factors not in the cube: {', '.join(sorted(unknown))}")
+                mapping = dict(factors)
+            if "seed" in inspect.signature(model_cls.price).parameters and not isinstance(
+                params.get("seed"), int
+            ):
+                params["seed"] = _trade_seed(seed, index)
+            base[index] = _revalue(model_cls(**init), params, mapping, cube, pnl[index], chunk_size)
+        except Exception as exc:  # noqa: BLE001 - reported per trade
+            pnl[index] = np.nan
+            errors.append(f"{type(exc).__name__}: {exc}")
+        else:
+            errors.append(None)
+
+    if path is not None:
+        pnl.flush()
+        del pnl
+        pnl = np.load(os.fspath(path), mmap_mode="r")
+    return ScenarioResult(base, pnl, errors)
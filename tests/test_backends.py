@@ -0,0 +1,109 @@
+import numpy as np
+import pytest
+
+from derivatives import models
+from derivatives.models import backends
+from derivatives.models.monte_carlo import barrier_survival, gbm_paths, running_average
+
+INCREMENTS = np.random.default_rng(3).normal(0.0, 0.05, (500, 12))
+
+MC_CASES = [
+    (models.AsianArithmeticFixMM(), dict(spot=100, strike=100, rate=0.05, vol=0.2, maturity=1, num_obs=12)),
+    (
+        models.CommodityAsianOption(),
+        dict(
+            spot=100, strike=95, rate=0.03, vol=0.3, maturity=1, num_obs=12,
+            convenience_yield=0.02, method="monte-carlo",
+        ),
+    ),
+    (
+        models.DiscretisedBarrier(),
+        dict(spot=100, strike=100, barrier=90, rate=0.05, vol=0.2, maturity=1, monitoring_times=12),
+    ),
+    (
+        models.BarrierContinuousAnalytic(),
+        dict(
+            spot=100, strike=100, barrier=120, rate=0.05, vol=0.2, maturity=1,
+            barrier_type="up-and-out", method="monte-carlo",
+        ),
+    ),
+]
+
+
+def test_registry():
+    assert "numpy" in backends.available_backends()
+    assert backends.default_backend() in backends.available_backends()
+    with pytest.raises(KeyError):
+        backends.get_kernel("no-such-kernel")
+    with pytest.raises(ValueError):
+        backends.get_kernel("arithmetic_average", "no-such-backend")
+
+
+def test_default_backend_from_environment(monkeypatch):
+    monkeypatch.setenv(backends.BACKEND_ENV_VAR, "numpy")
+    assert backends.get_kernel("knock_out") is backends.knock_out
+
+
+def test_register_custom_backend(monkeypatch):
+    kernels = dict(backends._KERNELS["arithmetic_average"])
+    monkeypatch.setitem(backends._KERNELS, "arithmetic_average", kernels)
+    calls = []
+
+    @backends.register_kernel("arithmetic_average", "traced")
+    def traced(spot, increments):
+        calls.append(increments.shape)
+        return backends.arithmetic_average(spot, increments)
+
+    model, kwargs = MC_CASES[0]
+    expected = model.price(**kwargs, n_paths=1000, seed=1, backend="numpy")
+    assert model.price(**kwargs, n_paths=1000, seed=1, backend="traced") == expected
+    assert calls
+
+
+def test_numpy_kernels_match_path_matrix():
+    paths = gbm_paths(100.0, INCREMENTS)
+    average = backends.arithmetic_average(100.0, INCREMENTS)
+    assert average == pytest.approx(running_average(paths)[:, -1])
+
+    terminal, alive = backends.knock_out(100.0, INCREMENTS, 90.0, True)
+    assert terminal == pytest.approx(paths[:, -1])
+    assert np.array_equal(alive, paths.min(axis=1) > 90.0)
+
+    terminal, survival = backends.bridge_survival(100.0, INCREMENTS, 110.0, False, 0.0025)
+    assert survival == pytest.approx(barrier_survival(paths, 100.0, 110.0, False, 0.0025))
+
+
+def test_tridiagonal_matches_dense_solve():
+    rng = np.random.default_rng(0)
+    n = 20
+    lower, upper, rhs = rng.random(n - 1), rng.random(n - 1), rng.random(n)
+    diagonal = 2.0 + rng.random(n)
+    dense = np.diag(diagonal) + np.diag(lower, -1) + np.diag(upper, 1)
+    for backend in backends.available_backends():
+        solution = backends.get_kernel("tridiagonal", backend)(lower, diagonal, upper, rhs)
+        assert solution == pytest.approx(np.linalg.solve(dense, rhs))
+
+
+@pytest.mark.parametrize("model, kwargs", MC_CASES)
+def test_monte_carlo_backends_agree(model, kwargs):
+    pytest.importorskip("numba")
+    numpy_price = model.price(**kwargs, n_paths=5000, seed=7, backend="numpy")
+    numba_price = model.price(**kwargs, n_paths=5000, seed=7, backend="numba")
+    assert numba_price == pytest.approx(numpy_price, rel=1e-10)
+
+
+@pytest.mark.parametrize("american", [False, True])
+def test_finite_difference_backends_agree(american):
+    pytest.importorskip("numba")
+    model = models.FiniteDifference()
+    kwargs = dict(spot=100, strike=100, rate=0.05, vol=0.2, maturity=1, is_call=False, american=american)
+    assert model.price(**kwargs, backend="numba") == pytest.approx(
+        model.price(**kwargs, backend="numpy"), rel=1e-10
+    )
+
+
+def test_unavailable_backend_is_rejected():
+    if "numba" in backends.available_backends():
+        pytest.skip("numba is installed")
+    with pytest.raises(ValueError):
+        models.FiniteDifference().price(100, 100, 0.05, 0.2, 1, backend="numba")
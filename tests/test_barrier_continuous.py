@@ -0,0 +1,36 @@
+import pytest
+
+from derivatives import models
+
+CASES = [
+    (True, "down-and-out", 90.0),
+    (True, "up-and-out", 120.0),
+    (False, "down-and-out", 90.0),
+    (False, "up-and-out", 120.0),
+]
+
+
+@pytest.mark.parametrize("is_call, barrier_type, barrier", CASES)
+def test_analytic_matches_pde(is_call, barrier_type, barrier):
+    analytic = models.BarrierContinuousAnalytic().price(
+        100, 100, barrier, 0.05, 0.2, 1.0, is_call=is_call, barrier_type=barrier_type
+    )
+    pde = models.FiniteDifference().price(
+        100, 100, 0.05, 0.2, 1.0, is_call=is_call, s_max=400, n_time=400, n_space=800,
+        barrier=barrier, barrier_type=barrier_type,
+    )
+    assert analytic == pytest.approx(pde, abs=5e-3)
+
+
+@pytest.mark.parametrize("is_call, barrier_type, barrier", CASES)
+def test_bridge_corrected_simulation_on_coarse_grid(is_call, barrier_type, barrier):
+    model = models.BarrierContinuousAnalytic()
+    args = (100, 100, barrier, 0.05, 0.2, 1.0, is_call, barrier_type)
+    simulated = model.price(*args, n_steps=10, n_paths=100_000, method="monte-carlo", seed=5)
+    assert simulated == pytest.approx(model.price(*args), rel=0.03, abs=0.02)
+
+
+def test_knocked_out_spot_is_worthless():
+    model = models.BarrierContinuousAnalytic()
+    assert model.price(85, 100, 90, 0.05, 0.2, 1.0) == 0.0
+    assert model.price(125, 100, 120, 0.05, 0.2, 1.0, barrier_type="up-and-out") == 0.0
@@ -0,0 +1,33 @@
+import math
+
+import pytest
+
+from benchmarks.cases import CASES, UNIMPLEMENTED
+from benchmarks.run import compare, load_baseline, save_results
+from derivatives import models
+
+
+def test_every_model_has_small_and_large_cases():
+    exported = {
+        name
+        for name in dir(models)
+        if isinstance(getattr(models, name), type) and issubclass(getattr(models, name), models.DerivativeModel)
+    }
+    covered = {(case.model, case.size) for case in CASES}
+    for name in exported - UNIMPLEMENTED:
+        assert (name, "small") in covered and (name, "large") in covered, name
+
+
+@pytest.mark.parametrize("case", [case for case in CASES if case.size == "small"], ids=lambda c: c.name)
+def test_small_cases_price(case):
+    value = case.callable()()
+    assert math.isfinite(float(value))
+
+
+def test_compare_flags_regressions_beyond_threshold(tmp_path):
+    path = tmp_path / "baseline.json"
+    save_results(path, {"a": 1.0, "b": 1.0, "c": 1.0})
+    baseline = load_baseline(path)
+    regressions, improvements = compare({"a": 1.1, "b": 1.5, "c": 0.5, "d": 9.0}, baseline, threshold=0.25)
+    assert regressions == ["b"]
+    assert improvements == ["c"]
@@ -0,0 +1,123 @@
+import numpy as np
+import pytest
+
+from derivatives import models
+from derivatives.models.cache import PriceCache
+
+FD_ARGS = dict(spot=100, strike=100, rate=0.05, vol=0.2, maturity=1.0, n_time=50, n_space=50)
+ASIAN_ARGS = dict(spot=100, strike=100, rate=0.05, vol=0.2, maturity=1.0, num_obs=12, n_paths=2_000)
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_repeated_prices_are_served_from_cache(monkeypatch):
+    model = models.FiniteDifference()
+    model.cache = PriceCache()
+    first = model.price(**FD_ARGS)
+    assert model.price(**FD_ARGS) == first
+    # Positional and keyword spellings, and explicit defaults, share the key.
+    assert model.price(100, 100, 0.05, 0.2, 1.0, True, n_time=50, n_space=50) == first
+    # Floating-point noise below the tolerance is ignored.
+    assert model.price(**{**FD_ARGS, "spot": 100 + 1e-13}) == first
+    stats = model.cache.stats()
+    assert (stats.hits, stats.misses, stats.size) == (3, 1, 1)
+    assert stats.hit_rate == pytest.approx(0.75)
+
+    # Other instances are unaffected unless the cache is set on the class.
+    assert models.FiniteDifference().cache is None
+    monkeypatch.setattr(models.ZeroCoupon, "cache", PriceCache())
+    models.ZeroCoupon().price(100.0, 0.05, 2.0)
+    assert models.ZeroCoupon().price(100.0, 0.05, 2.0) == pytest.approx(100 * np.exp(-0.1))
+    assert models.ZeroCoupon.cache.stats().hits == 1
+
+
+def test_monte_carlo_requires_fixed_seed():
+    model = models.AsianArithmeticFixMM()
+    model.cache = PriceCache()
+    assert model.price(**ASIAN_ARGS, seed=1) == model.price(**ASIAN_ARGS, seed=1)
+    model.price(**ASIAN_ARGS)
+    model.price(**ASIAN_ARGS, seed=np.random.default_rng(1))
+    stats = model.cache.stats()
+    assert (stats.hits, stats.misses, stats.bypassed) == (1, 1, 2)
+    assert model.price(**ASIAN_ARGS, seed=2) != model.price(**ASIAN_ARGS, seed=1)
+
+
+@pytest.mark.parametrize(
+    "model_cls, args",
+    [
+        (models.BarrierContinuousAnalytic, dict(spot=100, strike=100, barrier=90, rate=0.05, vol=0.2, maturity=1.0)),
+        (models.CommodityAsianOption, dict(spot=100, strike=100, rate=0.05, vol=0.2, maturity=1.0, num_obs=12)),
+    ],
+)
+def test_analytic_prices_are_cached_without_seed(model_cls, args):
+    model = model_cls()
+    model.cache = PriceCache()
+    first = model.price(**args)
+    assert model.price(**args) == first
+    assert model.price(**args, seed=np.random.default_rng(1)) == first
+    stats = model.cache.stats()
+    assert (stats.hits, stats.misses, stats.bypassed) == (2, 1, 0)
+    model.price(**args, method="monte-carlo", n_paths=1_000)
+    assert model.cache.stats().bypassed == 1
+
+
+def test_lru_and_ttl_eviction():
+    clock = Clock()
+    model = models.ZeroCoupon()
+    model.cache = PriceCache(maxsize=2, ttl=10.0, clock=clock)
+    model.price(100.0, 0.01, 1.0)
+    model.price(100.0, 0.02, 1.0)
+    model.price(100.0, 0.01, 1.0)  # refreshes the first entry
+    model.price(100.0, 0.03, 1.0)  # evicts the second
+    model.price(100.0, 0.01, 1.0)
+    stats = model.cache.stats()
+    assert (stats.hits, stats.evictions, stats.size) == (2, 1, 2)
+
+    clock.now = 11.0
+    model.price(100.0, 0.01, 1.0)
+    stats = model.cache.stats()
+    assert (stats.hits, stats.expirations) == (2, 1)
+
+
+def test_curves_are_keyed_by_value_and_invalidated_by_identity():
+    model = models.ZeroCoupon()
+    model.cache = cache = PriceCache()
+    curve = models.DiscountCurve([1.0, 5.0], [0.03, 0.04])
+    before = model.price(100.0, curve, 3.0)
+    assert model.price(100.0, models.DiscountCurve([1.0, 5.0], [0.03, 0.04]), 3.0) == before
+    assert cache.stats().hits == 1
+
+    # Updating a curve in place changes the key.
+    curve.rates[-1] = 0.05
+    curve.__init__(curve.times, curve.rates)
+    assert model.price(100.0, curve, 3.0) < before
+
+    model.price(100.0, 0.03, 3.0)
+    assert cache.invalidate(curve) == 2
+    assert len(cache) == 1
+    assert cache.invalidate(model=models.ZeroCoupon) == 1
+    assert len(cache) == 0
+
+
+def test_cached_arrays_are_copies():
+    model = models.CreditBasketLinear()
+    model.cache = PriceCache()
+    scenarios = np.array([[0.1, 0.2], [0.3, 0.4]])
+    first = model.price([1.0, 2.0], scenarios)
+    first[:] = 0.0
+    assert model.price([1.0, 2.0], scenarios) == pytest.approx([0.5, 1.1])
+
+
+def test_invalid_configuration():
+    with pytest.raises(ValueError):
+        PriceCache(maxsize=0)
+    with pytest.raises(ValueError):
+        PriceCache(ttl=0.0)
+    with pytest.raises(ValueError):
+        PriceCache(tolerance=-1.0)
@@ -0,0 +1,85 @@
+from datetime import date, timedelta
+from math import exp
+
+import numpy as np
+import pytest
+
+from derivatives import models
+from derivatives.models.options.asian_arithmetic_fix_mm import geometric_asian_price
+
+FLAT = dict(spot=100.0, strike=100.0, rate=0.05, vol=0.2, maturity=1.0, num_obs=12, convenience_yield=0.02)
+FIXINGS = np.array([0.25, 0.5, 0.75, 1.0, 1.25, 1.5])
+CURVE = models.PriceCurve([0.0, 0.5, 1.0, 1.5], [70.0, 72.0, 75.0, 74.0], interpolation="monotone-cubic")
+VOLS = models.PriceCurve([0.25, 1.5], [0.40, 0.30])
+
+
+def test_analytic_approximation_is_close_to_simulation():
+    model = models.CommodityAsianOption()
+    analytic = model.price(**FLAT)
+    simulated = model.price(
+        **FLAT, method="monte-carlo", n_paths=200_000, seed=1, control_variate=True, return_result=True
+    )
+    assert analytic == pytest.approx(simulated.price, rel=0.01)
+    assert model.price(**FLAT, return_result=True).std_error == 0.0
+
+
+def test_single_fixing_is_black_scholes():
+    value = models.CommodityAsianOption().price(**{**FLAT, "num_obs": 1})
+    # The geometric average of a single fixing is the fixing itself.
+    assert value == pytest.approx(geometric_asian_price(100.0, 100.0, 0.05, 0.02, 0.2, 1.0, 1), rel=1e-12)
+
+
+def test_put_call_parity():
+    model = models.CommodityAsianOption()
+    kwargs = dict(forward_curve=CURVE, fixing_times=FIXINGS, maturity=1.6)
+    call = model.price(None, 73.0, 0.03, VOLS, **kwargs)
+    put = model.price(None, 73.0, 0.03, VOLS, is_call=False, **kwargs)
+    assert call - put == pytest.approx(exp(-0.03 * 1.6) * (CURVE.price(FIXINGS).mean() - 73.0))
+
+
+@pytest.mark.parametrize("method", ["analytic", "monte-carlo"])
+def test_forward_curve_reproduces_flat_inputs(method):
+    model = models.CommodityAsianOption()
+    times = np.arange(1, 13) / 12
+    forwards = 100.0 * np.exp(0.03 * times)
+    curve = models.PriceCurve(times, forwards, interpolation="log-linear")
+    kwargs = dict(method=method, n_paths=5_000, seed=3)
+    flat = model.price(**FLAT, **kwargs)
+    curved = model.price(None, 100.0, 0.05, 0.2, forward_curve=curve, fixing_times=times, **kwargs)
+    assert curved == pytest.approx(flat, rel=1e-10)
+
+
+def test_vol_term_structure_and_fixing_dates():
+    model = models.CommodityAsianOption()
+    kwargs = dict(forward_curve=CURVE, fixing_times=FIXINGS)
+    analytic = model.price(None, 73.0, 0.03, VOLS, **kwargs)
+    assert analytic == pytest.approx(model.price(None, 73.0, 0.03, VOLS.price(FIXINGS), **kwargs))
+    simulated = model.price(
+        None, 73.0, 0.03, VOLS, method="monte-carlo", n_paths=200_000, seed=5,
+        control_variate=True, return_result=True, **kwargs,
+    )
+    assert analytic == pytest.approx(simulated.price, rel=0.01)
+
+    today = date(2024, 1, 1)
+    days = [91, 182, 274, 365, 456, 548]
+    dates = [today + timedelta(days=n) for n in days]
+    dated = model.price(None, 73.0, 0.03, VOLS, forward_curve=CURVE, fixing_times=dates, valuation_date=today)
+    times = np.array(days) / 365.0
+    assert dated == pytest.approx(model.price(None, 73.0, 0.03, VOLS, forward_curve=CURVE, fixing_times=times))
+
+
+def test_invalid_inputs():
+    model = models.CommodityAsianOption()
+    with pytest.raises(ValueError):
+        model.price(None, 100.0, 0.05, 0.2, 1.0, 12)
+    with pytest.raises(ValueError):
+        model.price(100.0, 100.0, 0.05, 0.2)
+    with pytest.raises(ValueError):
+        model.price(100.0, 100.0, 0.05, 0.2, fixing_times=[0.5, 0.25])
+    with pytest.raises(ValueError):
+        # Total variance falls from 0.04 * 0.5 to 0.01 * 1.0.
+        model.price(100.0, 100.0, 0.05, [0.2, 0.1], fixing_times=[0.5, 1.0])
+    with pytest.raises(ValueError):
+        model.price(100.0, 100.0, 0.05, 0.2, maturity=0.5, fixing_times=[0.25, 1.0])
+    with pytest.raises(ValueError):
+        model.price(**FLAT, method="pde")
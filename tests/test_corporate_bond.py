@@ -0,0 +1,66 @@
+from math import exp
+
+import numpy as np
+import pytest
+
+from derivatives import models
+from derivatives.models.bonds.corporate_bond_model import cash_flow_matrix
+
+
+def test_whole_periods_match_coupon_loop():
+    value = models.CorporateBondModel().price(100, 0.05, 0.06, 5, frequency=2)
+    expected = sum(2.5 * exp(-0.06 * i / 2) for i in range(1, 11)) + 100 * exp(-0.06 * 5)
+    assert value == pytest.approx(expected)
+
+
+def test_stub_period_rolls_back_from_maturity():
+    times, amounts = cash_flow_matrix(100, 0.05, 2.3, 2)
+    assert sorted(times[0]) == pytest.approx([0.3, 0.8, 1.3, 1.8, 2.3])
+    assert amounts[0].sum() == pytest.approx(100 + 5 * 2.5)
+    # A stub maturity prices between the neighbouring whole-period bonds.
+    model = models.CorporateBondModel()
+    assert model.price(100, 0.0, 0.05, 2.3, 2) == pytest.approx(100 * exp(-0.05 * 2.3))
+
+
+def test_analytics_match_finite_differences():
+    model = models.CorporateBondModel()
+    args = dict(face_value=100, coupon_rate=0.05, maturity=7.25, frequency=4)
+    result = model.analytics(yield_rate=0.04, **args)
+    h = 1e-5
+    up = model.price(yield_rate=0.04 + h, **args)
+    down = model.price(yield_rate=0.04 - h, **args)
+    assert result["price"] == pytest.approx(model.price(yield_rate=0.04, **args))
+    assert result["duration"] == pytest.approx(-(up - down) / (2 * h) / result["price"], rel=1e-6)
+    assert result["convexity"] == pytest.approx(
+        (up - 2 * result["price"] + down) / h**2 / result["price"], rel=1e-4
+    )
+    assert result["dv01"] == pytest.approx(result["duration"] * result["price"] * 1e-4)
+
+
+def test_yield_solver_recovers_yields_across_a_book():
+    model = models.CorporateBondModel()
+    rng = np.random.default_rng(3)
+    n = 2_000
+    coupons = rng.uniform(0.0, 0.1, n)
+    maturities = rng.uniform(0.1, 30.0, n)
+    frequencies = rng.choice([1, 2, 4, 12], n)
+    yields = rng.uniform(-0.02, 0.3, n)
+    prices = model.price_batch(
+        face_value=100.0,
+        coupon_rate=coupons,
+        yield_rate=yields,
+        maturity=maturities,
+        frequency=frequencies,
+    )
+    solved = model.yield_from_price(prices, 100.0, coupons, maturities, frequencies)
+    assert solved == pytest.approx(yields, abs=1e-10)
+    single = model.price(100.0, coupons[0], yields[0], maturities[0], int(frequencies[0]))
+    assert prices[0] == pytest.approx(single)
+    assert model.yield_from_price(single, 100.0, coupons[0], maturities[0], int(frequencies[0])) == (
+        pytest.approx(yields[0])
+    )
+
+
+def test_yield_solver_rejects_non_positive_prices():
+    with pytest.raises(ValueError):
+        models.CorporateBondModel().yield_from_price(0.0, 100, 0.05, 5)
@@ -0,0 +1,182 @@
+import numpy as np
+import pytest
+
+from derivatives import models
+
+
+def test_expected_loss_is_dot_product():
+    model = models.CreditBasketLinear()
+    notionals = np.array([1e6, 2e6, 5e5])
+    probabilities = np.array([0.1, 0.2, 0.05])
+    recoveries = np.array([0.4, 0.5, 0.0])
+    expected = float(np.sum(notionals * probabilities * (1 - recoveries)))
+    assert model.price(notionals, probabilities, recoveries) == pytest.approx(expected)
+    # Plain sequences and iterables are still accepted.
+    assert model.price(list(notionals), tuple(probabilities), iter(recoveries)) == pytest.approx(expected)
+    assert model.price(notionals, probabilities) == pytest.approx(float(notionals @ probabilities))
+
+
+def test_contributions_sum_to_price():
+    model = models.CreditBasketLinear()
+    rng = np.random.default_rng(0)
+    notionals = rng.uniform(1e5, 1e6, 1_000)
+    probabilities = rng.uniform(0, 0.1, 1_000)
+    recoveries = rng.uniform(0, 1, 1_000)
+    contributions = model.contributions(notionals, probabilities, recoveries)
+    assert contributions.shape == (1_000,)
+    assert contributions.sum() == pytest.approx(model.price(notionals, probabilities, recoveries))
+
+
+def test_scenario_matrix_values_every_scenario():
+    model = models.CreditBasketLinear()
+    rng = np.random.default_rng(1)
+    notionals = rng.uniform(1e5, 1e6, 200)
+    recoveries = rng.uniform(0, 1, 200)
+    scenarios = rng.uniform(0, 0.2, (50, 200))
+    values = model.price(notionals, scenarios, recoveries)
+    assert values.shape == (50,)
+    assert values[7] == pytest.approx(model.price(notionals, scenarios[7], recoveries))
+    assert model.contributions(notionals, scenarios, recoveries).shape == (50, 200)
+
+
+def test_validation_reports_offending_indices():
+    model = models.CreditBasketLinear()
+    notionals = np.full(30, 1e6)
+    notionals[[3, 17]] = -1.0
+    with pytest.raises(ValueError, match=r"indices \[3, 17\]"):
+        model.price(notionals, np.full(30, 0.1))
+    probabilities = np.full(30, 0.1)
+    probabilities[5:25] = 1.5
+    with pytest.raises(ValueError, match="and 10 more"):
+        model.price(np.ones(30), probabilities)
+    with pytest.raises(ValueError, match=r"\(1, 0\)"):
+        model.price([1.0, 1.0], [[0.1, 0.1], [2.0, 0.1]])
+    with pytest.raises(ValueError, match="recovery rate"):
+        model.price([1.0], [0.1], [np.nan])
+    with pytest.raises(ValueError):
+        model.price([1.0, 2.0], [0.1])
+
+
+def test_non_numeric_inputs_raise_type_error():
+    model = models.CreditBasketLinear()
+    with pytest.raises(TypeError):
+        model.price(["a", 1.0], [0.1, 0.1])
+    with pytest.raises(TypeError):
+        model.price([1.0, 1.0], [0.1, None])
+
+
+def _basket(n=60, seed=0):
+    rng = np.random.default_rng(seed)
+    return rng.uniform(5e5, 2e6, n), rng.uniform(0.005, 0.08, n), rng.uniform(0.2, 0.6, n)
+
+
+@pytest.mark.parametrize("correlation", [0.0, 0.5, 0.9])
+def test_full_tranche_reproduces_linear_expected_loss(correlation):
+    model = models.CreditBasketLinear()
+    notionals, probabilities, recoveries = _basket()
+    expected = model.price(notionals, probabilities, recoveries)
+    semi = model.tranche_loss(notionals, probabilities, recoveries, correlation=correlation)
+    assert semi == pytest.approx(expected, rel=1e-10)
+    mc = model.tranche_loss(
+        notionals,
+        probabilities,
+        recoveries,
+        correlation=correlation,
+        method="monte-carlo",
+        n_paths=50_000,
+        seed=1,
+        return_result=True,
+    )
+    assert abs(mc.price - expected) < 4 * mc.std_error
+
+
+@pytest.mark.parametrize("correlation", [0.2, 0.8])
+def test_semi_analytic_tranches_match_monte_carlo(correlation):
+    model = models.CreditBasketLinear()
+    notionals, probabilities, recoveries = _basket()
+    args = (notionals, probabilities, recoveries)
+    tranches = [(0.0, 0.03), (0.03, 0.07), (0.07, 0.15), (0.15, 1.0)]
+    values = []
+    for attachment, detachment in tranches:
+        kwargs = dict(correlation=correlation, attachment=attachment, detachment=detachment)
+        semi = model.tranche_loss(*args, **kwargs)
+        mc = model.tranche_loss(
+            *args, method="monte-carlo", n_paths=100_000, seed=2, return_result=True, **kwargs
+        )
+        assert abs(semi - mc.price) < 4 * mc.std_error
+        values.append(semi)
+    # Tranches partition the basket loss, up to the loss grid discretisation.
+    assert sum(values) == pytest.approx(model.price(*args), rel=1e-3)
+
+
+def test_homogeneous_pool_is_added_as_one_group():
+    model = models.CreditBasketLinear()
+    notionals = np.full(400, 1e6)
+    probabilities = np.full(400, 0.03)
+    recoveries = np.full(400, 0.4)
+    grouped = model.tranche_loss(
+        notionals, probabilities, recoveries, correlation=0.4, attachment=0.03, detachment=0.07
+    )
+    # Perturbing one name forces the remaining names through the same group
+    # path while the single name goes through the recursion.
+    probabilities[0] = 0.0300001
+    perturbed = model.tranche_loss(
+        notionals, probabilities, recoveries, correlation=0.4, attachment=0.03, detachment=0.07
+    )
+    assert grouped == pytest.approx(perturbed, rel=1e-3)
+
+
+@pytest.mark.parametrize(
+    "notionals, probabilities, recoveries, expected",
+    [
+        ([100.0] * 4, [0.05, 0.05, 0.1, 0.2], [1.0, 1.0, 0.4, 0.4], 18.0),
+        ([0.0, 0.0, 100.0], [0.5, 0.5, 0.1], None, 10.0),
+    ],
+)
+def test_names_without_loss_given_default_add_no_loss(notionals, probabilities, recoveries, expected):
+    value = models.CreditBasketLinear().tranche_loss(notionals, probabilities, recoveries, correlation=0.3)
+    assert value == pytest.approx(expected, rel=1e-3)
+
+
+def test_tranche_boundaries_use_validated_notionals():
+    model = models.CreditBasketLinear()
+    notionals, probabilities, recoveries = _basket()
+    kwargs = dict(correlation=0.3, detachment=0.05)
+    expected = model.tranche_loss(list(notionals), probabilities, recoveries, **kwargs)
+    assert expected > 0.0
+    assert model.tranche_loss(iter(notionals), probabilities, recoveries, **kwargs) == expected
+
+
+def test_nth_to_default():
+    model = models.CreditBasketLinear()
+    single = model.nth_to_default([1e6], [0.1], [0.4], n_paths=100_000, seed=3, return_result=True)
+    assert abs(single.price - 6e4) < 4 * single.std_error
+
+    # Independent identical names: first-to-default pays when any name defaults.
+    n = 10
+    pool = (np.full(n, 1e6), np.full(n, 0.05), np.full(n, 0.4))
+    first = model.nth_to_default(*pool, n=1, n_paths=100_000, seed=4, return_result=True)
+    expected = 6e5 * (1 - 0.95**n)
+    assert abs(first.price - expected) < 4 * first.std_error
+
+    notionals, probabilities, recoveries = _basket()
+    values = [
+        model.nth_to_default(notionals, probabilities, recoveries, n=k, correlation=0.3, seed=5)
+        for k in (1, 2, 5)
+    ]
+    assert values[0] > values[1] > values[2] > 0
+    repeat = model.nth_to_default(notionals, probabilities, recoveries, n=2, correlation=0.3, seed=5)
+    assert repeat == values[1]
+    with pytest.raises(ValueError):
+        model.nth_to_default(notionals, probabilities, recoveries, n=0)
+
+
+def test_copula_inputs_are_validated():
+    model = models.CreditBasketLinear()
+    notionals, probabilities, recoveries = _basket()
+    with pytest.raises(ValueError):
+        model.tranche_loss(notionals, probabilities, recoveries, correlation=1.0)
+    with pytest.raises(ValueError):
+        model.tranche_loss(notionals, probabilities, recoveries, attachment=0.5, detachment=0.2)
+    with pytest.raises(ValueError):
+        model.tranche_loss(notionals, probabilities, recoveries, method="fft")
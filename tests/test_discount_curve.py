@@ -0,0 +1,103 @@
+from datetime import date
+from math import exp
+
+import numpy as np
+import pytest
+
+from derivatives import models
+
+TIMES = [0.5, 1.0, 2.0, 5.0, 10.0]
+RATES = [0.030, 0.034, 0.037, 0.041, 0.040]
+
+
+@pytest.mark.parametrize("interpolation", ["log-linear", "monotone-convex"])
+def test_pillars_are_repriced(interpolation):
+    curve = models.DiscountCurve(TIMES, RATES, interpolation=interpolation)
+    expected = np.exp(-np.array(RATES) * np.array(TIMES))
+    assert curve.df(TIMES) == pytest.approx(expected, rel=1e-12)
+    assert curve.df(0.0) == 1.0
+    assert curve.zero_rate(TIMES) == pytest.approx(RATES)
+
+
+def test_log_linear_forwards_are_piecewise_constant():
+    curve = models.DiscountCurve(TIMES, RATES)
+    forwards = curve.forward_rate([2.5, 3.0, 4.0], [3.0, 4.0, 4.5])
+    assert forwards == pytest.approx(np.full(3, forwards[0]))
+
+
+def test_monotone_convex_forwards_are_continuous():
+    curve = models.DiscountCurve(TIMES, RATES, interpolation="monotone-convex")
+    t = np.linspace(1e-3, 10.0, 20_001)
+    forwards = curve.forward_rate(t[:-1], t[1:])
+    assert np.max(np.abs(np.diff(forwards))) < 1e-3
+    assert forwards.min() > 0
+
+
+def test_flat_extrapolation_beyond_last_pillar():
+    curve = models.DiscountCurve(TIMES, RATES)
+    last_forward = curve.forward_rate(5.0, 10.0)
+    assert curve.df(15.0) == pytest.approx(curve.df(10.0) * exp(-5.0 * last_forward))
+
+
+def test_date_pillars():
+    valuation = date(2024, 1, 1)
+    curve = models.DiscountCurve(
+        [date(2025, 1, 1), date(2026, 1, 1)], [0.03, 0.04], valuation_date=valuation
+    )
+    assert curve.times[0] == pytest.approx(366 / 365)
+    with pytest.raises(ValueError):
+        models.DiscountCurve([date(2025, 1, 1)], [0.03])
+
+
+def test_invalid_inputs():
+    with pytest.raises(ValueError):
+        models.DiscountCurve([1.0, 0.5], [0.01, 0.02])
+    with pytest.raises(ValueError):
+        models.DiscountCurve([1.0], [0.01], interpolation="cubic")
+    with pytest.raises(ValueError):
+        models.DiscountCurve([1.0], [0.01]).df(-1.0)
+
+
+def test_flat_curve_matches_flat_rate_in_models():
+    curve = models.DiscountCurve([1.0, 30.0], [0.05, 0.05])
+    cases = [
+        (models.ZeroCoupon(), dict(face_value=100, maturity=7.0), "discount_rate"),
+        (
+            models.CorporateBondModel(),
+            dict(face_value=100, coupon_rate=0.04, maturity=5, frequency=2),
+            "yield_rate",
+        ),
+        (
+            models.TheoreticalDividendFutures(),
+            dict(dividends=[(0.5, 1.0), (1.5, 1.2)], time_to_maturity=2.0),
+            "risk_free_rate",
+        ),
+        (
+            models.TotalReturnSwap(),
+            dict(spot_price=100, expected_terminal_price=108, dividend_yield=0.02, time_to_maturity=2.0),
+            "funding_rate",
+        ),
+        (
+            models.FullyFundedTRS(),
+            dict(spot_price=100, expected_terminal_price=108, dividend_yield=0.02, time_to_maturity=2.0),
+            "funding_rate",
+        ),
+        (
+            models.StaticHazardRateModel(),
+            dict(notional=1e6, hazard_rate=0.02, maturity=5.0),
+            "discount_rate",
+        ),
+    ]
+    for model, params, rate_name in cases:
+        flat = model.price(**params, **{rate_name: 0.05})
+        assert model.price(**params, **{rate_name: curve}) == pytest.approx(flat), type(model)
+
+
+def test_curve_in_price_batch():
+    curve = models.DiscountCurve(TIMES, RATES, interpolation="monotone-convex")
+    maturities = np.linspace(0.1, 12.0, 50)
+    values = models.ZeroCoupon().price_batch(face_value=100.0, discount_rate=curve, maturity=maturities)
+    assert values == pytest.approx(100.0 * curve.df(maturities))
+    assert models.DiscountCurve(TIMES, RATES).price_batch(time=maturities) == pytest.approx(
+        models.DiscountCurve(TIMES, RATES).df(maturities)
+    )
@@ -0,0 +1,53 @@
+import numpy as np
+import pytest
+
+from derivatives import models
+
+STRIKES = np.repeat([90.0, 100.0, 110.0], 4)
+BARRIERS = np.tile([80.0, 85.0, 120.0, 130.0], 3)
+TYPES = np.where(BARRIERS < 100, "down-and-out", "up-and-out")
+CALLS = np.arange(12) % 2 == 0
+
+
+def test_shared_paths_match_individual_prices():
+    model = models.DiscretisedBarrier()
+    shared = model.price_shared_paths(
+        100, STRIKES, BARRIERS, 0.05, 0.2, 1.0, 12, CALLS, TYPES, n_paths=20_000, chunk_size=5_000, seed=3
+    )
+    single = [
+        model.price(100, k, h, 0.05, 0.2, 1.0, 12, c, b, n_paths=20_000, chunk_size=5_000, seed=3)
+        for k, h, c, b in zip(STRIKES, BARRIERS, CALLS, TYPES)
+    ]
+    assert np.allclose(shared, single, rtol=1e-12)
+
+
+def test_shared_paths_reproduce_price_with_default_chunks():
+    # More trades than monitoring dates and more paths than one default chunk.
+    model = models.DiscretisedBarrier()
+    args = (0.05, 0.2, 1.0, 4)
+    shared = model.price_shared_paths(100, STRIKES, BARRIERS, *args, CALLS, TYPES, n_paths=600_000, seed=5)
+    single = model.price(100, STRIKES[0], BARRIERS[0], *args, CALLS[0], TYPES[0], n_paths=600_000, seed=5)
+    assert shared[0] == pytest.approx(single, rel=1e-12)
+
+
+def test_price_batch_groups_trades_by_underlying():
+    model = models.DiscretisedBarrier()
+    spots = np.where(np.arange(12) < 6, 100.0, 105.0)
+    batch = model.price_batch(
+        spot=spots, strike=STRIKES, barrier=BARRIERS, rate=0.05, vol=0.2, maturity=1.0,
+        monitoring_times=12, is_call=CALLS, barrier_type=TYPES, n_paths=5_000, seed=9,
+    )
+    for spot in (100.0, 105.0):
+        mask = spots == spot
+        expected = model.price_shared_paths(
+            spot, STRIKES[mask], BARRIERS[mask], 0.05, 0.2, 1.0, 12, CALLS[mask], TYPES[mask],
+            n_paths=5_000, seed=9,
+        )
+        assert np.allclose(batch[mask], expected)
+
+
+def test_unknown_barrier_type_rejected():
+    with pytest.raises(ValueError):
+        models.DiscretisedBarrier().price_shared_paths(
+            100, 100, 90, 0.05, 0.2, 1.0, 12, barrier_types="down-and-in", n_paths=100
+        )
@@ -0,0 +1,54 @@
+from math import exp, log, sqrt
+
+import pytest
+from scipy.stats import norm
+
+from derivatives import models
+
+
+def black_scholes(spot, strike, rate, vol, maturity, is_call=True):
+    d1 = (log(spot / strike) + (rate + 0.5 * vol**2) * maturity) / (vol * sqrt(maturity))
+    d2 = d1 - vol * sqrt(maturity)
+    if is_call:
+        return spot * norm.cdf(d1) - strike * exp(-rate * maturity) * norm.cdf(d2)
+    return strike * exp(-rate * maturity) * norm.cdf(-d2) - spot * norm.cdf(-d1)
+
+
+@pytest.mark.parametrize("scheme", ["implicit", "crank-nicolson"])
+@pytest.mark.parametrize("is_call", [True, False])
+def test_implicit_schemes_match_black_scholes(scheme, is_call):
+    value = models.FiniteDifference().price(
+        100, 100, 0.05, 0.2, 1.0, is_call=is_call, s_max=400, n_time=400, n_space=800, scheme=scheme
+    )
+    assert value == pytest.approx(black_scholes(100, 100, 0.05, 0.2, 1.0, is_call), abs=0.02)
+
+
+def test_crank_nicolson_stable_where_explicit_is_not():
+    model = models.FiniteDifference()
+    stable = model.price(100, 100, 0.05, 0.2, 1.0, n_time=50, n_space=1000)
+    assert stable == pytest.approx(black_scholes(100, 100, 0.05, 0.2, 1.0), abs=0.02)
+
+
+def test_american_put_early_exercise_premium():
+    model = models.FiniteDifference()
+    args = dict(spot=100, strike=100, rate=0.05, vol=0.2, maturity=1.0, is_call=False, s_max=400)
+    american = model.price(american=True, n_time=800, n_space=800, **args)
+    assert american == pytest.approx(6.090, abs=0.01)
+    # Without dividends early exercise of a call is never optimal.
+    call = model.price(100, 100, 0.05, 0.2, 1.0, s_max=400, n_time=800, n_space=800)
+    american_call = model.price(100, 100, 0.05, 0.2, 1.0, s_max=400, n_time=800, n_space=800, american=True)
+    assert american_call == pytest.approx(call, abs=1e-3)
+
+
+def test_barrier_boundaries():
+    model = models.FiniteDifference()
+    down_out = model.price(100, 100, 0.05, 0.2, 1.0, s_max=400, barrier=90, n_time=400, n_space=800)
+    # Reiner--Rubinstein down-and-out call with barrier below the strike.
+    assert down_out == pytest.approx(8.665, abs=0.01)
+    assert model.price(85, 100, 0.05, 0.2, 1.0, barrier=90) == 0.0
+    assert model.price(100, 100, 0.05, 0.2, 1.0, barrier=90, american=True) > 0.0
+
+
+def test_unknown_scheme_rejected():
+    with pytest.raises(ValueError):
+        models.FiniteDifference().price(100, 100, 0.05, 0.2, 1.0, scheme="adi")
@@ -0,0 +1,66 @@
+import numpy as np
+import pytest
+
+from derivatives import models
+from derivatives.models.base import DerivativeModel
+
+GREEKS = ("price", "delta", "gamma", "vega", "rho", "theta")
+
+
+@pytest.mark.parametrize(
+    "model, args",
+    [
+        (models.QEDIVariableStrikeWarrant(), (100, 1.05, 0.05, 0.25, 1.5, True)),
+        (models.QEDIVariableStrikeWarrant(), (100, 0.95, 0.05, 0.25, 1.5, False)),
+        (models.TheoreticalSimpleDividendOption(), (3.0, 2.8, 0.05, 0.3, 2.0, True)),
+        (models.TheoreticalSimpleDividendOption(), (3.0, 2.8, 0.05, 0.3, 2.0, False)),
+    ],
+)
+def test_analytic_greeks_match_finite_differences(model, args):
+    analytic = model.greeks(*args)
+    bumped = DerivativeModel.greeks(model, *args, spot_bump=1e-3, vol_bump=1e-4, time_bump=1e-5)
+    for greek in GREEKS:
+        assert analytic[greek] == pytest.approx(bumped[greek], rel=1e-4, abs=1e-6)
+
+
+@pytest.mark.parametrize("is_call", [True, False])
+@pytest.mark.parametrize(
+    "model, options",
+    [
+        (models.AsianArithmeticFixMM(), {}),
+        (models.CommodityAsianOption(), {"convenience_yield": 0.02, "method": "monte-carlo"}),
+    ],
+)
+def test_asian_single_pass_greeks_match_bumped(model, options, is_call):
+    args = (100, 100, 0.05, 0.2, 1.0, 12)
+    kwargs = dict(is_call=is_call, n_paths=100_000, seed=2, **options)
+    pathwise = model.greeks(*args, **kwargs)
+    bumped = DerivativeModel.greeks(model, *args, **kwargs)
+    assert pathwise["price"] == pytest.approx(bumped["price"], rel=1e-12)
+    for greek, tol in (("delta", 0.01), ("gamma", 0.005), ("vega", 0.5), ("rho", 0.5), ("theta", 0.1)):
+        assert pathwise[greek] == pytest.approx(bumped[greek], abs=tol)
+
+
+def test_asian_analytic_greeks_match_price():
+    model = models.CommodityAsianOption()
+    flat = dict(spot=100, strike=100, rate=0.05, vol=0.2, maturity=1.0, num_obs=12, convenience_yield=0.02)
+    greeks = model.greeks(**flat)
+    assert greeks["price"] == model.price(**flat)
+    assert set(greeks) == {"price", *GREEKS}
+    assert 0.0 < greeks["delta"] < 1.0 and greeks["vega"] > 0.0
+
+    curve = models.PriceCurve([0.0, 1.0], [100.0, 103.0])
+    trade = dict(spot=None, strike=100, rate=0.05, vol=0.2, forward_curve=curve, fixing_times=[0.5, 1.0])
+    greeks = model.greeks(**trade)
+    assert greeks["price"] == model.price(**trade)
+    assert set(greeks) == {"price", "vega", "rho"}
+
+
+def test_bumped_greeks_reuse_random_numbers():
+    model = models.DiscretisedBarrier()
+    args = dict(spot=100, strike=100, barrier=90, rate=0.05, vol=0.2, maturity=1.0, monitoring_times=12, n_paths=2_000)
+    first = model.greeks(seed=4, **args)
+    assert first == model.greeks(seed=4, **args)
+    assert 0.0 < first["delta"] < 1.0
+    unseeded = model.greeks(**args)
+    assert 0.0 < unseeded["delta"] < 1.0
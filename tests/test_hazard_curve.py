@@ -0,0 +1,90 @@
+from math import exp
+
+import numpy as np
+import pytest
+
+from derivatives import models
+
+TIMES = [1.0, 3.0, 5.0]
+RATES = [0.01, 0.02, 0.03]
+
+
+def test_survival_integrates_piecewise_hazard():
+    curve = models.HazardCurve(TIMES, RATES)
+    assert curve.survival(0.0) == 1.0
+    assert curve.survival(2.0) == pytest.approx(exp(-(0.01 + 0.02)))
+    # Flat extrapolation of the last intensity.
+    assert curve.survival(7.0) == pytest.approx(exp(-(0.01 + 0.04 + 0.06 + 0.06)))
+    assert curve.hazard_rate([0.5, 1.0, 1.5, 9.0]) == pytest.approx([0.01, 0.01, 0.02, 0.03])
+    assert curve.default_probability([1.0, 3.0]) == pytest.approx(
+        [1 - exp(-0.01), 1 - exp(-0.05)]
+    )
+
+
+def test_multi_name_curve_queries_all_names_at_once():
+    rates = np.array([RATES, [0.05, 0.05, 0.05]])
+    curve = models.HazardCurve(TIMES, rates)
+    survival = curve.survival([1.0, 2.0, 4.0])
+    assert survival.shape == (2, 3)
+    assert survival[0] == pytest.approx(models.HazardCurve(TIMES, RATES).survival([1.0, 2.0, 4.0]))
+    assert survival[1] == pytest.approx(np.exp(-0.05 * np.array([1.0, 2.0, 4.0])))
+
+
+def test_invalid_curves():
+    with pytest.raises(ValueError):
+        models.HazardCurve([1.0, 0.5], [0.01, 0.02])
+    with pytest.raises(ValueError):
+        models.HazardCurve([1.0, 2.0], [0.01])
+    with pytest.raises(ValueError):
+        models.HazardCurve([1.0], [-0.01])
+    with pytest.raises(ValueError):
+        models.HazardCurve([1.0], [0.01]).survival(-1.0)
+
+
+def test_flat_curve_spread_is_close_to_credit_triangle():
+    curve = models.HazardCurve([5.0], [0.02])
+    assert curve.cds_spread(5.0, recovery_rate=0.4) == pytest.approx(0.02 * 0.6, rel=1e-4)
+
+
+def test_bootstrap_reprices_cds_spreads():
+    tenors = [1.0, 3.0, 5.0, 7.0, 10.0]
+    spreads = [0.006, 0.008, 0.011, 0.012, 0.0125]
+    discount = models.DiscountCurve([1.0, 10.0], [0.03, 0.04])
+    curve = models.HazardCurve.bootstrap(tenors, spreads, recovery_rate=0.4, discount_rate=discount)
+    repriced = [curve.cds_spread(t, recovery_rate=0.4, discount_rate=discount) for t in tenors]
+    assert repriced == pytest.approx(spreads, abs=1e-12)
+    assert np.all(curve.hazard_rates > 0)
+
+
+def test_static_hazard_rate_model_accepts_curve():
+    model = models.StaticHazardRateModel()
+    flat = model.price(1e6, 0.02, 5.0, 0.05)
+    assert model.price(1e6, models.HazardCurve([10.0], [0.02]), 5.0, 0.05) == pytest.approx(flat)
+    stepwise = model.price(1e6, models.HazardCurve(TIMES, RATES), 4.0)
+    assert stepwise == pytest.approx(1e6 * (1 - exp(-(0.01 + 0.04 + 0.03))))
+
+
+def test_credit_basket_with_hazard_curves():
+    model = models.CreditBasketLinear()
+    rates = np.array([RATES, [0.05, 0.05, 0.05]])
+    curve = models.HazardCurve(TIMES, rates)
+    notionals = [1e6, 2e6]
+    recoveries = [0.4, 0.25]
+    probabilities = curve.default_probability(5.0)
+    expected = model.price(notionals, probabilities, recoveries)
+    value = model.price(notionals, recovery_rates=recoveries, hazard_curve=curve, maturity=5.0)
+    assert value == pytest.approx(expected)
+
+    horizons = [1.0, 2.5, 5.0]
+    losses = model.expected_loss(notionals, curve, horizons, recoveries)
+    assert losses[-1] == pytest.approx(expected)
+    assert np.all(np.diff(losses) > 0)
+
+    shared = models.HazardCurve(TIMES, RATES)
+    assert model.price(notionals, hazard_curve=shared, maturity=3.0) == pytest.approx(
+        3e6 * shared.default_probability(3.0)
+    )
+    with pytest.raises(ValueError):
+        model.price(notionals, [0.1, 0.1], hazard_curve=shared, maturity=3.0)
+    with pytest.raises(ValueError):
+        model.price(notionals, hazard_curve=shared)
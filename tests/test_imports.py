@@ -0,0 +1,39 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import derivatives
+from benchmarks.imports import time_import
+from derivatives import models
+
+
+def test_registry_resolves_every_model():
+    for name, module in models.MODEL_MODULES.items():
+        model_cls = getattr(models, name)
+        assert model_cls.__name__ == name
+        assert model_cls.__module__ == "derivatives.models" + module
+        assert issubclass(model_cls, models.DerivativeModel)
+        assert getattr(derivatives, name) is model_cls
+    assert set(models.MODEL_MODULES) <= set(dir(models))
+    assert set(models.MODEL_MODULES) <= set(dir(derivatives))
+
+
+def test_unknown_names_raise_attribute_error():
+    for module in (models, derivatives):
+        assert getattr(module, "NoSuchModel", None) is None
+
+
+def test_light_models_do_not_import_numpy():
+    script = (
+        "import sys\n"
+        "from derivatives.models import SimpleTradeableDeposit, FundInstrument, UnderlyingSpot\n"
+        "assert FundInstrument().price(2.0, 5.0) == 10.0\n"
+        "assert 'numpy' not in sys.modules and 'scipy' not in sys.modules\n"
+        "from derivatives import *\n"
+        "assert ZeroCoupon and FiniteDifference and 'scipy' in sys.modules\n"
+    )
+    subprocess.run([sys.executable, "-c", script], check=True, cwd=Path(__file__).parent.parent)
+
+
+def test_import_benchmark_times_fresh_interpreter():
+    assert 0.0 < time_import("import derivatives", repeat=1) < 60.0
@@ -0,0 +1,102 @@
+import csv
+import io
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+from derivatives import models
+from derivatives.models import instrumentation
+from derivatives.models.cache import PriceCache
+from derivatives.portfolio import value_portfolio
+
+ASIAN_ARGS = dict(spot=100, strike=100, rate=0.05, vol=0.2, maturity=1.0, num_obs=12, n_paths=5_000, seed=1)
+
+
+def test_disabled_by_default():
+    assert instrumentation.active() is None
+    models.ZeroCoupon().price(100.0, 0.05, 2.0)
+    instrumentation.record_simulation(10, 10)
+
+
+def test_counts_latencies_errors_and_paths():
+    with instrumentation.profile() as recorder:
+        assert instrumentation.active() is recorder
+        for _ in range(20):
+            models.ZeroCoupon().price(100.0, 0.05, 2.0)
+        models.AsianArithmeticFixMM().price(**ASIAN_ARGS)
+        with pytest.raises(ValueError):
+            models.FundInstrument().price(-1.0, 10)
+    assert instrumentation.active() is None
+
+    stats = {summary.model: summary for summary in recorder.stats()}
+    zero = stats["ZeroCoupon"]
+    assert (zero.calls, zero.errors, zero.paths) == (20, 0, 0)
+    assert zero.p50 <= zero.p95 <= zero.p99 <= zero.max_time
+    assert zero.total_time == pytest.approx(20 * zero.mean_time)
+    asian = stats["AsianArithmeticFixMM"]
+    assert (asian.calls, asian.paths, asian.path_steps) == (1, 5_000, 60_000)
+    assert stats["FundInstrument"].errors == 1
+    assert recorder.stats()[0].model == "AsianArithmeticFixMM"
+
+
+def test_cache_hits_are_timed():
+    model = models.ZeroCoupon()
+    model.cache = PriceCache()
+    with instrumentation.profile() as recorder:
+        model.price(100.0, 0.05, 2.0)
+        model.price(100.0, 0.05, 2.0)
+    assert recorder.stats()[0].calls == 2
+    assert model.cache.stats().hits == 1
+
+
+def test_slowest_calls_are_profiled_and_reported(tmp_path):
+    with instrumentation.profile(slowest=2) as recorder:
+        models.ZeroCoupon().price(100.0, 0.05, 2.0)
+        models.AsianArithmeticFixMM().price(**ASIAN_ARGS)
+        models.AsianArithmeticFixMM().price(**{**ASIAN_ARGS, "n_paths": 20_000})
+    slowest = recorder.slowest_calls()
+    assert [call.model for call in slowest] == ["AsianArithmeticFixMM"] * 2
+    assert slowest[0].duration >= slowest[1].duration
+    assert "function calls" in slowest[0].profile
+
+    report = json.loads(recorder.to_json(tmp_path / "report.json"))
+    assert report == json.loads((tmp_path / "report.json").read_text())
+    assert {entry["model"] for entry in report["models"]} == {"ZeroCoupon", "AsianArithmeticFixMM"}
+    assert len(report["slowest"]) == 2
+
+    rows = list(csv.DictReader(io.StringIO(recorder.to_csv())))
+    assert rows[0]["model"] == "AsianArithmeticFixMM" and rows[0]["paths"] == "25000"
+
+
+def test_environment_variable_writes_report_at_exit(tmp_path):
+    path = tmp_path / "profile.csv"
+    script = "from derivatives import models; models.ZeroCoupon().price(100.0, 0.05, 2.0)"
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = {**os.environ, instrumentation.ENV_VAR: str(path), "PYTHONPATH": root}
+    subprocess.run([sys.executable, "-c", script], env=env, check=True)
+    rows = list(csv.DictReader(path.open()))
+    assert [(row["model"], row["calls"]) for row in rows] == [("ZeroCoupon", "1")]
+
+
+def test_invalid_configuration():
+    with pytest.raises(ValueError):
+        instrumentation.Recorder(slowest=-1)
+    with pytest.raises(ValueError):
+        instrumentation.Recorder(profiler="perf")
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_portfolio_workers_report_to_parent(max_workers):
+    trades = [
+        ("ZeroCoupon", {"face_value": 100.0, "discount_rate": 0.05, "maturity": 1.0 + i}) for i in range(20)
+    ]
+    trades.append(("AsianArithmeticFixMM", ASIAN_ARGS))
+    with instrumentation.profile(slowest=1) as recorder:
+        assert all(result.ok for result in value_portfolio(trades, max_workers=max_workers))
+    stats = {summary.model: summary for summary in recorder.stats()}
+    assert stats["ZeroCoupon"].calls == 20
+    assert (stats["AsianArithmeticFixMM"].calls, stats["AsianArithmeticFixMM"].paths) == (1, 5_000)
+    assert recorder.slowest_calls()[0].model == "AsianArithmeticFixMM"
@@ -1,3 +1,5 @@
+import inspect
+
 import pytest
 
 from derivatives import models
@@ -6,8 +8,10 @@ MODEL_CLASSES = [
     models.DerivativeModel,
     models.ConstantDebtToEquity,
     models.CreditBasketLinear,
+    models.HazardCurve,
     models.ZeroCoupon,
     models.PriceCurve,
+    models.DiscountCurve,
     models.CommodityAsianOption,
     models.StaticHazardRateModel,
     models.SyntheticUnderlyingForward,
@@ -30,8 +34,16 @@ MODEL_CLASSES = [
     models.SimpleTradeableDeposit,
 ]
 
+NOT_IMPLEMENTED = [models.DerivativeModel, models.ConvexityAdjustedInterestRateFutures]
+
+CONSTRUCTOR_ARGS = {
+    models.PriceCurve: dict(times=[0.0, 1.0], prices=[1.0, 2.0]),
+    models.DiscountCurve: dict(times=[1.0, 2.0], rates=[0.01, 0.02]),
+    models.HazardCurve: dict(times=[1.0, 2.0], hazard_rates=[0.01, 0.02]),
+}
+
 
-@pytest.mark.parametrize("model_cls", MODEL_CLASSES)
+@pytest.mark.parametrize("model_cls", NOT_IMPLEMENTED)
 def test_price_not_implemented_default(model_cls):
     """Ensure price() raises NotImplementedError without arguments."""
     model = model_cls()
@@ -39,7 +51,7 @@ def test_price_not_implemented_default(model_cls):
         model.price()
 
 
-@pytest.mark.parametrize("model_cls", MODEL_CLASSES)
+@pytest.mark.parametrize("model_cls", NOT_IMPLEMENTED)
 def test_price_not_implemented_with_parameters(model_cls):
     """Ensure price() raises NotImplementedError with various arguments."""
     model = model_cls()
@@ -49,3 +61,17 @@ def test_price_not_implemented_with_parameters(model_cls):
     # Edge case with invalid values
     with pytest.raises(NotImplementedError):
         model.price(spot=-100, maturity=-1.0, extra=None)
+
+
+@pytest.mark.parametrize("model_cls", [m for m in MODEL_CLASSES if m not in NOT_IMPLEMENTED])
+def test_price_requires_arguments(model_cls):
+    """Implemented models reject calls without their required inputs."""
+    required = [
+        name
+        for name, parameter in inspect.signature(model_cls.price).parameters.items()
+        if name != "self" and parameter.default is inspect.Parameter.empty
+    ]
+    assert required
+    model = model_cls(**CONSTRUCTOR_ARGS.get(model_cls, {}))
+    with pytest.raises(TypeError):
+        model.price()
@@ -0,0 +1,184 @@
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pytest
+
+from derivatives import models
+from derivatives.models.monte_carlo import (
+    brownian_bridge,
+    chunk_sizes,
+    gbm_paths,
+    running_average,
+    simulate,
+    spawn_seeds,
+)
+from derivatives.models.options.asian_arithmetic_fix_mm import geometric_asian_price
+
+MC_MODELS = [
+    (models.AsianArithmeticFixMM, dict(spot=100, strike=100, rate=0.05, vol=0.2, maturity=1.0, num_obs=12)),
+    (
+        models.CommodityAsianOption,
+        dict(spot=100, strike=100, rate=0.05, vol=0.2, maturity=1.0, num_obs=12, method="monte-carlo"),
+    ),
+    (
+        models.DiscretisedBarrier,
+        dict(spot=100, strike=100, barrier=90, rate=0.05, vol=0.2, maturity=1.0, monitoring_times=12),
+    ),
+    (
+        models.BarrierContinuousAnalytic,
+        dict(spot=100, strike=100, barrier=90, rate=0.05, vol=0.2, maturity=1.0, method="monte-carlo"),
+    ),
+]
+
+#: Asian models with the extra arguments selecting simulation.
+ASIAN_MODELS = [(models.AsianArithmeticFixMM, {}), (models.CommodityAsianOption, {"method": "monte-carlo"})]
+
+
+def test_chunk_sizes_cover_all_paths():
+    assert list(chunk_sizes(10, 4, chunk_size=3)) == [3, 3, 3, 1]
+    assert sum(chunk_sizes(1_000_000, 252)) == 1_000_000
+
+
+def test_running_average_matches_loop():
+    increments = np.random.default_rng(1).normal(0.0, 0.1, size=(5, 7))
+    paths = gbm_paths(100.0, increments)
+    expected = np.array([[paths[p, : j + 1].mean() for j in range(7)] for p in range(5)])
+    assert np.allclose(running_average(paths), expected)
+
+
+@pytest.mark.parametrize("model_cls, extra", ASIAN_MODELS)
+def test_asian_price_independent_of_chunking(model_cls, extra):
+    args = dict(spot=100.0, strike=100.0, rate=0.05, vol=0.2, maturity=1.0, num_obs=12, n_paths=5_000, **extra)
+    whole = model_cls().price(seed=np.random.default_rng(7), **args)
+    chunked = model_cls().price(chunk_size=333, seed=np.random.default_rng(7), **args)
+    assert whole == pytest.approx(chunked, rel=1e-12)
+
+
+@pytest.mark.parametrize("is_call, reference", [(True, 6.16), (False, 3.54)])
+def test_asian_price_matches_reference(is_call, reference):
+    value = models.AsianArithmeticFixMM().price(
+        100.0, 100.0, 0.05, 0.2, 1.0, 12, is_call=is_call, n_paths=200_000, seed=11
+    )
+    assert value == pytest.approx(reference, abs=0.06)
+
+
+@pytest.mark.parametrize("model_cls, args", MC_MODELS)
+def test_seeded_prices_are_reproducible(model_cls, args):
+    model = model_cls()
+    first = model.price(n_paths=2_000, chunk_size=500, seed=42, **args)
+    assert model.price(n_paths=2_000, chunk_size=500, seed=42, **args) == first
+    assert model.price(n_paths=2_000, chunk_size=500, seed=43, **args) != first
+    assert model.price(n_paths=2_000, seed=np.random.SeedSequence(42), **args) == model.price(
+        n_paths=2_000, seed=42, **args
+    )
+
+
+def _price_shard(seed):
+    return models.AsianArithmeticFixMM().price(100, 100, 0.05, 0.2, 1.0, 12, n_paths=1_000, seed=seed)
+
+
+def test_sharded_valuation_is_bit_identical_across_processes():
+    shards = spawn_seeds(2024, 4)
+    local = [_price_shard(seed) for seed in shards]
+    with ProcessPoolExecutor(max_workers=2) as pool:
+        remote = list(pool.map(_price_shard, spawn_seeds(2024, 4)))
+    assert remote == local
+    assert len(set(local)) == 4
+
+
+def test_brownian_bridge_produces_independent_increments():
+    normals = np.random.default_rng(0).standard_normal((100_000, 7))
+    increments = brownian_bridge(normals)
+    assert np.allclose(np.cov(increments.T), np.eye(7), atol=0.02)
+    # The first coordinate alone determines the terminal value.
+    assert np.allclose(increments.sum(axis=1), np.sqrt(7) * normals[:, 0])
+
+
+@pytest.mark.parametrize("model_cls, args", MC_MODELS)
+def test_qmc_reduces_standard_error(model_cls, args):
+    model = model_cls()
+    plain = model.price(n_paths=4_096, seed=3, return_result=True, **args)
+    quasi = model.price(n_paths=4_096, seed=3, qmc=True, return_result=True, **args)
+    assert quasi.n_paths == 4_096
+    assert quasi.std_error < plain.std_error / 3
+    assert quasi.price == pytest.approx(plain.price, abs=3 * plain.std_error)
+
+
+def test_qmc_rounds_replications_to_powers_of_two():
+    result = models.AsianArithmeticFixMM().price(
+        100, 100, 0.05, 0.2, 1.0, 12, n_paths=1_000, qmc=True, n_replications=4, seed=0, return_result=True
+    )
+    assert result.n_paths == 4 * 256
+    assert float(result) == result.price
+
+
+@pytest.mark.parametrize("is_call", [True, False])
+def test_geometric_asian_closed_form_matches_simulation(is_call):
+    phi = 1.0 if is_call else -1.0
+    dt = 1.0 / 12
+    result = simulate(
+        lambda inc: np.maximum(phi * (100 * np.exp(np.cumsum(inc, axis=1).mean(axis=1)) - 100), 0.0),
+        400_000, 12, (0.05 - 0.03 - 0.02) * dt, 0.2 * np.sqrt(dt), seed=2,
+    ).scaled(np.exp(-0.05))
+    exact = geometric_asian_price(100, 100, 0.05, 0.03, 0.2, 1.0, 12, is_call)
+    assert exact == pytest.approx(result.price, abs=3 * result.std_error)
+
+
+@pytest.mark.parametrize("model_cls, extra", ASIAN_MODELS)
+def test_control_variate_and_antithetic_reduce_variance(model_cls, extra):
+    model = model_cls()
+    args = dict(spot=100, strike=100, rate=0.05, vol=0.2, maturity=1.0, num_obs=12, n_paths=10_000, seed=1, **extra)
+    plain = model.price(return_result=True, **args)
+    antithetic = model.price(antithetic=True, return_result=True, **args)
+    controlled = model.price(control_variate=True, antithetic=True, return_result=True, **args)
+    assert plain.variance_reduction == pytest.approx(1.0)
+    assert antithetic.n_paths == 10_000 and antithetic.variance_reduction > 1.5
+    assert controlled.variance_reduction > 100
+    assert controlled.std_error < plain.std_error / 10
+    assert controlled.price == pytest.approx(plain.price, abs=3 * plain.std_error)
+
+
+def test_online_moments_are_stable_for_large_means():
+    seen = []
+
+    def payoff(increments):
+        seen.append(1e9 + increments[:, 0])
+        return seen[-1]
+
+    result = simulate(payoff, 10_000, 1, 0.0, 1.0, chunk_size=999, seed=1)
+    samples = np.concatenate(seen)
+    assert result.price == pytest.approx(samples.mean(), rel=1e-15)
+    assert result.std_error == pytest.approx(samples.std(ddof=1) / 100, rel=1e-6)
+
+
+@pytest.mark.parametrize("model_cls, args", MC_MODELS)
+def test_early_stopping_meets_tolerance_before_cap(model_cls, args):
+    result = model_cls().price(n_paths=1_000_000, rel_tol=0.01, seed=4, return_result=True, **args)
+    assert result.converged
+    assert result.n_paths < 1_000_000
+    assert result.std_error <= 0.01 * result.price
+    assert result.wall_time > 0
+
+
+def test_early_stopping_respects_path_cap():
+    model = models.AsianArithmeticFixMM()
+    args = dict(spot=100, strike=100, rate=0.05, vol=0.2, maturity=1.0, num_obs=12, seed=4)
+    capped = model.price(n_paths=20_000, abs_tol=1e-6, return_result=True, **args)
+    assert capped.converged is False and capped.n_paths == 20_000
+    assert capped.price == pytest.approx(model.price(n_paths=20_000, chunk_size=8_192, **args), rel=1e-12)
+    assert model.price(n_paths=20_000, return_result=True, **args).converged is None
+
+    # The absolute tolerance applies to the discounted price.
+    result = model.price(n_paths=1_000_000, abs_tol=0.05, return_result=True, **args)
+    assert result.converged and result.std_error <= 0.05
+    with pytest.raises(ValueError):
+        model.price(qmc=True, abs_tol=0.05, **args)
+
+
+def test_confidence_interval():
+    result = models.AsianArithmeticFixMM().price(
+        100, 100, 0.05, 0.2, 1.0, 12, n_paths=10_000, seed=1, return_result=True
+    )
+    low, high = result.confidence_interval(0.95)
+    assert (high - low) / 2 == pytest.approx(1.959964 * result.std_error)
+    assert low < result.price < high
@@ -0,0 +1,65 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from derivatives import models
+from derivatives.portfolio import estimate_cost, plan_chunks, value_portfolio
+
+TRADES = [
+    {"model": "ZeroCoupon", "params": {"face_value": 100, "discount_rate": 0.05, "maturity": 2.0}},
+    ("SimpleTradeableDeposit", {"principal": 100, "rate": 0.1, "maturity": 1.0}),
+    {
+        "model": "AsianArithmeticFixMM",
+        "params": dict(spot=100, strike=100, rate=0.05, vol=0.2, maturity=1.0, num_obs=12, n_paths=2_000, seed=1),
+    },
+    {"model": "FundInstrument", "params": {"nav": -1.0, "units": 10}},
+    {"model": "NoSuchModel", "params": {}},
+    {"model": "PriceCurve", "init": {"times": [0.0, 1.0], "prices": [10.0, 20.0]}, "params": {"time": 0.25}},
+    {"model": "FiniteDifference", "params": dict(spot=100, strike=100, rate=0.05, vol=0.2, maturity=1.0)},
+]
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_results_in_input_order_with_errors_captured(max_workers):
+    results = value_portfolio(TRADES, max_workers=max_workers)
+    assert [r.index for r in results] == list(range(len(TRADES)))
+    assert results[0].value == pytest.approx(models.ZeroCoupon().price(100, 0.05, 2.0))
+    assert results[1].value == pytest.approx(110.0)
+    assert results[2].value == models.AsianArithmeticFixMM().price(**TRADES[2]["params"])
+    assert not results[3].ok and results[3].error.startswith("ValueError")
+    assert not results[4].ok and "Unknown model" in results[4].error
+    assert results[5].value == pytest.approx(12.5)
+    assert results[6].ok
+
+
+def test_cost_uses_price_defaults():
+    assert estimate_cost(models.ZeroCoupon, {}) == 1.0
+    assert estimate_cost(models.AsianArithmeticFixMM, {"num_obs": 252}) == 10_000 * 252
+    assert estimate_cost(models.FiniteDifference, {"n_time": 10}) == 10 * 200
+    assert estimate_cost(models.BarrierContinuousAnalytic, {}) == 1.0
+    assert estimate_cost(models.CommodityAsianOption, {"num_obs": 12}) == 1.0
+    assert estimate_cost(models.CommodityAsianOption, {"num_obs": 12, "method": "monte-carlo"}) == 10_000 * 12
+
+
+def test_expensive_trades_get_their_own_chunks():
+    cheap = [("ZeroCoupon", {"face_value": 1, "discount_rate": 0.0, "maturity": 1.0})] * 100
+    expensive = [("DiscretisedBarrier", {"n_paths": 100_000, "monitoring_times": 50})] * 4
+    chunks, rejected = plan_chunks(cheap + expensive, n_workers=2)
+    assert not rejected
+    assert [name for name, _ in chunks[:4]] == ["DiscretisedBarrier"] * 4
+    assert sum(len(chunk) for _, chunk in chunks) == 104
+    assert sum(name == "ZeroCoupon" for name, _ in chunks) == 1
+
+
+def test_interpreter_exits_after_pool_following_monte_carlo():
+    # The default backend may start threads in the parent before workers are created.
+    script = (
+        "from derivatives import models\n"
+        "from derivatives.portfolio import value_portfolio\n"
+        "models.AsianArithmeticFixMM().price(100, 100, 0.05, 0.2, 1.0, 12, n_paths=2_000, seed=1)\n"
+        "trades = [('ZeroCoupon', {'face_value': 100, 'discount_rate': 0.05, 'maturity': m}) for m in (1.0, 2.0)]\n"
+        "assert all(r.ok for r in value_portfolio(trades, max_workers=2))\n"
+    )
+    subprocess.run([sys.executable, "-c", script], check=True, timeout=120, cwd=Path(__file__).parent.parent)
@@ -0,0 +1,122 @@
+import numpy as np
+import pytest
+
+from derivatives import models
+
+rng = np.random.default_rng(3)
+N = 50
+
+BATCHES = [
+    (
+        models.ZeroCoupon,
+        dict(
+            face_value=rng.uniform(50, 150, N),
+            discount_rate=rng.uniform(0.0, 0.1, N),
+            maturity=rng.uniform(0.1, 30, N),
+        ),
+    ),
+    (
+        models.SyntheticUnderlyingForward,
+        dict(
+            spot_price=rng.uniform(50, 150, N),
+            risk_free_rate=rng.uniform(0.0, 0.1, N),
+            dividend_yield=0.02,
+            time_to_maturity=rng.uniform(0.1, 5, N),
+            notional=rng.uniform(1, 10, N),
+        ),
+    ),
+    (
+        models.TotalReturnSwap,
+        dict(
+            spot_price=rng.uniform(50, 150, N),
+            expected_terminal_price=rng.uniform(50, 150, N),
+            funding_rate=rng.uniform(0.0, 0.1, N),
+            dividend_yield=rng.uniform(0.0, 0.05, N),
+            time_to_maturity=rng.uniform(0.1, 5, N),
+        ),
+    ),
+    (
+        models.QEDIVariableStrikeWarrant,
+        dict(
+            spot=rng.uniform(50, 150, N),
+            strike_ratio=rng.uniform(0.8, 1.2, N),
+            rate=rng.uniform(0.0, 0.1, N),
+            vol=rng.uniform(0.1, 0.5, N),
+            maturity=rng.uniform(0.1, 5, N),
+            is_call=rng.integers(0, 2, N).astype(bool),
+        ),
+    ),
+    (
+        models.TheoreticalSimpleDividendOption,
+        dict(
+            expected_dividend=rng.uniform(1, 5, N),
+            strike=rng.uniform(1, 5, N),
+            rate=rng.uniform(0.0, 0.1, N),
+            vol=np.where(np.arange(N) % 7 == 0, 0.0, rng.uniform(0.1, 0.5, N)),
+            maturity=rng.uniform(0.1, 5, N),
+            is_call=rng.integers(0, 2, N).astype(bool),
+        ),
+    ),
+    (
+        models.BarrierContinuousAnalytic,
+        dict(
+            spot=rng.uniform(70, 130, N),
+            strike=rng.uniform(80, 120, N),
+            barrier=rng.uniform(80, 120, N),
+            rate=rng.uniform(0.0, 0.1, N),
+            vol=rng.uniform(0.1, 0.5, N),
+            maturity=rng.uniform(0.1, 5, N),
+            is_call=rng.integers(0, 2, N).astype(bool),
+            barrier_type=np.where(rng.integers(0, 2, N) == 1, "down-and-out", "up-and-out"),
+        ),
+    ),
+    (
+        models.StaticHazardRateModel,
+        dict(
+            notional=rng.uniform(1e5, 1e6, N),
+            hazard_rate=rng.uniform(0.0, 0.1, N),
+            maturity=rng.uniform(0.1, 10, N),
+            discount_rate=rng.uniform(0.0, 0.1, N),
+        ),
+    ),
+]
+
+
+class DerivativeLoop(models.DerivativeModel):
+    """Force the generic per-trade fallback for a given model."""
+
+    def __init__(self, model):
+        self.model = model
+
+    def price(self, **kwargs):
+        return self.model.price(**kwargs)
+
+
+@pytest.mark.parametrize("model_cls, columns", BATCHES)
+def test_vectorized_batch_matches_scalar_price(model_cls, columns):
+    model = model_cls()
+    batch = model.price_batch(columns)
+    looped = DerivativeLoop(model)._price_batch(N, **{k: np.asarray(v) for k, v in columns.items()})
+    assert batch.shape == (N,)
+    assert np.allclose(batch, looped)
+
+
+def test_fallback_loop_and_structured_input():
+    data = np.zeros(3, dtype=[("principal", float), ("rate", float), ("maturity", float)])
+    data["principal"] = [100, 200, 300]
+    data["rate"] = 0.1
+    data["maturity"] = [1, 2, 3]
+    prices = models.SimpleTradeableDeposit().price_batch(data)
+    assert np.allclose(prices, [110, 240, 390])
+
+
+def test_fallback_handles_per_trade_sequences():
+    prices = models.UDMCCliquetModel().price_batch(
+        returns=[[0.1, -0.2], [0.3, 0.05, 0.0]], cap=0.1, floor=-0.1
+    )
+    assert np.allclose(prices, [0.0, 0.15])
+
+
+def test_mismatched_columns_raise():
+    with pytest.raises(ValueError):
+        models.ZeroCoupon().price_batch(face_value=[1, 2], discount_rate=[0.1, 0.2, 0.3], maturity=1.0)
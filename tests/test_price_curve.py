@@ -0,0 +1,58 @@
+import numpy as np
+import pytest
+from scipy.interpolate import PchipInterpolator
+
+from derivatives import models
+
+TIMES = [0.0, 0.5, 1.0, 2.0, 3.0, 5.0]
+PRICES = [80.0, 82.0, 85.0, 84.0, 84.0, 90.0]
+QUERIES = np.linspace(-1.0, 6.0, 701)
+
+
+def test_linear_matches_np_interp_and_extrapolates_flat():
+    curve = models.PriceCurve(TIMES, PRICES)
+    assert curve.price(QUERIES) == pytest.approx(np.interp(QUERIES, TIMES, PRICES))
+    assert curve.price(0.25) == pytest.approx(81.0)
+    assert isinstance(curve.price(0.25), float)
+    assert curve.price_batch(time=[0.25, 10.0]) == pytest.approx([81.0, 90.0])
+
+
+def test_log_linear_interpolates_log_prices():
+    curve = models.PriceCurve(TIMES, PRICES, interpolation="log-linear")
+    expected = np.exp(np.interp(QUERIES, TIMES, np.log(PRICES)))
+    assert curve.price(QUERIES) == pytest.approx(expected)
+    with pytest.raises(ValueError):
+        models.PriceCurve([0.0, 1.0], [1.0, -1.0], interpolation="log-linear")
+
+
+def test_monotone_cubic_matches_pchip_without_overshoot():
+    curve = models.PriceCurve(TIMES, PRICES, interpolation="monotone-cubic")
+    inside = QUERIES[(QUERIES >= 0.0) & (QUERIES <= 5.0)]
+    assert curve.price(inside) == pytest.approx(PchipInterpolator(TIMES, PRICES)(inside))
+    # Flat between the two equal nodes and within the node range elsewhere.
+    assert curve.price(np.linspace(2.0, 3.0, 11)) == pytest.approx(84.0)
+    assert curve.price(QUERIES).min() >= 80.0 and curve.price(QUERIES).max() <= 90.0
+
+
+@pytest.mark.parametrize("interpolation", ["linear", "log-linear", "monotone-cubic"])
+def test_update_matches_rebuild(interpolation):
+    curve = models.PriceCurve(TIMES, PRICES, interpolation=interpolation)
+    curve.update([1, -1], [83.0, 91.0])
+    updated = list(PRICES)
+    updated[1], updated[-1] = 83.0, 91.0
+    rebuilt = models.PriceCurve(TIMES, updated, interpolation=interpolation)
+    assert curve.price(QUERIES) == pytest.approx(rebuilt.price(QUERIES), rel=1e-14)
+    assert curve.prices.tolist() == updated
+    with pytest.raises(IndexError):
+        curve.update(len(TIMES), 1.0)
+
+
+def test_invalid_curves():
+    with pytest.raises(ValueError):
+        models.PriceCurve([], [])
+    with pytest.raises(ValueError):
+        models.PriceCurve([0.0, 0.0], [1.0, 2.0])
+    with pytest.raises(ValueError):
+        models.PriceCurve([0.0, 1.0], [1.0])
+    with pytest.raises(ValueError):
+        models.PriceCurve([0.0, 1.0], [1.0, 2.0], interpolation="spline")
@@ -0,0 +1,84 @@
+import numpy as np
+import pytest
+
+from derivatives import models
+from derivatives.scenarios import ScenarioCube, factor_keywords, reprice_scenarios
+
+BARRIER = dict(spot=100.0, strike=100.0, barrier=90.0, rate=0.05, vol=0.2, maturity=1.0)
+ASIAN = dict(spot=100.0, strike=100.0, rate=0.05, vol=0.2, maturity=1.0, num_obs=12, n_paths=2_000)
+TRADES = [
+    {"model": "BarrierContinuousAnalytic", "params": BARRIER},
+    ("StaticHazardRateModel", {"notional": 1e6, "hazard_rate": 0.02, "maturity": 5.0, "discount_rate": 0.03}),
+    {"model": "AsianArithmeticFixMM", "params": ASIAN},
+    {"model": "ZeroCoupon", "params": {"face_value": 100.0, "discount_rate": 0.03, "maturity": 2.0}},
+    {"model": "NoSuchModel", "params": {}},
+]
+
+
+def make_cube(n_scenarios=50):
+    rng = np.random.default_rng(0)
+    shocks = rng.normal(0.0, [0.05, 0.02, 0.002, 0.001], (n_scenarios, 4))
+    shocks[0] = 0.0
+    return ScenarioCube(["spot", "vol", "rate", "hazard"], shocks)
+
+
+def test_pnl_matches_scalar_repricing(tmp_path):
+    cube = make_cube()
+    result = reprice_scenarios(TRADES, cube, path=tmp_path / "pnl.npy", seed=7)
+    assert result.pnl.shape == (len(TRADES), cube.n_scenarios)
+    assert np.load(tmp_path / "pnl.npy") == pytest.approx(np.asarray(result.pnl), nan_ok=True)
+    assert result.errors[:4] == [None] * 4 and "Unknown model" in result.errors[4]
+    assert np.isnan(result.pnl[4]).all() and np.isnan(result.base[4])
+
+    spot, vol, rate, hazard = cube.shocks[3]
+    barrier = models.BarrierContinuousAnalytic()
+    shocked = barrier.price(**{**BARRIER, "spot": 100 * (1 + spot), "vol": 0.2 + vol, "rate": 0.05 + rate})
+    assert result.pnl[0, 3] == pytest.approx(shocked - barrier.price(**BARRIER))
+    hazard_model = models.StaticHazardRateModel()
+    shocked = hazard_model.price(1e6, 0.02 + hazard, 5.0, 0.03 + rate)
+    assert result.pnl[1, 3] == pytest.approx(shocked - hazard_model.price(1e6, 0.02, 5.0, 0.03))
+    assert result.total() == pytest.approx(np.asarray(result.pnl[:4]).sum(axis=0))
+    assert result.value_at_risk(0.9) > 0.0
+
+
+def test_monte_carlo_trades_reuse_random_numbers():
+    cube = make_cube()
+    result = reprice_scenarios(TRADES[2:3], cube, seed=7)
+    # The unshocked scenario reprices with the base seed.
+    assert result.pnl[0, 0] == 0.0
+    again = reprice_scenarios(TRADES[2:3], cube, seed=7)
+    assert again.pnl == pytest.approx(result.pnl)
+
+    seeded = {"model": "AsianArithmeticFixMM", "params": {**ASIAN, "seed": 3}}
+    result = reprice_scenarios([seeded], cube)
+    assert result.base[0] == models.AsianArithmeticFixMM().price(**ASIAN, seed=3)
+
+
+def test_explicit_factor_mapping():
+    cube = ScenarioCube(["SPX", "EURUSD"], [[0.1, 0.0], [0.0, 0.1]], relative={"SPX", "EURUSD"})
+    trades = [
+        {"model": "UnderlyingSpot", "params": {"spot_price": 50.0}, "factors": {"SPX": "spot_price"}},
+        {"model": "UnderlyingSpot", "params": {"spot_price": 2.0}, "factors": {"EURUSD": "spot_price"}},
+        {"model": "UnderlyingSpot", "params": {"spot_price": 2.0}, "factors": {"GBPUSD": "spot_price"}},
+    ]
+    result = reprice_scenarios(trades, cube)
+    assert result.pnl[:2] == pytest.approx(np.array([[5.0, 0.0], [0.0, 0.2]]))
+    assert result.errors[2].startswith("KeyError")
+
+    assert factor_keywords(models.ZeroCoupon, {"discount_rate": 0.03}, ["spot", "rate"]) == {
+        "rate": "discount_rate"
+    }
+    assert factor_keywords(models.TheoreticalSimpleDividendOption, {"expected_dividend": 1.0}, ["spot"]) == {
+        "spot": "expected_dividend"
+    }
+
+
+def test_invalid_inputs():
+    with pytest.raises(ValueError):
+        ScenarioCube(["spot", "vol"], np.zeros((3, 3)))
+    with pytest.raises(ValueError):
+        ScenarioCube(["spot", "spot"], np.zeros((3, 2)))
+    curve = models.DiscountCurve([1.0, 5.0], [0.03, 0.04])
+    trade = {"model": "ZeroCoupon", "params": {"face_value": 100.0, "discount_rate": curve, "maturity": 2.0}}
+    result = reprice_scenarios([trade], make_cube(3))
+    assert result.errors[0].startswith("TypeError")
@@ -0,0 +1,76 @@
+from datetime import date
+
+import numpy as np
+import pytest
+
+from derivatives import models
+from derivatives.models import schedule
+
+
+@pytest.mark.parametrize("convention", ["act/365", "ACT/360", "30/360", "act/act"])
+def test_vectorized_matches_scalar(convention):
+    model = models.DerivativeModel()
+    starts = np.arange("2023-01-01", "2023-12-31", 7, dtype="datetime64[D]")
+    ends = starts + np.arange(len(starts)) * 11 + 400
+    vectorized = schedule.year_fractions(starts, ends, convention)
+    scalar = [model.year_fraction(s.item(), e.item(), convention) for s, e in zip(starts, ends)]
+    assert vectorized == pytest.approx(scalar)
+    assert model.year_fraction(starts, ends, convention) == pytest.approx(vectorized)
+
+
+def test_day_count_values():
+    model = models.DerivativeModel()
+    assert model.year_fraction(date(2024, 1, 1), date(2024, 7, 1)) == pytest.approx(182 / 365)
+    assert model.year_fraction(date(2024, 1, 1), date(2024, 7, 1), "act/360") == pytest.approx(182 / 360)
+    assert model.year_fraction(date(2024, 1, 31), date(2024, 3, 31), "30/360") == pytest.approx(60 / 360)
+    # ACT/ACT ISDA splits the period at the calendar year boundary.
+    expected = 184 / 365 + 1 + 31 / 365
+    assert model.year_fraction(date(2023, 7, 1), date(2025, 2, 1), "act/act") == pytest.approx(expected)
+    assert model.year_fraction(date(2024, 1, 1), date(2025, 1, 1), "act/act") == pytest.approx(1.0)
+
+
+def test_invalid_inputs():
+    model = models.DerivativeModel()
+    with pytest.raises(TypeError):
+        model.year_fraction("2024-01-01", date(2024, 2, 1))
+    with pytest.raises(ValueError):
+        model.year_fraction(date(2024, 2, 1), date(2024, 1, 1))
+    with pytest.raises(ValueError):
+        model.year_fraction(date(2024, 1, 1), date(2024, 2, 1), "bus/252")
+
+
+def test_add_months_clips_to_month_end():
+    rolled = schedule.add_months(date(2024, 1, 31), np.arange(4))
+    expected = np.array(["2024-01-31", "2024-02-29", "2024-03-31", "2024-04-30"], dtype="datetime64[D]")
+    assert np.array_equal(rolled, expected)
+
+
+def test_business_day_adjustment():
+    saturday = np.datetime64("2024-08-31")
+    assert schedule.adjust(saturday, "following") == np.datetime64("2024-09-02")
+    assert schedule.adjust(saturday, "modified following") == np.datetime64("2024-08-30")
+    assert schedule.adjust(saturday, "unadjusted") == saturday
+    holiday = np.datetime64("2024-09-02")
+    assert schedule.adjust(saturday, "following", holidays=[holiday]) == np.datetime64("2024-09-03")
+    holidays = np.array(["2024-09-02", "2024-09-03"], dtype="datetime64[D]")
+    assert schedule.adjust(saturday, "following", holidays=holidays) == np.datetime64("2024-09-04")
+    assert schedule.adjust(saturday, "following", holidays=holidays[:0]) == np.datetime64("2024-09-02")
+
+
+@pytest.mark.parametrize("stub", ["front", "back"])
+def test_schedule_periods(stub):
+    result = schedule.generate_schedule(
+        date(2024, 1, 15), date(2026, 8, 31), frequency=2, stub=stub, business_day="unadjusted"
+    )
+    assert result.accrual_start[0] == np.datetime64("2024-01-15")
+    assert result.payment_dates[-1] == np.datetime64("2026-08-31")
+    assert np.array_equal(result.accrual_start[1:], result.accrual_end[:-1])
+    assert result.year_fractions.sum() == pytest.approx((date(2026, 8, 31) - date(2024, 1, 15)).days / 365)
+    stub_period = result.year_fractions[0] if stub == "front" else result.year_fractions[-1]
+    assert stub_period < 0.5
+    assert len(result) == 6
+
+
+def test_schedule_adjusts_to_business_days():
+    result = schedule.generate_schedule(date(2024, 1, 15), date(2026, 8, 31), frequency=4)
+    assert np.all(np.is_busday(result.payment_dates))